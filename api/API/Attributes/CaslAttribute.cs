@@ -15,18 +15,27 @@ public class Access
     public string action { get; set; }
 }
 
-public class CaslAttribute:Attribute, IAuthorizationFilter
+/// <summary>
+/// Allows the users granted any of the "Role:Action" permissions. The permissions of a user are one cached bitset,
+/// see IUserXAccessService.GetPermissionsAsync, so a check costs one lookup per permission and no query.
+/// </summary>
+public class CaslAttribute:Attribute, IAsyncAuthorizationFilter
 {
     private readonly string[] _validAccessList;
-    private IJwtAuthManager? _jwtAuthManager;
-    private IUserXAccessService? _userXAccessService;
+    // Split once, entries that are not "Role:Action" are never granted
+    private readonly (string Role, string Action)[] _validAccessPairs;
 
     public CaslAttribute(params string[] accessList)
     {
         _validAccessList = accessList;
+        _validAccessPairs = accessList
+            .Select(access => access.Split(':'))
+            .Where(parts => parts.Length == 2 && parts[0].Length > 0 && parts[1].Length > 0)
+            .Select(parts => (parts[0], parts[1]))
+            .ToArray();
     }
     
-    public void OnAuthorization(AuthorizationFilterContext context)
+    public async Task OnAuthorizationAsync(AuthorizationFilterContext context)
     {
         if (_validAccessList.Length <= 0)
         {
@@ -39,12 +48,13 @@ public class CaslAttribute:Attribute, IAuthorizationFilter
 
         
 
-        _jwtAuthManager ??= (IJwtAuthManager?) context.HttpContext.RequestServices.GetService(typeof(IJwtAuthManager));
+        // Resolved per request, the attribute outlives the scope of the (scoped) services
+        var jwtAuthManager = (IJwtAuthManager?) context.HttpContext.RequestServices.GetService(typeof(IJwtAuthManager));
 
-        _userXAccessService ??= (IUserXAccessService?) context.HttpContext.RequestServices.GetService(typeof(IUserXAccessService));
+        var userXAccessService = (IUserXAccessService?) context.HttpContext.RequestServices.GetService(typeof(IUserXAccessService));
 
         // If the jwtAuthManager is not found, return unauthorized
-        if (_jwtAuthManager == null || _userXAccessService == null)
+        if (jwtAuthManager == null || userXAccessService == null)
         {
             goto bad;
         }
@@ -54,12 +64,14 @@ public class CaslAttribute:Attribute, IAuthorizationFilter
             goto bad;
         }
         
-        var principal = _jwtAuthManager.DecodeJwtToken(accessToken);
+        var principal = jwtAuthManager.DecodeJwtToken(accessToken);
         var currentUserId = principal.Item1.FindFirst(c => c.Type == ClaimTypes.NameIdentifier)?.Value;
         
         if (!string.IsNullOrEmpty(currentUserId))
         {
-            if (!_userXAccessService.UserHasAccess(currentUserId, _validAccessList))
+            var permissions = await userXAccessService.GetPermissionsAsync(currentUserId);
+
+            if (!permissions.ContainsAny(_validAccessPairs))
             {
                 goto bad;
             }
@@ -1,4 +1,5 @@
 
+using APPLICATION.Dto.Request;
 using APPLICATION.Dto.Response;
 using APPLICATION.Dto.User;
 using APPLICATION.IService;
@@ -44,6 +45,26 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
         return await GenericGetAll();
     }
 
+    /// <summary>
+    /// Stream all data.
+    /// </summary>
+    /// <returns>All users as they are read: a JSON array, or one JSON object per line when application/x-ndjson is accepted</returns>
+    /// <response code="200">When the users are successfully streamed</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("all/stream")]
+    [SwaggerOperation(OperationId = "streamAllUsers")]
+    [Produces("application/json", "application/x-ndjson")]
+    [ProducesResponseType<List<GetUserDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task GetAllStreamAction()
+    {
+        await GenericStreamAll();
+    }
+
     /// <summary>
     /// Get paginated data.
     /// </summary>
@@ -86,6 +107,52 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
         return await GenericGetByChunk(page, rows);
     }
 
+    /// <summary>
+    /// Get data after a continuation token, ordered by key.
+    /// </summary>
+    /// <param name="after">The continuation token of the previous page, omitted for the first page</param>
+    /// <param name="rows">The number of rows to retrieve</param>
+    /// <returns>A page of users and the continuation token of the next page</returns>
+    /// <response code="200">When the users are successfully retrieved</response>
+    /// <response code="400">When the continuation token is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("seek")]
+    [SwaggerOperation(OperationId = "seekUsers")]
+    [ProducesResponseType<SeekResponseDto<GetUserDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> SeekAction([FromQuery] string? after=null, [FromQuery] int rows=10)
+    {
+        return await GenericSeek(after, rows);
+    }
+
+    /// <summary>
+    /// Get the data matching filters.
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <param name="include">The include profile of the related data to load, one of the profiles make.py generates for the model</param>
+    /// <returns>The users matching the filters</returns>
+    /// <response code="200">When the users are successfully retrieved</response>
+    /// <response code="400">When the include profile is unknown</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("query")]
+    [SwaggerOperation(OperationId = "queryUsers")]
+    [ProducesResponseType<List<GetUserDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> QueryAction([FromQuery] string filters="", [FromQuery] string include="")
+    {
+        return await GenericQuery(filters, include);
+    }
+
     /// <summary>
     /// Get data by id.
     /// </summary>
@@ -95,12 +162,12 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
     /// <response code="401">When the user is not authenticated</response>
     /// <response code="403">When the user is not authorized</response>
     /// <response code="500">When an unexpected error occurs during retrieval</response>
-    [HttpGet("{id:long}")]
+    [HttpGet("{id}")]
     [SwaggerOperation(OperationId = "getUserById")]
     [ProducesResponseType<GetUserDto>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> GetAction(long id)
+    public async Task<ActionResult> GetAction(string id)
     {
         return await GenericGet(id);
     }
@@ -161,7 +228,7 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
     /// <response code="403">When the user is not authorized</response>
     /// <response code="404">When the user with specified ID is not found</response>
     /// <response code="500">When an unexpected error occurs during update</response>
-    [HttpPatch("patch/{id:long}")]
+    [HttpPatch("patch/{id}")]
     [SwaggerOperation(OperationId = "patchUser")]
     [ProducesResponseType<GetUserDto>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status400BadRequest)]
@@ -169,7 +236,7 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
     [ProducesResponseType(StatusCodes.Status403Forbidden)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> PatchAction(long id, UserDto item)
+    public async Task<ActionResult> PatchAction(string id, UserDto item)
     {
         return await GenericUpdate(id, item);
     }
@@ -199,6 +266,28 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
         return await GenericUpdate(id, item);
     }
 
+    /// <summary>
+    /// Updates multiple users with the same values in a single statement.
+    /// </summary>
+    /// <param name="batch">The IDs of the users and the values to write, only the given fields are written</param>
+    /// <returns>The number of updated users</returns>
+    /// <response code="200">When the users are successfully updated</response>
+    /// <response code="400">When the ids are empty or too many, no or unknown fields are given, or the provided data is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during update</response>
+    [HttpPut("update/batch")]
+    [SwaggerOperation(OperationId = "updateBatchUsers")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> UpdateBatchAction(BatchUpdateDto<string, UserDto> batch)
+    {
+        return await GenericUpdateBatch(batch.Ids, batch.Item, batch.Fields);
+    }
+
     /// <summary>
     /// Delete a user.
     /// </summary>
@@ -220,4 +309,48 @@ public class UserController : GenericController<User, IUserService, UserDto, Get
     {
         return await GenericDelete(id);
     }
+
+    /// <summary>
+    /// Deletes multiple users in a single statement.
+    /// </summary>
+    /// <param name="ids">The IDs of the users to delete</param>
+    /// <returns>The number of deleted users</returns>
+    /// <response code="200">When the users are successfully deleted</response>
+    /// <response code="400">When the ids are empty or too many</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpPost("delete/batch")]
+    [SwaggerOperation(OperationId = "deleteBatchUsers")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteBatchAction(List<string> ids)
+    {
+        return await GenericDeleteBatch(ids);
+    }
+
+    /// <summary>
+    /// Deletes the users matching filters in a single statement.
+    /// </summary>
+    /// <param name="filters">The filters of the users to delete, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <returns>The number of deleted users</returns>
+    /// <response code="200">When the users are successfully deleted</response>
+    /// <response code="400">When the filters are missing or invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpDelete("delete/where")]
+    [SwaggerOperation(OperationId = "deleteWhereUsers")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteWhereAction([FromQuery] string filters)
+    {
+        return await GenericDeleteWhere(filters);
+    }
 }
\ No newline at end of file
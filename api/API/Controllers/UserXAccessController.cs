@@ -2,6 +2,7 @@
 using Microsoft.AspNetCore.Mvc;
 using Swashbuckle.AspNetCore.Annotations;
 using APPLICATION.Dto.UserXAccess;
+using APPLICATION.Dto.Request;
 using APPLICATION.Dto.Response;
 using APPLICATION.IService;
 using DOMAIN.Model;
@@ -44,6 +45,26 @@ public class UserXAccessController : GenericController<UserXAccess, IUserXAccess
         return await GenericGetAll();
     }
 
+    /// <summary>
+    /// Stream all data.
+    /// </summary>
+    /// <returns>All user accesses as they are read: a JSON array, or one JSON object per line when application/x-ndjson is accepted</returns>
+    /// <response code="200">When the user accesses are successfully streamed</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("all/stream")]
+    [SwaggerOperation(OperationId = "streamAllUserXAccesss")]
+    [Produces("application/json", "application/x-ndjson")]
+    [ProducesResponseType<List<GetUserXAccessDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task GetAllStreamAction()
+    {
+        await GenericStreamAll();
+    }
+
     /// <summary>
     /// Get paginated data.
     /// </summary>
@@ -85,6 +106,52 @@ public class UserXAccessController : GenericController<UserXAccess, IUserXAccess
     {
         return await GenericGetByChunk(page, rows);
     }
+
+    /// <summary>
+    /// Get data after a continuation token, ordered by key.
+    /// </summary>
+    /// <param name="after">The continuation token of the previous page, omitted for the first page</param>
+    /// <param name="rows">The number of rows to retrieve</param>
+    /// <returns>A page of user accesses and the continuation token of the next page</returns>
+    /// <response code="200">When the user accesses are successfully retrieved</response>
+    /// <response code="400">When the continuation token is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("seek")]
+    [SwaggerOperation(OperationId = "seekUserXAccesss")]
+    [ProducesResponseType<SeekResponseDto<GetUserXAccessDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> SeekAction([FromQuery] string? after=null, [FromQuery] int rows=10)
+    {
+        return await GenericSeek(after, rows);
+    }
+
+    /// <summary>
+    /// Get the data matching filters.
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <param name="include">The include profile of the related data to load, one of the profiles make.py generates for the model</param>
+    /// <returns>The UserXAccesss matching the filters</returns>
+    /// <response code="200">When the UserXAccesss are successfully retrieved</response>
+    /// <response code="400">When the include profile is unknown</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("query")]
+    [SwaggerOperation(OperationId = "queryUserXAccesss")]
+    [ProducesResponseType<List<GetUserXAccessDto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> QueryAction([FromQuery] string filters="", [FromQuery] string include="")
+    {
+        return await GenericQuery(filters, include);
+    }
     
     /// <summary>
     /// Get specific data (UserXAccess) by id.
@@ -197,6 +264,28 @@ public class UserXAccessController : GenericController<UserXAccess, IUserXAccess
     {
         return await GenericUpdate(id, item);
     }
+
+    /// <summary>
+    /// Updates multiple user accesses with the same values in a single statement.
+    /// </summary>
+    /// <param name="batch">The IDs of the user accesses and the values to write, only the given fields are written</param>
+    /// <returns>The number of updated user accesses</returns>
+    /// <response code="200">When the user accesses are successfully updated</response>
+    /// <response code="400">When the ids are empty or too many, no or unknown fields are given, or the provided data is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during update</response>
+    [HttpPut("update/batch")]
+    [SwaggerOperation(OperationId = "updateBatchUserXAccesss")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> UpdateBatchAction(BatchUpdateDto<long, UserXAccessDto> batch)
+    {
+        return await GenericUpdateBatch(batch.Ids, batch.Item, batch.Fields);
+    }
     
     /// <summary>
     /// Deletes single UserXAccess entry.
@@ -219,4 +308,48 @@ public class UserXAccessController : GenericController<UserXAccess, IUserXAccess
     {
         return await GenericDelete(id);
     }
+
+    /// <summary>
+    /// Deletes multiple user accesses in a single statement.
+    /// </summary>
+    /// <param name="ids">The IDs of the user accesses to delete</param>
+    /// <returns>The number of deleted user accesses</returns>
+    /// <response code="200">When the user accesses are successfully deleted</response>
+    /// <response code="400">When the ids are empty or too many</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpPost("delete/batch")]
+    [SwaggerOperation(OperationId = "deleteBatchUserXAccesss")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteBatchAction(List<long> ids)
+    {
+        return await GenericDeleteBatch(ids);
+    }
+
+    /// <summary>
+    /// Deletes the user accesses matching filters in a single statement.
+    /// </summary>
+    /// <param name="filters">The filters of the user accesses to delete, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <returns>The number of deleted user accesses</returns>
+    /// <response code="200">When the user accesses are successfully deleted</response>
+    /// <response code="400">When the filters are missing or invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpDelete("delete/where")]
+    [SwaggerOperation(OperationId = "deleteWhereUserXAccesss")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteWhereAction([FromQuery] string filters)
+    {
+        return await GenericDeleteWhere(filters);
+    }
 }
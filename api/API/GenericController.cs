@@ -1,5 +1,13 @@
+using System.Buffers;
+using System.Globalization;
+using System.IO.Pipelines;
+using System.Text;
+using System.Text.Encodings.Web;
+using System.Text.Json;
 using APPLICATION.IService;
 using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Formatters;
+using Microsoft.Extensions.Options;
 
 namespace API;
 
@@ -14,6 +22,16 @@ public class GenericController <TModel, IServiceProvider, ItemDto, GetDto> : Con
 {
     protected readonly IServiceProvider _repo;
 
+    /// <summary>
+    /// Media type of the newline delimited JSON stream.
+    /// </summary>
+    protected const string NdjsonMediaType = "application/x-ndjson";
+
+    /// <summary>
+    /// Bytes a stream buffers before flushing them to the client.
+    /// </summary>
+    protected const int StreamFlushBytes = 16 * 1024;
+
     /// <summary>
     /// Constructor for the GenericController.
     /// </summary>
@@ -32,6 +50,98 @@ public class GenericController <TModel, IServiceProvider, ItemDto, GetDto> : Con
         return Ok(await _repo.GetAllAsync());
     }
 
+    /// <summary>
+    /// Stream all data to the response as it is read, as a JSON array, or as one JSON object per line
+    /// when the request accepts application/x-ndjson. Only a flush worth of items is held in memory.
+    /// Items are written with the serializer of the other actions, Newtonsoft or System.Text.Json.
+    /// </summary>
+    protected async Task GenericStreamAll()
+    {
+        var cancellationToken = HttpContext.RequestAborted;
+        var ndjson = Request.GetTypedHeaders().Accept.Any(accept => accept.MediaType.Equals(NdjsonMediaType, StringComparison.OrdinalIgnoreCase));
+
+        Response.ContentType = ndjson ? NdjsonMediaType : "application/json";
+
+        var body = Response.BodyWriter;
+        var write = GetItemWriter(body);
+        var first = true;
+        long unflushed = 0;
+
+        if (!ndjson)
+        {
+            body.Write("["u8);
+        }
+
+        await foreach (var item in _repo.StreamAllAsync().WithCancellation(cancellationToken))
+        {
+            if (!ndjson && !first)
+            {
+                body.Write(","u8);
+            }
+            first = false;
+
+            // Every item is written as its own JSON document, the array punctuation is written around them
+            unflushed += write(item) + 1;
+
+            if (ndjson)
+            {
+                body.Write("\n"u8);
+            }
+
+            if (unflushed >= StreamFlushBytes)
+            {
+                await body.FlushAsync(cancellationToken);
+                unflushed = 0;
+            }
+        }
+
+        if (!ndjson)
+        {
+            body.Write("]"u8);
+        }
+
+        await body.FlushAsync(cancellationToken);
+    }
+
+    /// <summary>
+    /// The writer of one streamed item, with the settings of the JSON output formatter the MVC options are configured with.
+    /// </summary>
+    /// <param name="body">The response body.</param>
+    /// <returns>Writes an item to the body and returns the number of bytes written.</returns>
+    private Func<GetDto, long> GetItemWriter(PipeWriter body)
+    {
+        var services = HttpContext.RequestServices;
+
+        if (services.GetRequiredService<IOptions<MvcOptions>>().Value.OutputFormatters.OfType<NewtonsoftJsonOutputFormatter>().Any())
+        {
+            var serializer = Newtonsoft.Json.JsonSerializer.Create(services.GetRequiredService<IOptions<MvcNewtonsoftJsonOptions>>().Value.SerializerSettings);
+            var text = new StringBuilder();
+
+            return item =>
+            {
+                text.Clear();
+                using (var writer = new StringWriter(text, CultureInfo.InvariantCulture))
+                {
+                    serializer.Serialize(writer, item);
+                }
+                return EncodingExtensions.GetBytes(Encoding.UTF8, text.ToString(), body);
+            };
+        }
+
+        // Without an encoder the System.Text.Json output formatter escapes relaxed, so does the stream
+        var options = services.GetRequiredService<IOptions<JsonOptions>>().Value.JsonSerializerOptions;
+        var jsonWriter = new Utf8JsonWriter(body, new JsonWriterOptions { Encoder = options.Encoder ?? JavaScriptEncoder.UnsafeRelaxedJsonEscaping });
+
+        return item =>
+        {
+            JsonSerializer.Serialize(jsonWriter, item, options);
+            jsonWriter.Flush();
+            var written = jsonWriter.BytesCommitted;
+            jsonWriter.Reset();
+            return written;
+        };
+    }
+
     /// <summary>
     /// Get paginated data.
     /// </summary>
@@ -54,6 +164,28 @@ public class GenericController <TModel, IServiceProvider, ItemDto, GetDto> : Con
         return Ok(await _repo.GetByChunk(page, rows));
     }
 
+    /// <summary>
+    /// Get the data after a continuation token.
+    /// </summary>
+    /// <param name="after">The continuation token of the previous page.</param>
+    /// <param name="rows">The number of rows to retrieve.</param>
+    /// <returns>A page of data and the next continuation token.</returns>
+    protected async Task<ActionResult> GenericSeek(string? after, int rows)
+    {
+        return Ok(await _repo.Seek(after, rows));
+    }
+
+    /// <summary>
+    /// Get the data matching filters.
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|...".</param>
+    /// <param name="include">The name of the include profile of the related data to load.</param>
+    /// <returns>The matching data.</returns>
+    protected async Task<ActionResult> GenericQuery(string filters, string include)
+    {
+        return Ok(await _repo.QueryAsync(filters, include));
+    }
+
     /// <summary>
     /// Get a single data.
     /// </summary>
@@ -64,6 +196,16 @@ public class GenericController <TModel, IServiceProvider, ItemDto, GetDto> : Con
         return Ok(await _repo.GetAsync(id));
     }
 
+    /// <summary>
+    /// Get a single data.
+    /// </summary>
+    /// <param name="id">The id of the data.</param>
+    /// <returns>A single data.</returns>
+    protected async Task<ActionResult> GenericGet(string id)
+    {
+        return Ok(await _repo.GetAsync(id));
+    }
+
     /// <summary>
     /// Create a new data.
     /// </summary>
@@ -125,4 +267,58 @@ public class GenericController <TModel, IServiceProvider, ItemDto, GetDto> : Con
     {
         return Ok(await _repo.DeleteAsync(id));
     }
+
+    /// <summary>
+    /// Update multiple data with the same values.
+    /// </summary>
+    /// <param name="ids">The ids of the data.</param>
+    /// <param name="item">The updated values.</param>
+    /// <param name="fields">The properties of item to write.</param>
+    /// <returns>The number of updated data.</returns>
+    protected async Task<ActionResult> GenericUpdateBatch(List<long> ids, ItemDto item, List<string> fields)
+    {
+        return Ok(await _repo.UpdateBatchAsync(ids, item, fields));
+    }
+
+    /// <summary>
+    /// Update multiple data with the same values.
+    /// </summary>
+    /// <param name="ids">The ids of the data.</param>
+    /// <param name="item">The updated values.</param>
+    /// <param name="fields">The properties of item to write.</param>
+    /// <returns>The number of updated data.</returns>
+    protected async Task<ActionResult> GenericUpdateBatch(List<string> ids, ItemDto item, List<string> fields)
+    {
+        return Ok(await _repo.UpdateBatchAsync(ids, item, fields));
+    }
+
+    /// <summary>
+    /// Delete multiple data.
+    /// </summary>
+    /// <param name="ids">The ids of the data.</param>
+    /// <returns>The number of deleted data.</returns>
+    protected async Task<ActionResult> GenericDeleteBatch(List<long> ids)
+    {
+        return Ok(await _repo.DeleteBatchAsync(ids));
+    }
+
+    /// <summary>
+    /// Delete multiple data.
+    /// </summary>
+    /// <param name="ids">The ids of the data.</param>
+    /// <returns>The number of deleted data.</returns>
+    protected async Task<ActionResult> GenericDeleteBatch(List<string> ids)
+    {
+        return Ok(await _repo.DeleteBatchAsync(ids));
+    }
+
+    /// <summary>
+    /// Delete the data matching filters.
+    /// </summary>
+    /// <param name="filters">The filters of the data.</param>
+    /// <returns>The number of deleted data.</returns>
+    protected async Task<ActionResult> GenericDeleteWhere(string filters)
+    {
+        return Ok(await _repo.DeleteWhereAsync(filters));
+    }
 }
\ No newline at end of file
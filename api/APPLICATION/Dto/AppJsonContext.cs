@@ -0,0 +1,49 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using APPLICATION.Dto.Request;
+using APPLICATION.Dto.Response;
+using APPLICATION.Dto.User;
+using APPLICATION.Dto.Role;
+using APPLICATION.Dto.RoleAction;
+using APPLICATION.Dto.UserXAccess;
+
+namespace APPLICATION.Dto;
+
+/// <summary>
+/// Serialization metadata of the dtos the controllers read and write.
+/// Registered in the JSON region of the injector, used when Json:Serializer is SystemTextJson.
+/// </summary>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+[JsonSerializable(typeof(UserDto))]
+[JsonSerializable(typeof(List<UserDto>))]
+[JsonSerializable(typeof(GetUserDto))]
+[JsonSerializable(typeof(List<GetUserDto>))]
+[JsonSerializable(typeof(PaginationResponseDto<GetUserDto>))]
+[JsonSerializable(typeof(SeekResponseDto<GetUserDto>))]
+[JsonSerializable(typeof(BatchUpdateDto<string, UserDto>))]
+[JsonSerializable(typeof(RoleDto))]
+[JsonSerializable(typeof(List<RoleDto>))]
+[JsonSerializable(typeof(GetRoleDto))]
+[JsonSerializable(typeof(List<GetRoleDto>))]
+[JsonSerializable(typeof(PaginationResponseDto<GetRoleDto>))]
+[JsonSerializable(typeof(SeekResponseDto<GetRoleDto>))]
+[JsonSerializable(typeof(BatchUpdateDto<long, RoleDto>))]
+[JsonSerializable(typeof(RoleActionDto))]
+[JsonSerializable(typeof(List<RoleActionDto>))]
+[JsonSerializable(typeof(GetRoleActionDto))]
+[JsonSerializable(typeof(List<GetRoleActionDto>))]
+[JsonSerializable(typeof(PaginationResponseDto<GetRoleActionDto>))]
+[JsonSerializable(typeof(SeekResponseDto<GetRoleActionDto>))]
+[JsonSerializable(typeof(BatchUpdateDto<long, RoleActionDto>))]
+[JsonSerializable(typeof(UserXAccessDto))]
+[JsonSerializable(typeof(List<UserXAccessDto>))]
+[JsonSerializable(typeof(GetUserXAccessDto))]
+[JsonSerializable(typeof(List<GetUserXAccessDto>))]
+[JsonSerializable(typeof(PaginationResponseDto<GetUserXAccessDto>))]
+[JsonSerializable(typeof(SeekResponseDto<GetUserXAccessDto>))]
+[JsonSerializable(typeof(BatchUpdateDto<long, UserXAccessDto>))]
+[JsonSerializable(typeof(List<string>))]
+[JsonSerializable(typeof(List<long>))]
+public partial class AppJsonContext : JsonSerializerContext
+{
+}
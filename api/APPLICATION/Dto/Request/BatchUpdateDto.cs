@@ -0,0 +1,20 @@
+namespace APPLICATION.Dto.Request;
+
+
+public record BatchUpdateDto<TKey, TSetter>
+{
+    /// <summary>
+    /// Ids of the items to update, at least one
+    /// </summary>
+    public List<TKey> Ids {get; set;} = [];
+
+    /// <summary>
+    /// Values written to every item
+    /// </summary>
+    public TSetter Item {get; set;} = default!;
+
+    /// <summary>
+    /// Properties of Item written to every item, at least one. Their values are written as given, null and default included.
+    /// </summary>
+    public List<string> Fields {get; set;} = [];
+}
@@ -0,0 +1,18 @@
+namespace APPLICATION.Dto.Response;
+
+
+public record SeekResponseDto<T>
+{
+    public IList<T> Data {get; set;} = [];
+
+    public SeekMetaDto? SeekMeta {get; set;}
+}
+
+public record SeekMetaDto
+{
+    public int Rows {get; set;}
+    /// <summary>
+    /// Continuation token of the next page, null on the last page
+    /// </summary>
+    public string? Next {get; set;}
+}
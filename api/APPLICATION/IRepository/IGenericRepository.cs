@@ -5,12 +5,12 @@ namespace APPLICATION.IRepository;
 public interface IGenericRepository<TModel, TSetter,TGetter>
 {
     /// <summary>
-    /// Apply filters and relations to the query
+    /// Apply filters and an include profile to the query
     /// </summary>
     /// <param name="filters">The filters to apply to the query, in the format of "field[operator]=value|field[operator]=value|..."</param>
-    /// <param name="relations">The relations to apply to the query, separated by '|'</param>
-    /// <returns>The query with the filters and relations applied</returns>
-    public IQueryable<TModel> Query(string filters = "", string relations = "");
+    /// <param name="include">The name of the include profile of the related data to load, none when empty</param>
+    /// <returns>The query with the filters and the include profile applied</returns>
+    public IQueryable<TModel> Query(string filters = "", string include = "");
     
     /// <summary>
     /// Get all items from the database
@@ -18,6 +18,21 @@ public interface IGenericRepository<TModel, TSetter,TGetter>
     /// <returns>List of items</returns>
     public Task<List<TGetter>> GetAllAsync();
 
+    /// <summary>
+    /// Get the items matching filters, with the related data of an include profile
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <param name="include">The name of the include profile, none when empty</param>
+    /// <returns>List of items</returns>
+    public Task<List<TGetter>> QueryAsync(string filters = "", string include = "");
+
+    /// <summary>
+    /// Stream all items from the database, projected to TGetter in SQL and none of them tracked
+    /// </summary>
+    /// <param name="query">The query to stream</param>
+    /// <returns>The items, in the order the database returns them</returns>
+    public IAsyncEnumerable<TGetter> StreamAllAsync(Func<IQueryable<TModel>, IQueryable<TModel>>? query = null);
+
     /// <summary>
     /// Paginate the query
     /// </summary>
@@ -35,6 +50,16 @@ public interface IGenericRepository<TModel, TSetter,TGetter>
     /// <returns>A list of items of type TGetter for the specified chunk</returns>
     public Task<List<TGetter>> GetByChunk(int page, int rows);
 
+    /// <summary>
+    /// Get the items after a continuation token in primary key order (keyset pagination).
+    /// Unlike Paginate it neither counts nor skips rows, so every page costs the same.
+    /// </summary>
+    /// <param name="after">The continuation token of the previous page, null for the first page</param>
+    /// <param name="rows">The number of rows to retrieve</param>
+    /// <param name="query">The query to seek in</param>
+    /// <returns>The items and the continuation token of the next page</returns>
+    public Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null);
+
     /// <summary>
     /// Get an item by its id
     /// </summary>
@@ -49,6 +74,20 @@ public interface IGenericRepository<TModel, TSetter,TGetter>
     /// <returns>The item of type TGetter</returns>
     public Task<TGetter?> GetAsync(string id);
 
+    /// <summary>
+    /// Check whether an item exists
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>True if the item exists, false otherwise</returns>
+    public Task<bool> ExistsAsync(long id);
+
+    /// <summary>
+    /// Check whether an item exists
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>True if the item exists, false otherwise</returns>
+    public Task<bool> ExistsAsync(string id);
+
     /// <summary>
     /// Create a new item
     /// </summary>
@@ -93,6 +132,45 @@ public interface IGenericRepository<TModel, TSetter,TGetter>
     /// <returns>True if the item was deleted, false otherwise</returns>
     public Task<bool> DeleteAsync(string id);
 
+    /// <summary>
+    /// Update items by their ids in a single UPDATE statement
+    /// </summary>
+    /// <param name="ids">The ids of the items, at least one and at most the repository's batch limit</param>
+    /// <param name="updatedItem">The values to write</param>
+    /// <param name="fields">The properties of updatedItem to write, at least one, null and default values included</param>
+    /// <returns>The number of updated items</returns>
+    public Task<int> UpdateBatchAsync(List<long> ids, TSetter updatedItem, List<string> fields);
+
+    /// <summary>
+    /// Update items by their ids in a single UPDATE statement
+    /// </summary>
+    /// <param name="ids">The ids of the items, at least one and at most the repository's batch limit</param>
+    /// <param name="updatedItem">The values to write</param>
+    /// <param name="fields">The properties of updatedItem to write, at least one, null and default values included</param>
+    /// <returns>The number of updated items</returns>
+    public Task<int> UpdateBatchAsync(List<string> ids, TSetter updatedItem, List<string> fields);
+
+    /// <summary>
+    /// Delete items by their ids in a single DELETE statement
+    /// </summary>
+    /// <param name="ids">The ids of the items, at least one and at most the repository's batch limit</param>
+    /// <returns>The number of deleted items</returns>
+    public Task<int> DeleteBatchAsync(List<long> ids);
+
+    /// <summary>
+    /// Delete items by their ids in a single DELETE statement
+    /// </summary>
+    /// <param name="ids">The ids of the items, at least one and at most the repository's batch limit</param>
+    /// <returns>The number of deleted items</returns>
+    public Task<int> DeleteBatchAsync(List<string> ids);
+
+    /// <summary>
+    /// Delete the items matching filters in a single DELETE statement
+    /// </summary>
+    /// <param name="filters">The filters of the items to delete, in the format of "field[operator]=value|field[operator]=value|...", at least one and every segment a filter</param>
+    /// <returns>The number of deleted items</returns>
+    public Task<int> DeleteWhereAsync(string filters);
+
     /// <summary>
     /// Save the changes to the database
     /// </summary>
@@ -6,15 +6,25 @@ namespace APPLICATION.IService;
 public interface IGenericService<TModel, TSetter,TGetter>
 {
     public Task<List<TGetter>> GetAllAsync();
+    public Task<List<TGetter>> QueryAsync(string filters = "", string include = "");
+    public IAsyncEnumerable<TGetter> StreamAllAsync(Func<IQueryable<TModel>, IQueryable<TModel>>? query = null);
     public Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null);
     public Task<List<TGetter>> GetByChunk(int page, int rows);
+    public Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null);
     public Task<TGetter?> GetAsync(long id);
     public Task<TGetter?> GetAsync(string id);
+    public Task<bool> ExistsAsync(long id);
+    public Task<bool> ExistsAsync(string id);
     public Task<TGetter?> CreateAsync(TSetter newItem);
     public Task<List<TGetter>> CreateAllAsync(List<TSetter> newItems);
     public Task<TGetter?> UpdateAsync(long id, TSetter updatedItem);
     public Task<TGetter?> UpdateAsync(string id, TSetter updatedItem);
     public Task<bool> DeleteAsync(long id);
     public Task<bool> DeleteAsync(string id);
+    public Task<int> UpdateBatchAsync(List<long> ids, TSetter updatedItem, List<string> fields);
+    public Task<int> UpdateBatchAsync(List<string> ids, TSetter updatedItem, List<string> fields);
+    public Task<int> DeleteBatchAsync(List<long> ids);
+    public Task<int> DeleteBatchAsync(List<string> ids);
+    public Task<int> DeleteWhereAsync(string filters);
 }
 
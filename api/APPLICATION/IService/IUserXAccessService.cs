@@ -1,6 +1,7 @@
 
 using APPLICATION.Dto.UserXAccess;
 using APPLICATION.Dto.Response;
+using APPLICATION.Security;
 using DOMAIN.Model;
 
 namespace APPLICATION.IService;
@@ -23,4 +24,12 @@ public interface IUserXAccessService:IGenericService<UserXAccess, UserXAccessDto
     /// <param name="allowedRoles">The list of roles and actions to check</param>
     /// <returns>True if the user has access, false otherwise</returns>
     public bool UserHasAccess(string userId, string[] allowedRoles);
+
+    /// <summary>
+    /// Get the permissions of a user, read once and cached until a Role, RoleAction, User or UserXAccess is written
+    /// through its service or the cache expires
+    /// </summary>
+    /// <param name="userId">The id of the user</param>
+    /// <returns>The role and action pairs granted to the user</returns>
+    public Task<PermissionSet> GetPermissionsAsync(string userId);
 }
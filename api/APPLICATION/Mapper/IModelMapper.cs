@@ -0,0 +1,60 @@
+using System.Linq.Expressions;
+
+namespace APPLICATION.Mapper;
+
+/// <summary>
+/// Explicit mapping of a model and its dtos, generated per model by make.py (MODEL.OPTIONS MODEL_MAPPER).
+/// It maps the members the AutoMapper profile of the model maps, without the runtime configuration of AutoMapper.
+/// </summary>
+/// <typeparam name="TModel">The model type.</typeparam>
+/// <typeparam name="TSetter">The dto the model is created and updated from.</typeparam>
+/// <typeparam name="TGetter">The dto the model is read as.</typeparam>
+public interface IModelMapper<TModel, TSetter, TGetter>
+{
+    /// <summary>
+    /// The TModel to TGetter mapping as an expression, for projections in SQL
+    /// </summary>
+    Expression<Func<TModel, TGetter>> Projection { get; }
+
+    /// <summary>
+    /// Create a model from a dto
+    /// </summary>
+    /// <param name="item">The dto</param>
+    /// <returns>The new model</returns>
+    TModel ToModel(TSetter item);
+
+    /// <summary>
+    /// Create models from dtos
+    /// </summary>
+    /// <param name="items">The dtos</param>
+    /// <returns>The new models</returns>
+    List<TModel> ToModels(ReadOnlySpan<TSetter> items);
+
+    /// <summary>
+    /// Write the members of a dto to an existing model
+    /// </summary>
+    /// <param name="item">The dto</param>
+    /// <param name="model">The model to update</param>
+    void Update(TSetter item, TModel model);
+
+    /// <summary>
+    /// Read a model as a dto
+    /// </summary>
+    /// <param name="item">The model</param>
+    /// <returns>The dto</returns>
+    TGetter ToGetter(TModel item);
+
+    /// <summary>
+    /// Read models as dtos
+    /// </summary>
+    /// <param name="items">The models</param>
+    /// <returns>The dtos</returns>
+    List<TGetter> ToGetters(ReadOnlySpan<TModel> items);
+
+    /// <summary>
+    /// Read models as dtos
+    /// </summary>
+    /// <param name="items">The models</param>
+    /// <returns>The dtos</returns>
+    List<TGetter> ToGetters(List<TModel> items);
+}
@@ -0,0 +1,66 @@
+using System.Linq.Expressions;
+using System.Runtime.InteropServices;
+using APPLICATION.Dto.Role;
+using DOMAIN.Model;
+
+namespace APPLICATION.Mapper;
+
+public sealed class RoleModelMapper : IModelMapper<Role, RoleDto, GetRoleDto>
+{
+    public static readonly RoleModelMapper Instance = new();
+
+    private static readonly Expression<Func<Role, GetRoleDto>> ProjectionExpression = item => new GetRoleDto
+    {
+        Id = item.Id,
+        Name = item.Name
+    };
+
+    public Expression<Func<Role, GetRoleDto>> Projection => ProjectionExpression;
+
+    public Role ToModel(RoleDto item)
+    {
+        return new Role
+        {
+            Name = item.Name
+        };
+    }
+
+    public List<Role> ToModels(ReadOnlySpan<RoleDto> items)
+    {
+        var models = new List<Role>(items.Length);
+        foreach (var item in items)
+        {
+            models.Add(ToModel(item));
+        }
+        return models;
+    }
+
+    public void Update(RoleDto item, Role model)
+    {
+        model.Name = item.Name;
+    }
+
+    public GetRoleDto ToGetter(Role item)
+    {
+        return new GetRoleDto
+        {
+            Id = item.Id,
+            Name = item.Name
+        };
+    }
+
+    public List<GetRoleDto> ToGetters(ReadOnlySpan<Role> items)
+    {
+        var getters = new List<GetRoleDto>(items.Length);
+        foreach (var item in items)
+        {
+            getters.Add(ToGetter(item));
+        }
+        return getters;
+    }
+
+    public List<GetRoleDto> ToGetters(List<Role> items)
+    {
+        return ToGetters(CollectionsMarshal.AsSpan(items));
+    }
+}
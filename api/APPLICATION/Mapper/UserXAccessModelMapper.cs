@@ -0,0 +1,119 @@
+using System.Linq.Expressions;
+using System.Runtime.InteropServices;
+using APPLICATION.Dto.UserXAccess;
+using APPLICATION.Dto.Role;
+using APPLICATION.Dto.RoleAction;
+using APPLICATION.Dto.User;
+using DOMAIN.Model;
+
+namespace APPLICATION.Mapper;
+
+public sealed class UserXAccessModelMapper : IModelMapper<UserXAccess, UserXAccessDto, GetUserXAccessDto>
+{
+    public static readonly UserXAccessModelMapper Instance = new();
+
+    private static readonly Expression<Func<UserXAccess, GetUserXAccessDto>> ProjectionExpression = item => new GetUserXAccessDto
+    {
+        Id = item.Id,
+        UserId = item.UserId,
+        User = item.User == null ? null : new GetUserDto
+        {
+            Id = item.User.Id,
+            Email = item.User.Email,
+            UserName = item.User.UserName,
+            PhoneNumber = item.User.PhoneNumber,
+            FirstName = item.User.FirstName,
+            LastName = item.User.LastName,
+            Address = item.User.Address,
+            BirthDate = item.User.BirthDate
+        },
+        RoleId = item.RoleId,
+        Role = item.Role == null ? null : new GetRoleDto
+        {
+            Id = item.Role.Id,
+            Name = item.Role.Name
+        },
+        RoleActionId = item.RoleActionId,
+        RoleAction = item.RoleAction == null ? null : new GetRoleActionDto
+        {
+            Id = item.RoleAction.Id,
+            Name = item.RoleAction.Name
+        }
+    };
+
+    public Expression<Func<UserXAccess, GetUserXAccessDto>> Projection => ProjectionExpression;
+
+    public UserXAccess ToModel(UserXAccessDto item)
+    {
+        return new UserXAccess
+        {
+            UserId = item.UserId,
+            RoleId = item.RoleId,
+            RoleActionId = item.RoleActionId
+        };
+    }
+
+    public List<UserXAccess> ToModels(ReadOnlySpan<UserXAccessDto> items)
+    {
+        var models = new List<UserXAccess>(items.Length);
+        foreach (var item in items)
+        {
+            models.Add(ToModel(item));
+        }
+        return models;
+    }
+
+    public void Update(UserXAccessDto item, UserXAccess model)
+    {
+        model.UserId = item.UserId;
+        model.RoleId = item.RoleId;
+        model.RoleActionId = item.RoleActionId;
+    }
+
+    public GetUserXAccessDto ToGetter(UserXAccess item)
+    {
+        return new GetUserXAccessDto
+        {
+            Id = item.Id,
+            UserId = item.UserId,
+            User = item.User == null ? null : new GetUserDto
+            {
+                Id = item.User.Id,
+                Email = item.User.Email,
+                UserName = item.User.UserName,
+                PhoneNumber = item.User.PhoneNumber,
+                FirstName = item.User.FirstName,
+                LastName = item.User.LastName,
+                Address = item.User.Address,
+                BirthDate = item.User.BirthDate
+            },
+            RoleId = item.RoleId,
+            Role = item.Role == null ? null : new GetRoleDto
+            {
+                Id = item.Role.Id,
+                Name = item.Role.Name
+            },
+            RoleActionId = item.RoleActionId,
+            RoleAction = item.RoleAction == null ? null : new GetRoleActionDto
+            {
+                Id = item.RoleAction.Id,
+                Name = item.RoleAction.Name
+            }
+        };
+    }
+
+    public List<GetUserXAccessDto> ToGetters(ReadOnlySpan<UserXAccess> items)
+    {
+        var getters = new List<GetUserXAccessDto>(items.Length);
+        foreach (var item in items)
+        {
+            getters.Add(ToGetter(item));
+        }
+        return getters;
+    }
+
+    public List<GetUserXAccessDto> ToGetters(List<UserXAccess> items)
+    {
+        return ToGetters(CollectionsMarshal.AsSpan(items));
+    }
+}
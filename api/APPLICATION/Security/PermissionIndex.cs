@@ -0,0 +1,69 @@
+namespace APPLICATION.Security;
+
+
+/// <summary>
+/// The bit numbering of the permissions, read from the Role and RoleAction rows. A permission is a role name and
+/// action name pair, roles or actions sharing a name share its bits.
+/// </summary>
+public sealed class PermissionIndex
+{
+    private readonly Dictionary<string, int> _roleNames = new(StringComparer.OrdinalIgnoreCase);
+    private readonly Dictionary<string, int> _actionNames = new(StringComparer.OrdinalIgnoreCase);
+    private readonly Dictionary<long, int> _roles = new();
+    private readonly Dictionary<long, int> _actions = new();
+
+    public PermissionIndex(IEnumerable<(long Id, string Name)> roles, IEnumerable<(long Id, string Name)> actions)
+    {
+        foreach (var (id, name) in roles)
+        {
+            _roles[id] = Number(_roleNames, name);
+        }
+
+        foreach (var (id, name) in actions)
+        {
+            _actions[id] = Number(_actionNames, name);
+        }
+    }
+
+    /// <summary>
+    /// The number of permission bits
+    /// </summary>
+    public int Count => _roleNames.Count * _actionNames.Count;
+
+    /// <summary>
+    /// The bit of a role and action pair, by their ids
+    /// </summary>
+    /// <param name="roleId">The id of the role</param>
+    /// <param name="roleActionId">The id of the action</param>
+    /// <returns>The bit, -1 when either is unknown</returns>
+    public int Bit(long roleId, long roleActionId)
+    {
+        return _roles.TryGetValue(roleId, out var role) && _actions.TryGetValue(roleActionId, out var action)
+            ? role * _actionNames.Count + action
+            : -1;
+    }
+
+    /// <summary>
+    /// The bit of a role and action pair, by their names
+    /// </summary>
+    /// <param name="roleName">The name of the role, case insensitive</param>
+    /// <param name="actionName">The name of the action, case insensitive</param>
+    /// <returns>The bit, -1 when either is unknown</returns>
+    public int Bit(string roleName, string actionName)
+    {
+        return _roleNames.TryGetValue(roleName, out var role) && _actionNames.TryGetValue(actionName, out var action)
+            ? role * _actionNames.Count + action
+            : -1;
+    }
+
+    private static int Number(Dictionary<string, int> names, string name)
+    {
+        if (!names.TryGetValue(name, out var number))
+        {
+            number = names.Count;
+            names[name] = number;
+        }
+
+        return number;
+    }
+}
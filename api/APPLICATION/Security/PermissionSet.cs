@@ -0,0 +1,54 @@
+namespace APPLICATION.Security;
+
+
+/// <summary>
+/// The permissions of a user, one bit per role and action pair as numbered by the PermissionIndex it was read with.
+/// </summary>
+public sealed class PermissionSet
+{
+    private readonly PermissionIndex _index;
+    private readonly ulong[] _bits;
+
+    public PermissionSet(PermissionIndex index)
+    {
+        _index = index;
+        _bits = new ulong[(index.Count + 63) / 64];
+    }
+
+    /// <summary>
+    /// Grant a role and action pair, pairs missing from the index are ignored
+    /// </summary>
+    /// <param name="roleId">The id of the role</param>
+    /// <param name="roleActionId">The id of the action</param>
+    public void Add(long roleId, long roleActionId)
+    {
+        var bit = _index.Bit(roleId, roleActionId);
+
+        if (bit >= 0)
+        {
+            _bits[bit >> 6] |= 1UL << (bit & 63);
+        }
+    }
+
+    /// <summary>
+    /// Whether a role and action pair is granted
+    /// </summary>
+    /// <param name="roleName">The name of the role</param>
+    /// <param name="actionName">The name of the action</param>
+    /// <returns>True if it is granted, false when it is not or either name is unknown</returns>
+    public bool Contains(string roleName, string actionName)
+    {
+        var bit = _index.Bit(roleName, actionName);
+        return bit >= 0 && (_bits[bit >> 6] & (1UL << (bit & 63))) != 0;
+    }
+
+    /// <summary>
+    /// Whether any of the role and action pairs is granted
+    /// </summary>
+    /// <param name="permissions">The role and action names</param>
+    /// <returns>True if at least one of them is granted</returns>
+    public bool ContainsAny(IEnumerable<(string Role, string Action)> permissions)
+    {
+        return permissions.Any(permission => Contains(permission.Role, permission.Action));
+    }
+}
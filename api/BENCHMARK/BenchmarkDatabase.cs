@@ -0,0 +1,45 @@
+using APPLICATION.Mapper;
+using AutoMapper;
+using DOMAIN.Model;
+using INFRASTRUCTURE.Data;
+using Microsoft.Data.Sqlite;
+using Microsoft.EntityFrameworkCore;
+
+namespace BENCHMARK;
+
+/// <summary>
+/// An in-memory SQLite AppDbContext seeded with Roles, kept open for the whole benchmark run.
+/// </summary>
+public sealed class BenchmarkDatabase : IDisposable
+{
+    private readonly SqliteConnection _connection;
+    private readonly DbContextOptions<AppDbContext> _options;
+
+    public IMapper Mapper { get; }
+
+    public BenchmarkDatabase(int roles)
+    {
+        _connection = new SqliteConnection("DataSource=:memory:");
+        _connection.Open();
+        _options = new DbContextOptionsBuilder<AppDbContext>().UseSqlite(_connection).Options;
+
+        using (var context = CreateContext())
+        {
+            context.Database.EnsureCreated();
+            context.Roles.AddRange(Enumerable.Range(0, roles).Select(index => new Role { Name = $"Role {index}" }));
+            context.SaveChanges();
+        }
+
+        Mapper = new MapperConfiguration(config => config.AddMaps(typeof(RoleMapper).Assembly)).CreateMapper();
+    }
+
+    public AppDbContext CreateContext()
+    {
+        return new AppDbContext(_options);
+    }
+
+    public void Dispose()
+    {
+        _connection.Dispose();
+    }
+}
@@ -0,0 +1,66 @@
+using BenchmarkDotNet.Attributes;
+using DOMAIN.Model;
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Repository;
+using INFRASTRUCTURE.Util;
+using Microsoft.EntityFrameworkCore;
+
+namespace BENCHMARK;
+
+/// <summary>
+/// Filtered reads through QueryBuilder's reflection against RoleFilterMap, which make.py generates from
+/// MODEL.OPTIONS FILTER_MAP. The value changes every call, as it does between requests.
+/// </summary>
+[MemoryDiagnoser]
+public class FilterBenchmark
+{
+    private const int Roles = 1000;
+
+    private BenchmarkDatabase _database = null!;
+    private AppDbContext _context = null!;
+    private long _id;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _database = new BenchmarkDatabase(Roles);
+        _context = _database.CreateContext();
+    }
+
+    private string NextFilters()
+    {
+        _id = _id % Roles + 1;
+        return $"Id[gte]={_id}|Name[contains]=\"Role {_id % 10}\"";
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Benchmark(Baseline = true)]
+    public async Task<List<Role>> ReflectionFilter()
+    {
+        return await QueryBuilder<Role>.Apply(_context.Roles.AsNoTracking(), NextFilters()).Take(10).ToListAsync();
+    }
+
+    [Benchmark]
+    public async Task<List<Role>> FilterMapFilter()
+    {
+        return await QueryBuilder<Role>.Apply(_context.Roles.AsNoTracking(), NextFilters(), "", RoleFilterMap.Instance).Take(10).ToListAsync();
+    }
+
+    [Benchmark]
+    public IQueryable<Role> ReflectionBuild()
+    {
+        return QueryBuilder<Role>.Apply(_context.Roles, NextFilters());
+    }
+
+    [Benchmark]
+    public IQueryable<Role> FilterMapBuild()
+    {
+        return QueryBuilder<Role>.Apply(_context.Roles, NextFilters(), "", RoleFilterMap.Instance);
+    }
+}
@@ -0,0 +1,71 @@
+using APPLICATION.Dto.Role;
+using BenchmarkDotNet.Attributes;
+using DOMAIN.Model;
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Repository;
+
+namespace BENCHMARK;
+
+/// <summary>
+/// Lookups by id through GenericRepository (FindAsync and LINQ built per call) against RoleRepository,
+/// whose compiled queries make.py generates from MODEL.OPTIONS COMPILED_QUERIES.
+/// </summary>
+[MemoryDiagnoser]
+public class LookupBenchmark
+{
+    private const int Roles = 1000;
+
+    private BenchmarkDatabase _database = null!;
+    private AppDbContext _context = null!;
+    private GenericRepository<Role, RoleDto, GetRoleDto> _generic = null!;
+    private RoleRepository _compiled = null!;
+    private long _id;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _database = new BenchmarkDatabase(Roles);
+        _context = _database.CreateContext();
+        _generic = new GenericRepository<Role, RoleDto, GetRoleDto>(_context, _database.Mapper);
+        _compiled = new RoleRepository(_context, _database.Mapper);
+    }
+
+    private long NextId()
+    {
+        // A fresh change tracker per call, so FindAsync cannot answer from tracked entities.
+        _context.ChangeTracker.Clear();
+        _id = _id % Roles + 1;
+        return _id;
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Benchmark(Baseline = true)]
+    public async Task<GetRoleDto?> GenericGet()
+    {
+        return await _generic.GetAsync(NextId());
+    }
+
+    [Benchmark]
+    public async Task<GetRoleDto?> CompiledGet()
+    {
+        return await _compiled.GetAsync(NextId());
+    }
+
+    [Benchmark]
+    public async Task<bool> GenericExists()
+    {
+        return await _generic.ExistsAsync(NextId());
+    }
+
+    [Benchmark]
+    public async Task<bool> CompiledExists()
+    {
+        return await _compiled.ExistsAsync(NextId());
+    }
+}
@@ -0,0 +1,108 @@
+using APPLICATION.Dto.Role;
+using APPLICATION.Dto.UserXAccess;
+using APPLICATION.Mapper;
+using AutoMapper;
+using AutoMapper.QueryableExtensions;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using DOMAIN.Model;
+using INFRASTRUCTURE.Data;
+using Microsoft.EntityFrameworkCore;
+
+namespace BENCHMARK;
+
+/// <summary>
+/// Mapping through AutoMapper against RoleModelMapper and UserXAccessModelMapper, which make.py generates from
+/// MODEL.OPTIONS MODEL_MAPPER. The lists are read as a page of GetAllAsync or Paginate maps them, with their navigations loaded.
+/// </summary>
+[MemoryDiagnoser]
+[GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+[CategoriesColumn]
+public class MapperBenchmark
+{
+    private const int Roles = 1000;
+    private const int Accesses = 100;
+
+    private BenchmarkDatabase _database = null!;
+    private AppDbContext _context = null!;
+    private IMapper _mapper = null!;
+    private List<UserXAccess> _accesses = null!;
+    private RoleDto _role = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _database = new BenchmarkDatabase(Roles);
+        _context = _database.CreateContext();
+        _mapper = _database.Mapper;
+        _role = new RoleDto { Name = "Role" };
+
+        var user = new User { Id = "user", Email = "user@example.com", UserName = "user", FirstName = "First", LastName = "Last", Address = "Address" };
+        var actions = Enumerable.Range(1, 5).Select(index => new RoleAction { Id = index, Name = $"Action {index}" }).ToArray();
+        _accesses = Enumerable.Range(1, Accesses).Select(index => new UserXAccess
+        {
+            Id = index,
+            UserId = user.Id,
+            User = user,
+            RoleId = index % 2 + 1,
+            Role = new Role { Id = index % 2 + 1, Name = $"Role {index % 2}" },
+            RoleActionId = actions[index % actions.Length].Id,
+            RoleAction = actions[index % actions.Length]
+        }).ToList();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Benchmark(Baseline = true), BenchmarkCategory("ToGetters")]
+    public List<GetUserXAccessDto> AutoMapperToGetters()
+    {
+        return _mapper.Map<List<GetUserXAccessDto>>(_accesses);
+    }
+
+    [Benchmark, BenchmarkCategory("ToGetters")]
+    public List<GetUserXAccessDto> ModelMapperToGetters()
+    {
+        return UserXAccessModelMapper.Instance.ToGetters(_accesses);
+    }
+
+    [Benchmark(Baseline = true), BenchmarkCategory("ToGetter")]
+    public GetUserXAccessDto AutoMapperToGetter()
+    {
+        return _mapper.Map<GetUserXAccessDto>(_accesses[0]);
+    }
+
+    [Benchmark, BenchmarkCategory("ToGetter")]
+    public GetUserXAccessDto ModelMapperToGetter()
+    {
+        return UserXAccessModelMapper.Instance.ToGetter(_accesses[0]);
+    }
+
+    [Benchmark(Baseline = true), BenchmarkCategory("ToModel")]
+    public Role AutoMapperToModel()
+    {
+        return _mapper.Map<Role>(_role);
+    }
+
+    [Benchmark, BenchmarkCategory("ToModel")]
+    public Role ModelMapperToModel()
+    {
+        return RoleModelMapper.Instance.ToModel(_role);
+    }
+
+    [Benchmark(Baseline = true), BenchmarkCategory("Projection")]
+    public async Task<List<GetRoleDto>> AutoMapperProjection()
+    {
+        return await _context.Roles.AsNoTracking().Take(100).ProjectTo<GetRoleDto>(_mapper.ConfigurationProvider).ToListAsync();
+    }
+
+    [Benchmark, BenchmarkCategory("Projection")]
+    public async Task<List<GetRoleDto>> ModelMapperProjection()
+    {
+        return await _context.Roles.AsNoTracking().Take(100).Select(RoleModelMapper.Instance.Projection).ToListAsync();
+    }
+}
@@ -0,0 +1,15 @@
+using BenchmarkDotNet.Running;
+
+namespace BENCHMARK;
+
+/// <summary>
+/// Micro-benchmarks of the repository paths make.py generates.
+/// Run with: dotnet run -c Release --project BENCHMARK -- --filter '*'
+/// </summary>
+public class Program
+{
+    public static void Main(string[] args)
+    {
+        BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
+    }
+}
@@ -0,0 +1,19 @@
+namespace DOMAIN.Constant;
+
+/// <summary>
+/// The "Role:Action" permissions of CaslAttribute, one per RoleEnum and RoleActionEnum pair.
+/// Their bits are numbered at runtime from the Role and RoleAction rows, see PermissionIndex.
+/// </summary>
+public static class Permission
+{
+    public const string AdminRead = "Admin:Read";
+    public const string AdminCreate = "Admin:Create";
+    public const string AdminUpdate = "Admin:Update";
+    public const string AdminDelete = "Admin:Delete";
+    public const string AdminAll = "Admin:All";
+    public const string UserRead = "User:Read";
+    public const string UserCreate = "User:Create";
+    public const string UserUpdate = "User:Update";
+    public const string UserDelete = "User:Delete";
+    public const string UserAll = "User:All";
+}
@@ -1,4 +1,6 @@
-﻿using APPLICATION.IRepository;
+﻿using System.Text.Json.Serialization;
+using APPLICATION.Dto;
+using APPLICATION.IRepository;
 using APPLICATION.IService;
 using DOMAIN.Model;
 using INFRASTRUCTURE.Data;
@@ -30,6 +32,17 @@ public class InfraInjector
 			services.AddScoped<IUserXAccessService, UserXAccessService>(); /* added by make.py */
 		#endregion
 
+        // Inject read-through caches, decorating the services above
+        #region CACHING
+            services.AddCachedService<Role, IRoleService, RoleService, RoleCachedService>(RoleCachedService.CacheSize, RoleCachedService.CacheTtlSeconds); /* added by make.py */
+            services.AddCachedService<RoleAction, IRoleActionService, RoleActionService, RoleActionCachedService>(RoleActionCachedService.CacheSize, RoleActionCachedService.CacheTtlSeconds); /* added by make.py */
+		#endregion
+
+        // Permissions of the CaslAttribute checks, per user, sized by the Permissions settings like the model caches
+        services.AddSingleton(new PermissionCache(
+            configuration.GetValue("Permissions:CacheSize", 10_000L),
+            TimeSpan.FromSeconds(configuration.GetValue("Permissions:CacheTtlSeconds", 300))));
+
         // Identity
         services.AddIdentity<User, IdentityRole>()
             .AddEntityFrameworkStores<AppDbContext>()
@@ -48,10 +61,27 @@ public class InfraInjector
             options.User.RequireUniqueEmail = true;
         });
 
-        // Newton soft json
-        services.AddControllers()
-            .AddNewtonsoftJson(
-                options => options.SerializerSettings.ReferenceLoopHandling = Newtonsoft.Json.ReferenceLoopHandling.Ignore
-            );
+        // Json, Newtonsoft unless the Json:Serializer setting is SystemTextJson
+        if (string.Equals(configuration["Json:Serializer"], "SystemTextJson", StringComparison.OrdinalIgnoreCase))
+        {
+            // System.Text.Json, the generated dtos are read and written with the source generated metadata
+            services.AddControllers()
+                .AddJsonOptions(options =>
+                {
+                    options.JsonSerializerOptions.ReferenceHandler = ReferenceHandler.IgnoreCycles;
+
+                    #region JSON
+                        options.JsonSerializerOptions.TypeInfoResolverChain.Insert(0, AppJsonContext.Default); /* added by make.py */
+                    #endregion
+                });
+        }
+        else
+        {
+            // Newton soft json
+            services.AddControllers()
+                .AddNewtonsoftJson(
+                    options => options.SerializerSettings.ReferenceLoopHandling = Newtonsoft.Json.ReferenceLoopHandling.Ignore
+                );
+        }
     }
 }
\ No newline at end of file
@@ -1,9 +1,15 @@
+using System.Globalization;
+using System.Linq.Expressions;
 using AutoMapper;
+using AutoMapper.QueryableExtensions;
 using APPLICATION.Dto.Response;
+using APPLICATION.Mapper;
 using INFRASTRUCTURE.Data;
 using INFRASTRUCTURE.ExceptionHandler;
 using INFRASTRUCTURE.Util;
 using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata;
+using Microsoft.EntityFrameworkCore.Query;
 using APPLICATION.IRepository;
 
 namespace INFRASTRUCTURE.Repository;
@@ -20,20 +26,392 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
         _dbModel = _dbContext.Set<TModel>();
         _mapper = mapper;
     }
-    public IQueryable<TModel> Query(string filters = "", string relations = "")
+
+    /// <summary>
+    /// Change tracking of the read paths (Query, GetAllAsync, Paginate, GetByChunk and GetAsync), write paths always track.
+    /// Generated repositories override it with the model's READ_TRACKING option.
+    /// </summary>
+    protected virtual QueryTrackingBehavior ReadTracking => QueryTrackingBehavior.TrackAll;
+
+    /// <summary>
+    /// Number of items CreateAllAsync saves per SaveChanges, generated repositories override it with the model's INSERT_BATCH_SIZE option.
+    /// </summary>
+    protected virtual int InsertBatchSize => 1000;
+
+    /// <summary>
+    /// Most ids UpdateBatchAsync and DeleteBatchAsync accept in one call
+    /// </summary>
+    protected virtual int BatchLimit => 1000;
+
+    /// <summary>
+    /// Typed predicates of the filters of Query and DeleteWhereAsync, generated repositories override it with the
+    /// model's FilterMap when the FILTER_MAP option is on. Filter paths missing from a strict map are rejected,
+    /// without a map, or when FILTER_STRICT is off, they are resolved by reflection.
+    /// </summary>
+    protected virtual FilterMap<TModel>? Filters => null;
+
+    /// <summary>
+    /// The named include profiles of Query, generated repositories override it with the model's IncludeProfiles
+    /// when the INCLUDE_PROFILES option is on.
+    /// </summary>
+    protected virtual IncludeProfiles<TModel>? Includes => null;
+
+    /// <summary>
+    /// Explicit mapping of the model and its dtos, generated repositories override it with the model's ModelMapper
+    /// when the MODEL_MAPPER option is on. When null the models are mapped by AutoMapper.
+    /// </summary>
+    protected virtual IModelMapper<TModel, TSetter, TGetter>? ModelMapper => null;
+
+    /// <summary>
+    /// The TModel to TGetter projection of the projected reads, generated per model by make.py.
+    /// When null the projection of the ModelMapper is used, without one it is built by AutoMapper's ProjectTo from the mapping profile.
+    /// </summary>
+    protected virtual Expression<Func<TModel, TGetter>>? Projection => null;
+
+    /// <summary>
+    /// Project a query to TGetter
+    /// </summary>
+    /// <param name="query">The query to project</param>
+    /// <returns>The untracked, projected query</returns>
+    protected IQueryable<TGetter> Project(IQueryable<TModel> query)
+    {
+        var projection = Projection ?? ModelMapper?.Projection;
+
+        if (projection != null)
+        {
+            return query.AsNoTracking().Select(projection);
+        }
+
+        return query.AsNoTracking().ProjectTo<TGetter>(_mapper.ConfigurationProvider);
+    }
+
+    /// <summary>
+    /// Map a model to TGetter
+    /// </summary>
+    /// <param name="item">The model</param>
+    /// <returns>The dto</returns>
+    protected TGetter ToGetter(TModel item)
+    {
+        var modelMapper = ModelMapper;
+        return modelMapper != null ? modelMapper.ToGetter(item) : _mapper.Map<TGetter>(item);
+    }
+
+    /// <summary>
+    /// Map models to TGetter
+    /// </summary>
+    /// <param name="items">The models</param>
+    /// <returns>The dtos</returns>
+    protected List<TGetter> ToGetters(List<TModel> items)
+    {
+        var modelMapper = ModelMapper;
+        return modelMapper != null ? modelMapper.ToGetters(items) : _mapper.Map<List<TGetter>>(items);
+    }
+
+    /// <summary>
+    /// Map a dto to a new model
+    /// </summary>
+    /// <param name="item">The dto</param>
+    /// <returns>The model</returns>
+    protected TModel ToModel(TSetter item)
+    {
+        var modelMapper = ModelMapper;
+        return modelMapper != null ? modelMapper.ToModel(item) : _mapper.Map<TModel>(item);
+    }
+
+    /// <summary>
+    /// Map dtos to new models
+    /// </summary>
+    /// <param name="items">The dtos</param>
+    /// <returns>The models</returns>
+    protected List<TModel> ToModels(TSetter[] items)
+    {
+        var modelMapper = ModelMapper;
+        return modelMapper != null ? modelMapper.ToModels(items) : _mapper.Map<List<TModel>>(items);
+    }
+
+    /// <summary>
+    /// Write the members of a dto to an existing model
+    /// </summary>
+    /// <param name="item">The dto</param>
+    /// <param name="model">The model to update</param>
+    protected void MapInto(TSetter item, TModel model)
+    {
+        var modelMapper = ModelMapper;
+
+        if (modelMapper != null)
+        {
+            modelMapper.Update(item, model);
+            return;
+        }
+
+        _mapper.Map(item, model);
+    }
+
+    /// <summary>
+    /// The model set with ReadTracking applied
+    /// </summary>
+    /// <returns>The query every read path starts from</returns>
+    protected IQueryable<TModel> ReadQuery()
+    {
+        return ReadTracking switch
+        {
+            QueryTrackingBehavior.NoTracking => _dbModel.AsNoTracking(),
+            QueryTrackingBehavior.NoTrackingWithIdentityResolution => _dbModel.AsNoTrackingWithIdentityResolution(),
+            _ => _dbModel.AsQueryable()
+        };
+    }
+
+    /// <summary>
+    /// The model's primary key property, from the EF model metadata
+    /// </summary>
+    /// <returns>The primary key property</returns>
+    protected IProperty GetKey()
+    {
+        var key = _dbContext.Model.FindEntityType(typeof(TModel))?.FindPrimaryKey();
+
+        if (key == null || key.Properties.Count != 1)
+        {
+            throw new Error500Exception($"{typeof(TModel).Name} has no single column primary key");
+        }
+
+        return key.Properties[0];
+    }
+
+    /// <summary>
+    /// The name of the model's primary key, from the EF model metadata
+    /// </summary>
+    /// <returns>The primary key property name</returns>
+    protected string GetKeyName()
+    {
+        return GetKey().Name;
+    }
+
+    /// <summary>
+    /// Order a query by the primary key and keep the rows after a continuation token.
+    /// One row more than asked is taken, so a next page is detected without counting.
+    /// </summary>
+    /// <param name="query">The query to seek in</param>
+    /// <param name="after">The continuation token of the previous page, null for the first page</param>
+    /// <param name="rows">The number of rows of the page</param>
+    /// <returns>The key ordered query of at most rows + 1 items</returns>
+    protected IQueryable<TModel> SeekQuery(IQueryable<TModel> query, string? after, int rows)
+    {
+        if (rows <= 0)
+        {
+            throw new Error400Exception("Rows must be greater than zero");
+        }
+
+        var key = GetKey();
+        var keyName = key.Name;
+
+        if (key.ClrType == typeof(long))
+        {
+            query = query.OrderBy(item => EF.Property<long>(item, keyName));
+            if (after != null)
+            {
+                var cursor = SeekToken.DecodeLong(after);
+                query = query.Where(item => EF.Property<long>(item, keyName) > cursor);
+            }
+        }
+        else if (key.ClrType == typeof(string))
+        {
+            query = query.OrderBy(item => EF.Property<string>(item, keyName));
+            if (after != null)
+            {
+                var cursor = SeekToken.Decode(after);
+                query = query.Where(item => string.Compare(EF.Property<string>(item, keyName), cursor) > 0);
+            }
+        }
+        else
+        {
+            throw new Error500Exception($"{typeof(TModel).Name} has an unsupported key type for seek: {key.ClrType.Name}");
+        }
+
+        return query.Take(rows + 1);
+    }
+
+    /// <summary>
+    /// The SetProperty calls of a set-based update writing the given fields of updatedItem, null, false and 0 included.
+    /// A field is a property of TSetter that the model has, the key excluded, named case insensitively.
+    /// Values are those of updatedItem mapped to TModel, so the conversions of UpdateAsync apply.
+    /// </summary>
+    /// <param name="updatedItem">The values to write</param>
+    /// <param name="fields">The names of the properties to write, at least one</param>
+    /// <returns>The setters of ExecuteUpdateAsync</returns>
+    protected Expression<Func<SetPropertyCalls<TModel>, SetPropertyCalls<TModel>>> BuildSetters(TSetter updatedItem, List<string>? fields)
+    {
+        if (fields == null || fields.Count == 0)
+        {
+            throw new Error400Exception("Fields are required");
+        }
+
+        var writable = _dbContext.Model.FindEntityType(typeof(TModel))!.GetProperties()
+            .Where(property => !property.IsPrimaryKey() && property.PropertyInfo != null && typeof(TSetter).GetProperty(property.Name) != null)
+            .ToDictionary(property => property.Name, StringComparer.OrdinalIgnoreCase);
+        var properties = fields
+            .Distinct(StringComparer.OrdinalIgnoreCase)
+            .Select(field => writable.GetValueOrDefault(field) ?? throw new Error400Exception($"Field '{field}' can not be updated"))
+            .ToList();
+        var values = ToModel(updatedItem);
+
+        var setPropertyMethod = typeof(SetPropertyCalls<TModel>).GetMethods()
+            .Single(method => method.Name == nameof(SetPropertyCalls<TModel>.SetProperty) && method.GetParameters()[1].ParameterType.IsGenericParameter);
+
+        var calls = Expression.Parameter(typeof(SetPropertyCalls<TModel>), "calls");
+        Expression body = calls;
+
+        foreach (var property in properties)
+        {
+            var item = Expression.Parameter(typeof(TModel), "item");
+            var selector = Expression.Lambda(
+                typeof(Func<,>).MakeGenericType(typeof(TModel), property.ClrType),
+                Expression.Property(item, property.PropertyInfo!),
+                item);
+            var value = Expression.Constant(property.PropertyInfo!.GetValue(values), property.ClrType);
+
+            body = Expression.Call(body, setPropertyMethod.MakeGenericMethod(property.ClrType), selector, value);
+        }
+
+        return Expression.Lambda<Func<SetPropertyCalls<TModel>, SetPropertyCalls<TModel>>>(body, calls);
+    }
+
+    /// <summary>
+    /// Reject the ids of a batch when there are none or more than BatchLimit
+    /// </summary>
+    /// <param name="ids">The ids of the batch</param>
+    protected void CheckBatch<TKey>(List<TKey>? ids)
     {
-        return QueryBuilder<TModel>.Apply(_dbModel.AsQueryable(), filters, relations);
+        if (ids == null || ids.Count == 0)
+        {
+            throw new Error400Exception("Ids are required");
+        }
+
+        if (ids.Count > BatchLimit)
+        {
+            throw new Error400Exception($"At most {BatchLimit} ids are allowed per batch");
+        }
     }
 
-    public async Task<List<TGetter>> GetAllAsync()
+    /// <summary>
+    /// The meta of a seek page
+    /// </summary>
+    /// <param name="rows">The number of rows of the page</param>
+    /// <param name="lastKey">The key of the page's last item, null when there is no next page</param>
+    /// <returns>The page meta with the next continuation token</returns>
+    protected static SeekMetaDto SeekMeta(int rows, object? lastKey)
     {
-        return _mapper.Map<List<TGetter>>(await _dbModel.ToListAsync());
+        return new SeekMetaDto
+        {
+            Rows = rows,
+            Next = lastKey == null ? null : SeekToken.Encode(Convert.ToString(lastKey, CultureInfo.InvariantCulture)!)
+        };
     }
 
-    public async Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    /// <summary>
+    /// Find an item by its id for a read path. FindAsync always tracks, so untracked reads query the primary key instead.
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>The item, or null when not found</returns>
+    protected virtual async Task<TModel?> FindForReadAsync(long id)
+    {
+        if (ReadTracking == QueryTrackingBehavior.TrackAll)
+        {
+            return await _dbModel.FindAsync(id);
+        }
+
+        var key = GetKeyName();
+        return await ReadQuery().FirstOrDefaultAsync(item => EF.Property<long>(item, key) == id);
+    }
+
+    /// <summary>
+    /// Find an item by its id for a read path. FindAsync always tracks, so untracked reads query the primary key instead.
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>The item, or null when not found</returns>
+    protected virtual async Task<TModel?> FindForReadAsync(string id)
+    {
+        if (ReadTracking == QueryTrackingBehavior.TrackAll)
+        {
+            return await _dbModel.FindAsync(id);
+        }
+
+        var key = GetKeyName();
+        return await ReadQuery().FirstOrDefaultAsync(item => EF.Property<string>(item, key) == id);
+    }
+
+    /// <summary>
+    /// Find an item by its id for a write path, the item is tracked
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>The item, or null when not found</returns>
+    protected virtual async Task<TModel?> FindForWriteAsync(long id)
+    {
+        return await _dbModel.FindAsync(id);
+    }
+
+    /// <summary>
+    /// Find an item by its id for a write path, the item is tracked
+    /// </summary>
+    /// <param name="id">The id of the item</param>
+    /// <returns>The item, or null when not found</returns>
+    protected virtual async Task<TModel?> FindForWriteAsync(string id)
+    {
+        return await _dbModel.FindAsync(id);
+    }
+
+    /// <summary>
+    /// Apply an include profile to a query
+    /// </summary>
+    /// <param name="query">The query to include the related data in</param>
+    /// <param name="include">The include profile name, none when empty</param>
+    /// <returns>The query with the profile's related data included</returns>
+    protected IQueryable<TModel> Include(IQueryable<TModel> query, string? include)
+    {
+        if (string.IsNullOrEmpty(include))
+        {
+            return query;
+        }
+
+        if (Includes == null)
+        {
+            throw new Error400Exception($"{typeof(TModel).Name} has no include profiles");
+        }
+
+        return Includes.Apply(query, include);
+    }
+
+    public virtual IQueryable<TModel> Query(string filters = "", string include = "")
+    {
+        return QueryBuilder<TModel>.Apply(Include(ReadQuery(), include), filters, "", Filters);
+    }
+
+    public virtual async Task<List<TGetter>> GetAllAsync()
+    {
+        return ToGetters(await ReadQuery().ToListAsync());
+    }
+
+    public virtual async Task<List<TGetter>> QueryAsync(string filters = "", string include = "")
+    {
+        return ToGetters(await Query(filters, include).ToListAsync());
+    }
+
+    public virtual IAsyncEnumerable<TGetter> StreamAllAsync(Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        // Projected, so untracked whatever ReadTracking is, the change tracker would otherwise hold every row
+        IQueryable<TModel> rawQuery = _dbModel;
+
+        if (query != null)
+        {
+            rawQuery = query(rawQuery);
+        }
+
+        return Project(rawQuery).AsAsyncEnumerable();
+    }
+
+    public virtual async Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
     {
         // Get raw query
-        var rawQuery = _dbModel.AsQueryable();
+        var rawQuery = ReadQuery();
 
         if (query != null)
         {
@@ -52,7 +430,7 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
             .Take(rows)
             .ToListAsync();
 
-        var result = _mapper.Map<List<TGetter>>(items);
+        var result = ToGetters(items);
 
         return new PaginationResponseDto<TGetter>
         {
@@ -66,54 +444,111 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
         };
     }
     
-    public async Task<List<TGetter>> GetByChunk(int page, int rows)
+    public virtual async Task<List<TGetter>> GetByChunk(int page, int rows)
     {
-        return _mapper.Map<List<TGetter>>(await _dbModel.Skip(page * rows).Take(rows).ToListAsync());
+        return ToGetters(await ReadQuery().Skip(page * rows).Take(rows).ToListAsync());
     }
 
-    public async Task<TGetter?> GetAsync(long id)
+    public virtual async Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
-        return _mapper.Map<TGetter>(item);
+        // Get raw query
+        var rawQuery = ReadQuery();
+
+        if (query != null)
+        {
+            rawQuery = query(rawQuery);
+        }
+
+        var items = await SeekQuery(rawQuery, after, rows).ToListAsync();
+        var lastKey = items.Count > rows ? GetKey().PropertyInfo?.GetValue(items[rows - 1]) : null;
+
+        return new SeekResponseDto<TGetter>
+        {
+            Data = ToGetters(items.Take(rows).ToList()),
+            SeekMeta = SeekMeta(rows, lastKey)
+        };
     }
 
-    public async Task<TGetter?> GetAsync(string id)
+    public virtual async Task<TGetter?> GetAsync(long id)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
-        return _mapper.Map<TGetter>(item);
+        var item = await FindForReadAsync(id) ?? throw new Error404Exception("Item not found");
+        return ToGetter(item);
     }
 
-    public async Task<TGetter?> CreateAsync(TSetter newItem)
+    public virtual async Task<TGetter?> GetAsync(string id)
     {
-        var item = _mapper.Map<TModel>(newItem);
+        var item = await FindForReadAsync(id) ?? throw new Error404Exception("Item not found");
+        return ToGetter(item);
+    }
+
+    public virtual async Task<bool> ExistsAsync(long id)
+    {
+        var key = GetKeyName();
+        return await _dbModel.AnyAsync(item => EF.Property<long>(item, key) == id);
+    }
+
+    public virtual async Task<bool> ExistsAsync(string id)
+    {
+        var key = GetKeyName();
+        return await _dbModel.AnyAsync(item => EF.Property<string>(item, key) == id);
+    }
+
+    public virtual async Task<TGetter?> CreateAsync(TSetter newItem)
+    {
+        var item = ToModel(newItem);
 
         await _dbModel.AddAsync(item);
         if (!await Save())
         {
             throw new Error400Exception("Failed to create item");
         }
-        return _mapper.Map<TGetter>(item);
+        return ToGetter(item);
     }
 
-    public async Task<List<TGetter>> CreateAllAsync(List<TSetter> newItems)
+    public virtual async Task<List<TGetter>> CreateAllAsync(List<TSetter> newItems)
     {
-        var items = _mapper.Map<List<TModel>>(newItems);
+        if (newItems.Count == 0)
+        {
+            throw new Error400Exception("Failed to create items");
+        }
 
-        await _dbModel.AddRangeAsync(items);
+        var result = new List<TGetter>(newItems.Count);
 
-        if (!await Save())
+        // Every chunk is saved and detached before the next one, all of them in one transaction
+        await using var transaction = _dbContext.Database.CurrentTransaction == null ? await _dbContext.Database.BeginTransactionAsync() : null;
+
+        foreach (var chunk in newItems.Chunk(InsertBatchSize))
         {
-            throw new Error400Exception("Failed to create items");
+            var items = ToModels(chunk);
+
+            await _dbModel.AddRangeAsync(items);
+
+            if (!await Save())
+            {
+                throw new Error400Exception("Failed to create items");
+            }
+
+            result.AddRange(ToGetters(items));
+
+            foreach (var item in items)
+            {
+                _dbContext.Entry(item).State = EntityState.Detached;
+            }
         }
 
-        return _mapper.Map<List<TGetter>>(items);
+        if (transaction != null)
+        {
+            await transaction.CommitAsync();
+        }
+
+        return result;
     }
 
-    public async Task<TGetter?> UpdateAsync(long id, TSetter updatedItem)
+    public virtual async Task<TGetter?> UpdateAsync(long id, TSetter updatedItem)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
+        var item = await FindForWriteAsync(id) ?? throw new Error404Exception("Item not found");
 
-        _mapper.Map(updatedItem, item);
+        MapInto(updatedItem, item);
 
         _dbModel.Update(item);
 
@@ -121,14 +556,14 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
         {
             throw new Error400Exception("Failed to update item");
         }
-        return _mapper.Map<TGetter>(item);
+        return ToGetter(item);
     }
 
-    public async Task<TGetter?> UpdateAsync(string id, TSetter updatedItem)
+    public virtual async Task<TGetter?> UpdateAsync(string id, TSetter updatedItem)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
+        var item = await FindForWriteAsync(id) ?? throw new Error404Exception("Item not found");
 
-        _mapper.Map(updatedItem, item);
+        MapInto(updatedItem, item);
 
         _dbModel.Update(item);
 
@@ -137,12 +572,12 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
             throw new Error400Exception("Failed to update item");
         }
 
-        return _mapper.Map<TGetter>(item);
+        return ToGetter(item);
     }
 
-    public async Task<bool> DeleteAsync(long id)
+    public virtual async Task<bool> DeleteAsync(long id)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
+        var item = await FindForWriteAsync(id) ?? throw new Error404Exception("Item not found");
         
         _dbModel.Remove(item);
 
@@ -154,9 +589,9 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
         return true;
     }
 
-    public async Task<bool> DeleteAsync(string id)
+    public virtual async Task<bool> DeleteAsync(string id)
     {
-        var item = await _dbModel.FindAsync(id) ?? throw new Error404Exception("Item not found");
+        var item = await FindForWriteAsync(id) ?? throw new Error404Exception("Item not found");
         
         _dbModel.Remove(item);
 
@@ -168,7 +603,52 @@ public class GenericRepository<TModel, TSetter, TGetter> : IGenericRepository<TM
         return true;
     }
 
-    public async Task<bool> Save()
+    public virtual async Task<int> UpdateBatchAsync(List<long> ids, TSetter updatedItem, List<string> fields)
+    {
+        CheckBatch(ids);
+
+        var key = GetKeyName();
+        return await _dbModel.Where(item => ids.Contains(EF.Property<long>(item, key))).ExecuteUpdateAsync(BuildSetters(updatedItem, fields));
+    }
+
+    public virtual async Task<int> UpdateBatchAsync(List<string> ids, TSetter updatedItem, List<string> fields)
+    {
+        CheckBatch(ids);
+
+        var key = GetKeyName();
+        return await _dbModel.Where(item => ids.Contains(EF.Property<string>(item, key))).ExecuteUpdateAsync(BuildSetters(updatedItem, fields));
+    }
+
+    public virtual async Task<int> DeleteBatchAsync(List<long> ids)
+    {
+        CheckBatch(ids);
+
+        var key = GetKeyName();
+        return await _dbModel.Where(item => ids.Contains(EF.Property<long>(item, key))).ExecuteDeleteAsync();
+    }
+
+    public virtual async Task<int> DeleteBatchAsync(List<string> ids)
+    {
+        CheckBatch(ids);
+
+        var key = GetKeyName();
+        return await _dbModel.Where(item => ids.Contains(EF.Property<string>(item, key))).ExecuteDeleteAsync();
+    }
+
+    public virtual async Task<int> DeleteWhereAsync(string filters)
+    {
+        // Unparsed segments are rejected by Parse, no filter at all would delete the whole table
+        var parsed = QueryBuilder<TModel>.Parse(filters);
+
+        if (parsed.Count == 0)
+        {
+            throw new Error400Exception("Filters are required");
+        }
+
+        return await QueryBuilder<TModel>.Apply(_dbModel, parsed, Filters).ExecuteDeleteAsync();
+    }
+
+    public virtual async Task<bool> Save()
     {
         return (await _dbContext.SaveChangesAsync()) > 0;
     }
@@ -0,0 +1,96 @@
+using AutoMapper;
+using APPLICATION.Dto.Response;
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Util;
+using Microsoft.EntityFrameworkCore;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// Generic repository whose list reads are projected to TGetter in SQL, so only the columns of TGetter are selected
+/// and no entity is tracked or mapped in memory.
+/// </summary>
+public class ProjectedRepository<TModel, TSetter, TGetter> : GenericRepository<TModel, TSetter, TGetter> where TModel : class where TSetter : class where TGetter : class
+{
+    public ProjectedRepository(AppDbContext context, IMapper mapper):base(context, mapper)
+    {
+    }
+
+    public override async Task<List<TGetter>> GetAllAsync()
+    {
+        return await Project(ReadQuery()).ToListAsync();
+    }
+
+    public override async Task<List<TGetter>> QueryAsync(string filters = "", string include = "")
+    {
+        // Include profiles are left to the projection, which joins whatever TGetter reads
+        return await Project(QueryBuilder<TModel>.Apply(ReadQuery(), filters, "", Filters)).ToListAsync();
+    }
+
+    public override async Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        // Get raw query
+        var rawQuery = ReadQuery();
+
+        if (query != null)
+        {
+            rawQuery = query(rawQuery);
+        }
+
+        // Calculate total rows
+        var totalRows = await rawQuery.CountAsync();
+
+        // Calculate total pages
+        var totalPages = (int)Math.Ceiling(totalRows / (double)rows);
+
+        // Paginate
+        var result = await Project(rawQuery
+            .Skip((page - 1) * rows)
+            .Take(rows))
+            .ToListAsync();
+
+        return new PaginationResponseDto<TGetter>
+        {
+            Data = result,
+            PaginationMeta = new PaginationMetaDto
+            {
+                Page = page,
+                Rows = rows,
+                TotalPages = totalPages
+            }
+        };
+    }
+
+    public override async Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        // The next token is read from TGetter's copy of the key, without one the entities are read instead
+        var getterKey = typeof(TGetter).GetProperty(GetKeyName());
+
+        if (getterKey == null)
+        {
+            return await base.Seek(after, rows, query);
+        }
+
+        // Get raw query
+        var rawQuery = ReadQuery();
+
+        if (query != null)
+        {
+            rawQuery = query(rawQuery);
+        }
+
+        var items = await Project(SeekQuery(rawQuery, after, rows)).ToListAsync();
+        var lastKey = items.Count > rows ? getterKey.GetValue(items[rows - 1]) : null;
+
+        return new SeekResponseDto<TGetter>
+        {
+            Data = items.Take(rows).ToList(),
+            SeekMeta = SeekMeta(rows, lastKey)
+        };
+    }
+
+    public override async Task<List<TGetter>> GetByChunk(int page, int rows)
+    {
+        return await Project(ReadQuery().Skip(page * rows).Take(rows)).ToListAsync();
+    }
+}
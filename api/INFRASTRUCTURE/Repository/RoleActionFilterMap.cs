@@ -0,0 +1,33 @@
+
+using INFRASTRUCTURE.Util;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// The filterable fields of RoleAction and of the models it navigates to.
+/// </summary>
+public class RoleActionFilterMap : FilterMap<RoleAction>
+{
+    public static readonly RoleActionFilterMap Instance = new();
+
+    private RoleActionFilterMap()
+    {
+        Add("Id", new FilterField<RoleAction, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.Id == value,
+            Ne = value => item => item.Id != value,
+            Gt = value => item => item.Id > value,
+            Gte = value => item => item.Id >= value,
+            Lt = value => item => item.Id < value,
+            Lte = value => item => item.Id <= value,
+            Between = (low, high) => item => item.Id >= low && item.Id <= high
+        });
+        Add("Name", new FilterField<RoleAction, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Name == value,
+            Ne = value => item => item.Name != value,
+            Contains = value => item => item.Name.Contains(value)
+        });
+    }
+}
@@ -1,8 +1,10 @@
+
 using APPLICATION.Dto.RoleAction;
 using APPLICATION.IRepository;
 using AutoMapper;
 using DOMAIN.Model;
 using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Util;
 
 namespace INFRASTRUCTURE.Repository;
 
@@ -11,4 +13,7 @@ public class RoleActionRepository:GenericRepository<RoleAction, RoleActionDto, G
     public RoleActionRepository(AppDbContext context, IMapper mapper):base(context, mapper)
     {
     }
+
+    protected override FilterMap<RoleAction> Filters => RoleActionFilterMap.Instance;
 }
+
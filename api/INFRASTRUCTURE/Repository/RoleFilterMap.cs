@@ -0,0 +1,33 @@
+
+using INFRASTRUCTURE.Util;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// The filterable fields of Role and of the models it navigates to.
+/// </summary>
+public class RoleFilterMap : FilterMap<Role>
+{
+    public static readonly RoleFilterMap Instance = new();
+
+    private RoleFilterMap()
+    {
+        Add("Id", new FilterField<Role, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.Id == value,
+            Ne = value => item => item.Id != value,
+            Gt = value => item => item.Id > value,
+            Gte = value => item => item.Id >= value,
+            Lt = value => item => item.Id < value,
+            Lte = value => item => item.Id <= value,
+            Between = (low, high) => item => item.Id >= low && item.Id <= high
+        });
+        Add("Name", new FilterField<Role, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Name == value,
+            Ne = value => item => item.Name != value,
+            Contains = value => item => item.Name.Contains(value)
+        });
+    }
+}
@@ -1,8 +1,12 @@
+
 using APPLICATION.Dto.Role;
 using APPLICATION.IRepository;
+using APPLICATION.Mapper;
 using AutoMapper;
 using DOMAIN.Model;
 using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Util;
+using Microsoft.EntityFrameworkCore;
 
 namespace INFRASTRUCTURE.Repository;
 
@@ -11,4 +15,35 @@ public class RoleRepository:GenericRepository<Role, RoleDto, GetRoleDto>, IRoleR
     public RoleRepository(AppDbContext context, IMapper mapper):base(context, mapper)
     {
     }
-}
\ No newline at end of file
+
+    protected override QueryTrackingBehavior ReadTracking => QueryTrackingBehavior.NoTracking;
+
+    protected override FilterMap<Role> Filters => RoleFilterMap.Instance;
+
+    protected override IModelMapper<Role, RoleDto, GetRoleDto> ModelMapper => RoleModelMapper.Instance;
+
+    private static readonly Func<AppDbContext, long, Task<Role?>> FindByKeyQuery =
+        EF.CompileAsyncQuery((AppDbContext context, long id) => context.Set<Role>().FirstOrDefault(item => item.Id == id));
+
+    private static readonly Func<AppDbContext, long, Task<Role?>> FindByKeyForReadQuery =
+        EF.CompileAsyncQuery((AppDbContext context, long id) => context.Set<Role>().AsNoTracking().FirstOrDefault(item => item.Id == id));
+
+    private static readonly Func<AppDbContext, long, Task<bool>> ExistsQuery =
+        EF.CompileAsyncQuery((AppDbContext context, long id) => context.Set<Role>().Any(item => item.Id == id));
+
+    protected override async Task<Role?> FindForReadAsync(long id)
+    {
+        return await FindByKeyForReadQuery(_dbContext, id);
+    }
+
+    protected override async Task<Role?> FindForWriteAsync(long id)
+    {
+        return await FindByKeyQuery(_dbContext, id);
+    }
+
+    public override async Task<bool> ExistsAsync(long id)
+    {
+        return await ExistsQuery(_dbContext, id);
+    }
+}
+
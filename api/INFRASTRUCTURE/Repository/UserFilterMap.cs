@@ -0,0 +1,121 @@
+
+using INFRASTRUCTURE.Util;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// The filterable fields of User and of the models it navigates to.
+/// </summary>
+public class UserFilterMap : FilterMap<User>
+{
+    public static readonly UserFilterMap Instance = new();
+
+    private UserFilterMap()
+    {
+        Add("Id", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Id == value,
+            Ne = value => item => item.Id != value,
+            Contains = value => item => item.Id.Contains(value)
+        });
+        Add("UserName", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.UserName == value,
+            Ne = value => item => item.UserName != value,
+            Contains = value => item => item.UserName!.Contains(value)
+        });
+        Add("NormalizedUserName", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.NormalizedUserName == value,
+            Ne = value => item => item.NormalizedUserName != value,
+            Contains = value => item => item.NormalizedUserName!.Contains(value)
+        });
+        Add("Email", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Email == value,
+            Ne = value => item => item.Email != value,
+            Contains = value => item => item.Email!.Contains(value)
+        });
+        Add("NormalizedEmail", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.NormalizedEmail == value,
+            Ne = value => item => item.NormalizedEmail != value,
+            Contains = value => item => item.NormalizedEmail!.Contains(value)
+        });
+        Add("EmailConfirmed", new FilterField<User, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.EmailConfirmed == value,
+            Ne = value => item => item.EmailConfirmed != value
+        });
+        Add("PhoneNumber", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.PhoneNumber == value,
+            Ne = value => item => item.PhoneNumber != value,
+            Contains = value => item => item.PhoneNumber!.Contains(value)
+        });
+        Add("PhoneNumberConfirmed", new FilterField<User, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.PhoneNumberConfirmed == value,
+            Ne = value => item => item.PhoneNumberConfirmed != value
+        });
+        Add("TwoFactorEnabled", new FilterField<User, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.TwoFactorEnabled == value,
+            Ne = value => item => item.TwoFactorEnabled != value
+        });
+        Add("LockoutEnd", new FilterField<User, DateTimeOffset>(FilterValue.DateTimeOffset)
+        {
+            Eq = value => item => item.LockoutEnd == value,
+            Ne = value => item => item.LockoutEnd != value,
+            Gt = value => item => item.LockoutEnd > value,
+            Gte = value => item => item.LockoutEnd >= value,
+            Lt = value => item => item.LockoutEnd < value,
+            Lte = value => item => item.LockoutEnd <= value,
+            Between = (low, high) => item => item.LockoutEnd >= low && item.LockoutEnd <= high
+        });
+        Add("LockoutEnabled", new FilterField<User, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.LockoutEnabled == value,
+            Ne = value => item => item.LockoutEnabled != value
+        });
+        Add("AccessFailedCount", new FilterField<User, int>(FilterValue.Int)
+        {
+            Eq = value => item => item.AccessFailedCount == value,
+            Ne = value => item => item.AccessFailedCount != value,
+            Gt = value => item => item.AccessFailedCount > value,
+            Gte = value => item => item.AccessFailedCount >= value,
+            Lt = value => item => item.AccessFailedCount < value,
+            Lte = value => item => item.AccessFailedCount <= value,
+            Between = (low, high) => item => item.AccessFailedCount >= low && item.AccessFailedCount <= high
+        });
+        Add("FirstName", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.FirstName == value,
+            Ne = value => item => item.FirstName != value,
+            Contains = value => item => item.FirstName.Contains(value)
+        });
+        Add("LastName", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.LastName == value,
+            Ne = value => item => item.LastName != value,
+            Contains = value => item => item.LastName.Contains(value)
+        });
+        Add("Address", new FilterField<User, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Address == value,
+            Ne = value => item => item.Address != value,
+            Contains = value => item => item.Address.Contains(value)
+        });
+        Add("BirthDate", new FilterField<User, DateTime>(FilterValue.DateTime)
+        {
+            Eq = value => item => item.BirthDate == value,
+            Ne = value => item => item.BirthDate != value,
+            Gt = value => item => item.BirthDate > value,
+            Gte = value => item => item.BirthDate >= value,
+            Lt = value => item => item.BirthDate < value,
+            Lte = value => item => item.BirthDate <= value,
+            Between = (low, high) => item => item.BirthDate >= low && item.BirthDate <= high
+        });
+    }
+}
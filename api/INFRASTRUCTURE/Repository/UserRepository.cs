@@ -1,14 +1,32 @@
+
+using System.Linq.Expressions;
 using APPLICATION.Dto.User;
 using APPLICATION.IRepository;
 using AutoMapper;
 using DOMAIN.Model;
 using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Util;
 
 namespace INFRASTRUCTURE.Repository;
 
-public class UserRepository:GenericRepository<User, UserDto, GetUserDto>, IUserRepository
+public class UserRepository:ProjectedRepository<User, UserDto, GetUserDto>, IUserRepository
 {
     public UserRepository(AppDbContext context, IMapper mapper):base(context, mapper)
     {
     }
-}
\ No newline at end of file
+
+    protected override FilterMap<User> Filters => UserFilterMap.Instance;
+
+    protected override Expression<Func<User, GetUserDto>> Projection => item => new GetUserDto
+    {
+        Id = item.Id,
+        Email = item.Email,
+        UserName = item.UserName,
+        PhoneNumber = item.PhoneNumber,
+        FirstName = item.FirstName,
+        LastName = item.LastName,
+        Address = item.Address,
+        BirthDate = item.BirthDate
+    };
+}
+
@@ -0,0 +1,189 @@
+
+using INFRASTRUCTURE.Util;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// The filterable fields of UserXAccess and of the models it navigates to.
+/// </summary>
+public class UserXAccessFilterMap : FilterMap<UserXAccess>
+{
+    public static readonly UserXAccessFilterMap Instance = new();
+
+    private UserXAccessFilterMap()
+    {
+        Add("Id", new FilterField<UserXAccess, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.Id == value,
+            Ne = value => item => item.Id != value,
+            Gt = value => item => item.Id > value,
+            Gte = value => item => item.Id >= value,
+            Lt = value => item => item.Id < value,
+            Lte = value => item => item.Id <= value,
+            Between = (low, high) => item => item.Id >= low && item.Id <= high
+        });
+        Add("UserId", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.UserId == value,
+            Ne = value => item => item.UserId != value,
+            Contains = value => item => item.UserId.Contains(value)
+        });
+        Add("User.Id", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.Id == value,
+            Ne = value => item => item.User.Id != value,
+            Contains = value => item => item.User.Id.Contains(value)
+        });
+        Add("User.UserName", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.UserName == value,
+            Ne = value => item => item.User.UserName != value,
+            Contains = value => item => item.User.UserName!.Contains(value)
+        });
+        Add("User.NormalizedUserName", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.NormalizedUserName == value,
+            Ne = value => item => item.User.NormalizedUserName != value,
+            Contains = value => item => item.User.NormalizedUserName!.Contains(value)
+        });
+        Add("User.Email", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.Email == value,
+            Ne = value => item => item.User.Email != value,
+            Contains = value => item => item.User.Email!.Contains(value)
+        });
+        Add("User.NormalizedEmail", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.NormalizedEmail == value,
+            Ne = value => item => item.User.NormalizedEmail != value,
+            Contains = value => item => item.User.NormalizedEmail!.Contains(value)
+        });
+        Add("User.EmailConfirmed", new FilterField<UserXAccess, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.User.EmailConfirmed == value,
+            Ne = value => item => item.User.EmailConfirmed != value
+        });
+        Add("User.PhoneNumber", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.PhoneNumber == value,
+            Ne = value => item => item.User.PhoneNumber != value,
+            Contains = value => item => item.User.PhoneNumber!.Contains(value)
+        });
+        Add("User.PhoneNumberConfirmed", new FilterField<UserXAccess, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.User.PhoneNumberConfirmed == value,
+            Ne = value => item => item.User.PhoneNumberConfirmed != value
+        });
+        Add("User.TwoFactorEnabled", new FilterField<UserXAccess, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.User.TwoFactorEnabled == value,
+            Ne = value => item => item.User.TwoFactorEnabled != value
+        });
+        Add("User.LockoutEnd", new FilterField<UserXAccess, DateTimeOffset>(FilterValue.DateTimeOffset)
+        {
+            Eq = value => item => item.User.LockoutEnd == value,
+            Ne = value => item => item.User.LockoutEnd != value,
+            Gt = value => item => item.User.LockoutEnd > value,
+            Gte = value => item => item.User.LockoutEnd >= value,
+            Lt = value => item => item.User.LockoutEnd < value,
+            Lte = value => item => item.User.LockoutEnd <= value,
+            Between = (low, high) => item => item.User.LockoutEnd >= low && item.User.LockoutEnd <= high
+        });
+        Add("User.LockoutEnabled", new FilterField<UserXAccess, bool>(FilterValue.Bool)
+        {
+            Eq = value => item => item.User.LockoutEnabled == value,
+            Ne = value => item => item.User.LockoutEnabled != value
+        });
+        Add("User.AccessFailedCount", new FilterField<UserXAccess, int>(FilterValue.Int)
+        {
+            Eq = value => item => item.User.AccessFailedCount == value,
+            Ne = value => item => item.User.AccessFailedCount != value,
+            Gt = value => item => item.User.AccessFailedCount > value,
+            Gte = value => item => item.User.AccessFailedCount >= value,
+            Lt = value => item => item.User.AccessFailedCount < value,
+            Lte = value => item => item.User.AccessFailedCount <= value,
+            Between = (low, high) => item => item.User.AccessFailedCount >= low && item.User.AccessFailedCount <= high
+        });
+        Add("User.FirstName", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.FirstName == value,
+            Ne = value => item => item.User.FirstName != value,
+            Contains = value => item => item.User.FirstName.Contains(value)
+        });
+        Add("User.LastName", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.LastName == value,
+            Ne = value => item => item.User.LastName != value,
+            Contains = value => item => item.User.LastName.Contains(value)
+        });
+        Add("User.Address", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.User.Address == value,
+            Ne = value => item => item.User.Address != value,
+            Contains = value => item => item.User.Address.Contains(value)
+        });
+        Add("User.BirthDate", new FilterField<UserXAccess, DateTime>(FilterValue.DateTime)
+        {
+            Eq = value => item => item.User.BirthDate == value,
+            Ne = value => item => item.User.BirthDate != value,
+            Gt = value => item => item.User.BirthDate > value,
+            Gte = value => item => item.User.BirthDate >= value,
+            Lt = value => item => item.User.BirthDate < value,
+            Lte = value => item => item.User.BirthDate <= value,
+            Between = (low, high) => item => item.User.BirthDate >= low && item.User.BirthDate <= high
+        });
+        Add("RoleId", new FilterField<UserXAccess, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.RoleId == value,
+            Ne = value => item => item.RoleId != value,
+            Gt = value => item => item.RoleId > value,
+            Gte = value => item => item.RoleId >= value,
+            Lt = value => item => item.RoleId < value,
+            Lte = value => item => item.RoleId <= value,
+            Between = (low, high) => item => item.RoleId >= low && item.RoleId <= high
+        });
+        Add("Role.Id", new FilterField<UserXAccess, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.Role.Id == value,
+            Ne = value => item => item.Role.Id != value,
+            Gt = value => item => item.Role.Id > value,
+            Gte = value => item => item.Role.Id >= value,
+            Lt = value => item => item.Role.Id < value,
+            Lte = value => item => item.Role.Id <= value,
+            Between = (low, high) => item => item.Role.Id >= low && item.Role.Id <= high
+        });
+        Add("Role.Name", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.Role.Name == value,
+            Ne = value => item => item.Role.Name != value,
+            Contains = value => item => item.Role.Name.Contains(value)
+        });
+        Add("RoleActionId", new FilterField<UserXAccess, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.RoleActionId == value,
+            Ne = value => item => item.RoleActionId != value,
+            Gt = value => item => item.RoleActionId > value,
+            Gte = value => item => item.RoleActionId >= value,
+            Lt = value => item => item.RoleActionId < value,
+            Lte = value => item => item.RoleActionId <= value,
+            Between = (low, high) => item => item.RoleActionId >= low && item.RoleActionId <= high
+        });
+        Add("RoleAction.Id", new FilterField<UserXAccess, long>(FilterValue.Long)
+        {
+            Eq = value => item => item.RoleAction.Id == value,
+            Ne = value => item => item.RoleAction.Id != value,
+            Gt = value => item => item.RoleAction.Id > value,
+            Gte = value => item => item.RoleAction.Id >= value,
+            Lt = value => item => item.RoleAction.Id < value,
+            Lte = value => item => item.RoleAction.Id <= value,
+            Between = (low, high) => item => item.RoleAction.Id >= low && item.RoleAction.Id <= high
+        });
+        Add("RoleAction.Name", new FilterField<UserXAccess, string>(FilterValue.String)
+        {
+            Eq = value => item => item.RoleAction.Name == value,
+            Ne = value => item => item.RoleAction.Name != value,
+            Contains = value => item => item.RoleAction.Name.Contains(value)
+        });
+    }
+}
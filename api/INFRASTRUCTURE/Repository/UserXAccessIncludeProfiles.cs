@@ -0,0 +1,22 @@
+
+using Microsoft.EntityFrameworkCore;
+using INFRASTRUCTURE.Util;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Repository;
+
+/// <summary>
+/// The navigations of UserXAccess Query may include, by profile name.
+/// </summary>
+public class UserXAccessIncludeProfiles : IncludeProfiles<UserXAccess>
+{
+    public static readonly UserXAccessIncludeProfiles Instance = new();
+
+    private UserXAccessIncludeProfiles()
+    {
+        Add("User", query => query.Include(item => item.User));
+        Add("Role", query => query.Include(item => item.Role));
+        Add("RoleAction", query => query.Include(item => item.RoleAction));
+        Add("All", query => query.Include(item => item.User).Include(item => item.Role).Include(item => item.RoleAction));
+    }
+}
@@ -1,8 +1,11 @@
+
 using APPLICATION.Dto.UserXAccess;
 using APPLICATION.IRepository;
+using APPLICATION.Mapper;
 using AutoMapper;
 using DOMAIN.Model;
 using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Util;
 
 namespace INFRASTRUCTURE.Repository;
 
@@ -11,4 +14,11 @@ public class UserXAccessRepository:GenericRepository<UserXAccess, UserXAccessDto
     public UserXAccessRepository(AppDbContext context, IMapper mapper):base(context, mapper)
     {
     }
-}
\ No newline at end of file
+
+    protected override FilterMap<UserXAccess> Filters => UserXAccessFilterMap.Instance;
+
+    protected override IncludeProfiles<UserXAccess> Includes => UserXAccessIncludeProfiles.Instance;
+
+    protected override IModelMapper<UserXAccess, UserXAccessDto, GetUserXAccessDto> ModelMapper => UserXAccessModelMapper.Instance;
+}
+
@@ -0,0 +1,142 @@
+using APPLICATION.IService;
+using APPLICATION.Dto.Response;
+
+namespace INFRASTRUCTURE.Service;
+
+/// <summary>
+/// Read-through cache decorator of a model's service. GetAsync, GetAllAsync and QueryAsync are cached in the model's
+/// ServiceCache, every write through the decorator invalidates it, the other reads go to the service.
+/// </summary>
+public class CachedService <TModel, TSetter, TGetter> : IGenericService<TModel, TSetter, TGetter> where TModel : class where TSetter : class where TGetter : class
+{
+    protected readonly IGenericService<TModel, TSetter, TGetter> _service;
+    protected readonly ServiceCache<TModel> _cache;
+
+    public CachedService(IGenericService<TModel, TSetter, TGetter> service, ServiceCache<TModel> cache)
+    {
+        _service = service;
+        _cache = cache;
+    }
+
+    public async Task<List<TGetter>> GetAllAsync()
+    {
+        return await _cache.GetOrReadAsync("all", () => _service.GetAllAsync(), items => items.Count);
+    }
+
+    public async Task<List<TGetter>> QueryAsync(string filters = "", string include = "")
+    {
+        return await _cache.GetOrReadAsync($"query:{filters}\n{include}", () => _service.QueryAsync(filters, include), items => items.Count);
+    }
+
+    public IAsyncEnumerable<TGetter> StreamAllAsync(Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        return _service.StreamAllAsync(query);
+    }
+
+    public async Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        return await _service.Paginate(page, rows, query);
+    }
+
+    public async Task<List<TGetter>> GetByChunk(int page, int rows)
+    {
+        return await _service.GetByChunk(page, rows);
+    }
+
+    public async Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        return await _service.Seek(after, rows, query);
+    }
+
+    public async Task<TGetter?> GetAsync(long id)
+    {
+        return await _cache.GetOrReadAsync($"get:{id}", () => _service.GetAsync(id), _ => 1);
+    }
+
+    public async Task<TGetter?> GetAsync(string id)
+    {
+        return await _cache.GetOrReadAsync($"get:{id}", () => _service.GetAsync(id), _ => 1);
+    }
+
+    public async Task<bool> ExistsAsync(long id)
+    {
+        return await _service.ExistsAsync(id);
+    }
+
+    public async Task<bool> ExistsAsync(string id)
+    {
+        return await _service.ExistsAsync(id);
+    }
+
+    public async Task<TGetter?> CreateAsync(TSetter newItem)
+    {
+        return await Invalidate(_service.CreateAsync(newItem));
+    }
+
+    public async Task<List<TGetter>> CreateAllAsync(List<TSetter> newItems)
+    {
+        return await Invalidate(_service.CreateAllAsync(newItems));
+    }
+
+    public async Task<TGetter?> UpdateAsync(long id, TSetter updatedItem)
+    {
+        return await Invalidate(_service.UpdateAsync(id, updatedItem));
+    }
+
+    public async Task<TGetter?> UpdateAsync(string id, TSetter updatedItem)
+    {
+        return await Invalidate(_service.UpdateAsync(id, updatedItem));
+    }
+
+    public async Task<bool> DeleteAsync(long id)
+    {
+        return await Invalidate(_service.DeleteAsync(id));
+    }
+
+    public async Task<bool> DeleteAsync(string id)
+    {
+        return await Invalidate(_service.DeleteAsync(id));
+    }
+
+    public async Task<int> UpdateBatchAsync(List<long> ids, TSetter updatedItem, List<string> fields)
+    {
+        return await Invalidate(_service.UpdateBatchAsync(ids, updatedItem, fields));
+    }
+
+    public async Task<int> UpdateBatchAsync(List<string> ids, TSetter updatedItem, List<string> fields)
+    {
+        return await Invalidate(_service.UpdateBatchAsync(ids, updatedItem, fields));
+    }
+
+    public async Task<int> DeleteBatchAsync(List<long> ids)
+    {
+        return await Invalidate(_service.DeleteBatchAsync(ids));
+    }
+
+    public async Task<int> DeleteBatchAsync(List<string> ids)
+    {
+        return await Invalidate(_service.DeleteBatchAsync(ids));
+    }
+
+    public async Task<int> DeleteWhereAsync(string filters)
+    {
+        return await Invalidate(_service.DeleteWhereAsync(filters));
+    }
+
+    /// <summary>
+    /// Await a write and invalidate the cache, also when the write failed part way
+    /// </summary>
+    /// <param name="write">The write</param>
+    /// <returns>The result of the write</returns>
+    protected async Task<T> Invalidate<T>(Task<T> write)
+    {
+        try
+        {
+            return await write;
+        }
+        finally
+        {
+            _cache.Invalidate();
+        }
+    }
+}
@@ -0,0 +1,23 @@
+using Microsoft.Extensions.DependencyInjection;
+
+namespace INFRASTRUCTURE.Service;
+
+public static class CachedServiceExtensions
+{
+    /// <summary>
+    /// Register TCached as IService, decorating TService, with the model's ServiceCache as a singleton.
+    /// Registered after the SERVICES region, it replaces the plain IService registration.
+    /// </summary>
+    /// <param name="services">The service collection</param>
+    /// <param name="size">The size limit of the cache, in items</param>
+    /// <param name="ttlSeconds">The time to live of a cached value</param>
+    /// <returns>The service collection</returns>
+    public static IServiceCollection AddCachedService<TModel, IService, TService, TCached>(this IServiceCollection services, long size, int ttlSeconds)
+        where IService : class where TService : class, IService where TCached : class, IService
+    {
+        services.AddSingleton(new ServiceCache<TModel>(size, TimeSpan.FromSeconds(ttlSeconds)));
+        services.AddScoped<TService>();
+        services.AddScoped<IService>(provider => ActivatorUtilities.CreateInstance<TCached>(provider, provider.GetRequiredService<TService>()));
+        return services;
+    }
+}
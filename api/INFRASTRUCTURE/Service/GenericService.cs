@@ -18,6 +18,16 @@ public class GenericService <IRepository, TModel, TSetter, TGetter> : IGenericSe
         return await _repository.GetAllAsync();
     }
 
+    public async Task<List<TGetter>> QueryAsync(string filters = "", string include = "")
+    {
+        return await _repository.QueryAsync(filters, include);
+    }
+
+    public IAsyncEnumerable<TGetter> StreamAllAsync(Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        return _repository.StreamAllAsync(query);
+    }
+
     public async Task<PaginationResponseDto<TGetter>> Paginate(int page, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
     {
         return await _repository.Paginate(page, rows, query);
@@ -28,6 +38,11 @@ public class GenericService <IRepository, TModel, TSetter, TGetter> : IGenericSe
         return await _repository.GetByChunk(page, rows);
     }
 
+    public async Task<SeekResponseDto<TGetter>> Seek(string? after, int rows, Func<IQueryable<TModel>, IQueryable<TModel>>? query = null)
+    {
+        return await _repository.Seek(after, rows, query);
+    }
+
     public async Task<TGetter?> GetAsync(long id)
     {
         return await _repository.GetAsync(id);
@@ -38,33 +53,78 @@ public class GenericService <IRepository, TModel, TSetter, TGetter> : IGenericSe
         return await _repository.GetAsync(id);
     }
 
+    public async Task<bool> ExistsAsync(long id)
+    {
+        return await _repository.ExistsAsync(id);
+    }
+
+    public async Task<bool> ExistsAsync(string id)
+    {
+        return await _repository.ExistsAsync(id);
+    }
+
     public async Task<TGetter?> CreateAsync(TSetter newItem)
     {
-        return await _repository.CreateAsync(newItem);
+        return await Write(() => _repository.CreateAsync(newItem));
     }
 
     public async Task<List<TGetter>> CreateAllAsync(List<TSetter> newItems)
     {
-        return await _repository.CreateAllAsync(newItems);
+        return await Write(() => _repository.CreateAllAsync(newItems));
     }
 
     public async Task<TGetter?> UpdateAsync(long id, TSetter updatedItem)
     {
-        return await _repository.UpdateAsync(id, updatedItem);
+        return await Write(() => _repository.UpdateAsync(id, updatedItem));
     }
 
     public async Task<TGetter?> UpdateAsync(string id, TSetter updatedItem)
     {
-        return await _repository.UpdateAsync(id, updatedItem);
+        return await Write(() => _repository.UpdateAsync(id, updatedItem));
     }
 
     public async Task<bool> DeleteAsync(long id)
     {
-        return await _repository.DeleteAsync(id);
+        return await Write(() => _repository.DeleteAsync(id));
     }
 
     public async Task<bool> DeleteAsync(string id)
     {
-       return await _repository.DeleteAsync(id);
+       return await Write(() => _repository.DeleteAsync(id));
+    }
+
+    public async Task<int> UpdateBatchAsync(List<long> ids, TSetter updatedItem, List<string> fields)
+    {
+        return await Write(() => _repository.UpdateBatchAsync(ids, updatedItem, fields));
+    }
+
+    public async Task<int> UpdateBatchAsync(List<string> ids, TSetter updatedItem, List<string> fields)
+    {
+        return await Write(() => _repository.UpdateBatchAsync(ids, updatedItem, fields));
+    }
+
+    public async Task<int> DeleteBatchAsync(List<long> ids)
+    {
+        return await Write(() => _repository.DeleteBatchAsync(ids));
+    }
+
+    public async Task<int> DeleteBatchAsync(List<string> ids)
+    {
+        return await Write(() => _repository.DeleteBatchAsync(ids));
+    }
+
+    public async Task<int> DeleteWhereAsync(string filters)
+    {
+        return await Write(() => _repository.DeleteWhereAsync(filters));
+    }
+
+    /// <summary>
+    /// Run a write of the repository, services override it to react to every change of their model before and after it
+    /// </summary>
+    /// <param name="write">Starts the write</param>
+    /// <returns>The result of the write</returns>
+    protected virtual async Task<T> Write<T>(Func<Task<T>> write)
+    {
+        return await write();
     }
 }
\ No newline at end of file
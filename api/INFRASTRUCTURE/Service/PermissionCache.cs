@@ -0,0 +1,76 @@
+using APPLICATION.Security;
+
+namespace INFRASTRUCTURE.Service;
+
+/// <summary>
+/// The permissions of the CaslAttribute checks: the PermissionIndex of the Role and RoleAction rows and the
+/// PermissionSet of every user. A set holds the index it was read with, so the two never disagree.
+/// Invalidate evicts both, the Role, RoleAction, User and UserXAccess services call it on every write, batch and
+/// filtered deletes included. Writes that bypass those services, or are made by another process, are seen after the TTL.
+/// </summary>
+public sealed class PermissionCache : IDisposable
+{
+    private readonly ServiceCache<PermissionIndex> _index;
+    private readonly ServiceCache<PermissionSet> _users;
+
+    public PermissionCache(long size, TimeSpan ttl)
+    {
+        _index = new ServiceCache<PermissionIndex>(1, ttl);
+        _users = new ServiceCache<PermissionSet>(size, ttl);
+    }
+
+    /// <summary>
+    /// Get the cached index or read and cache it
+    /// </summary>
+    /// <param name="read">Reads the index on a miss</param>
+    /// <returns>The cached or read index</returns>
+    public async Task<PermissionIndex> GetIndexAsync(Func<Task<PermissionIndex>> read)
+    {
+        return await _index.GetOrReadAsync(nameof(PermissionIndex), read, _ => 1);
+    }
+
+    /// <summary>
+    /// Get the cached permissions of a user or read and cache them
+    /// </summary>
+    /// <param name="userId">The id of the user</param>
+    /// <param name="read">Reads the permissions on a miss</param>
+    /// <returns>The cached or read permissions</returns>
+    public async Task<PermissionSet> GetPermissionsAsync(string userId, Func<Task<PermissionSet>> read)
+    {
+        return await _users.GetOrReadAsync(userId, read, _ => 1);
+    }
+
+    /// <summary>
+    /// Evict the index and the permissions of every user
+    /// </summary>
+    public void Invalidate()
+    {
+        _index.Invalidate();
+        _users.Invalidate();
+    }
+
+    /// <summary>
+    /// Run a write evicting before it starts, so no check is served the old bits while it commits,
+    /// and after it ends, so permissions read while it ran are not kept
+    /// </summary>
+    /// <param name="write">Starts the write</param>
+    /// <returns>The result of the write</returns>
+    public async Task<T> Invalidate<T>(Func<Task<T>> write)
+    {
+        Invalidate();
+        try
+        {
+            return await write();
+        }
+        finally
+        {
+            Invalidate();
+        }
+    }
+
+    public void Dispose()
+    {
+        _index.Dispose();
+        _users.Dispose();
+    }
+}
@@ -0,0 +1,16 @@
+
+using APPLICATION.Dto.RoleAction;
+using APPLICATION.IService;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Service;
+
+public class RoleActionCachedService:CachedService<RoleAction, RoleActionDto, GetRoleActionDto>, IRoleActionService
+{
+    public const long CacheSize = 5000;
+    public const int CacheTtlSeconds = 300;
+
+    public RoleActionCachedService(IRoleActionService service, ServiceCache<RoleAction> cache):base(service, cache)
+    {
+    }
+}
@@ -7,7 +7,18 @@ namespace INFRASTRUCTURE.Service;
 
 public class RoleActionService:GenericService<IRoleActionRepository, RoleAction, RoleActionDto, GetRoleActionDto>, IRoleActionService
 {
-    public RoleActionService(IRoleActionRepository repository):base(repository)
+    private readonly PermissionCache _permissions;
+
+    public RoleActionService(IRoleActionRepository repository, PermissionCache permissions):base(repository)
+    {
+        _permissions = permissions;
+    }
+
+    /// <summary>
+    /// Every write of a RoleAction evicts the cached permissions, their bits are numbered from the action names
+    /// </summary>
+    protected override async Task<T> Write<T>(Func<Task<T>> write)
     {
+        return await _permissions.Invalidate(write);
     }
 }
@@ -0,0 +1,16 @@
+
+using APPLICATION.Dto.Role;
+using APPLICATION.IService;
+using DOMAIN.Model;
+
+namespace INFRASTRUCTURE.Service;
+
+public class RoleCachedService:CachedService<Role, RoleDto, GetRoleDto>, IRoleService
+{
+    public const long CacheSize = 1000;
+    public const int CacheTtlSeconds = 300;
+
+    public RoleCachedService(IRoleService service, ServiceCache<Role> cache):base(service, cache)
+    {
+    }
+}
@@ -7,7 +7,18 @@ namespace INFRASTRUCTURE.Service;
 
 public class RoleService:GenericService<IRoleRepository, Role, RoleDto, GetRoleDto>, IRoleService
 {
-    public RoleService(IRoleRepository repository):base(repository)
+    private readonly PermissionCache _permissions;
+
+    public RoleService(IRoleRepository repository, PermissionCache permissions):base(repository)
+    {
+        _permissions = permissions;
+    }
+
+    /// <summary>
+    /// Every write of a Role evicts the cached permissions, their bits are numbered from the role names
+    /// </summary>
+    protected override async Task<T> Write<T>(Func<Task<T>> write)
     {
+        return await _permissions.Invalidate(write);
     }
 }
@@ -0,0 +1,65 @@
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Primitives;
+
+namespace INFRASTRUCTURE.Service;
+
+/// <summary>
+/// An in-process read cache, one singleton per model (a CachedService) or cached type shared by every request scope.
+/// An item counts 1 towards the size limit and a list counts its items, entries expire after the TTL
+/// and Invalidate evicts all of them. The cache lives in the process, other instances are not invalidated.
+/// </summary>
+public sealed class ServiceCache<TModel> : IDisposable
+{
+    private readonly MemoryCache _cache;
+    private readonly TimeSpan _ttl;
+    private CancellationTokenSource _generation = new();
+
+    public ServiceCache(long size, TimeSpan ttl)
+    {
+        _cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = size });
+        _ttl = ttl;
+    }
+
+    /// <summary>
+    /// Get a cached value or read and cache it
+    /// </summary>
+    /// <param name="key">The cache key</param>
+    /// <param name="read">Reads the value on a miss</param>
+    /// <param name="size">The size of the value towards the size limit</param>
+    /// <returns>The cached or read value</returns>
+    public async Task<T> GetOrReadAsync<T>(string key, Func<Task<T>> read, Func<T, long> size)
+    {
+        if (_cache.TryGetValue(key, out T? cached) && cached != null)
+        {
+            return cached;
+        }
+
+        // Taken before the read, a write invalidating during the read expires the value right away
+        var generation = _generation.Token;
+        var value = await read();
+
+        if (value != null)
+        {
+            _cache.Set(key, value, new MemoryCacheEntryOptions
+            {
+                Size = Math.Max(1, size(value)),
+                AbsoluteExpirationRelativeToNow = _ttl
+            }.AddExpirationToken(new CancellationChangeToken(generation)));
+        }
+
+        return value;
+    }
+
+    /// <summary>
+    /// Evict every cached value
+    /// </summary>
+    public void Invalidate()
+    {
+        Interlocked.Exchange(ref _generation, new CancellationTokenSource()).Cancel();
+    }
+
+    public void Dispose()
+    {
+        _cache.Dispose();
+    }
+}
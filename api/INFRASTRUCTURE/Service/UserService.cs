@@ -7,7 +7,18 @@ namespace INFRASTRUCTURE.Service;
 
 public class UserService:GenericService<IUserRepository, User, UserDto, GetUserDto>, IUserService
 {
-    public UserService(IUserRepository repository):base(repository)
+    private readonly PermissionCache _permissions;
+
+    public UserService(IUserRepository repository, PermissionCache permissions):base(repository)
+    {
+        _permissions = permissions;
+    }
+
+    /// <summary>
+    /// Every write of a User evicts the cached permissions, deleting a user deletes its UserXAccess rows
+    /// </summary>
+    protected override async Task<T> Write<T>(Func<Task<T>> write)
     {
+        return await _permissions.Invalidate(write);
     }
 }
\ No newline at end of file
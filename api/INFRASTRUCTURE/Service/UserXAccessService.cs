@@ -1,5 +1,6 @@
 using APPLICATION.Dto.UserXAccess;
 using APPLICATION.IService;
+using APPLICATION.Security;
 using DOMAIN.Model;
 using APPLICATION.IRepository;
 using Microsoft.EntityFrameworkCore;
@@ -9,13 +10,64 @@ namespace INFRASTRUCTURE.Service;
 
 public class UserXAccessService:GenericService<IUserXAccessRepository, UserXAccess, UserXAccessDto, GetUserXAccessDto>, IUserXAccessService
 {
-    public UserXAccessService(IUserXAccessRepository repository):base(repository)
+    private readonly IRoleRepository _roleRepository;
+    private readonly IRoleActionRepository _roleActionRepository;
+    private readonly PermissionCache _permissions;
+
+    public UserXAccessService(IUserXAccessRepository repository, IRoleRepository roleRepository, IRoleActionRepository roleActionRepository, PermissionCache permissions):base(repository)
+    {
+        _roleRepository = roleRepository;
+        _roleActionRepository = roleActionRepository;
+        _permissions = permissions;
+    }
+
+    public async Task<PermissionSet> GetPermissionsAsync(string userId)
+    {
+        return await _permissions.GetPermissionsAsync(userId, async () =>
+        {
+            var index = await GetPermissionIndexAsync();
+            var grants = await _repository.Query()
+                .Where(access => access.UserId == userId)
+                .Select(access => new { access.RoleId, access.RoleActionId })
+                .ToListAsync();
+
+            var permissions = new PermissionSet(index);
+            foreach (var grant in grants)
+            {
+                permissions.Add(grant.RoleId, grant.RoleActionId);
+            }
+
+            return permissions;
+        });
+    }
+
+    /// <summary>
+    /// The bit numbering of the Role and RoleAction rows, so roles and actions created at runtime have bits too
+    /// </summary>
+    private async Task<PermissionIndex> GetPermissionIndexAsync()
+    {
+        return await _permissions.GetIndexAsync(async () =>
+        {
+            var roles = await _roleRepository.Query().Select(role => new { role.Id, role.Name }).ToListAsync();
+            var actions = await _roleActionRepository.Query().Select(action => new { action.Id, action.Name }).ToListAsync();
+
+            return new PermissionIndex(roles.Select(role => (role.Id, role.Name)), actions.Select(action => (action.Id, action.Name)));
+        });
+    }
+
+    /// <summary>
+    /// Every write of a UserXAccess evicts the cached permissions, of all users since a batch write does not say whose
+    /// </summary>
+    protected override async Task<T> Write<T>(Func<Task<T>> write)
     {
+        return await _permissions.Invalidate(write);
     }
 
     public bool UserHasAccess(string userId, string roleName, string action)
     {
-        return _repository.Query($"Id={userId}|Role.Name={roleName}|RoleAction.Name={action}", "Role|RoleAction").Any();
+        // The navigations are only filtered on, the join needs no include profile
+        return _repository.Query()
+            .Any(access => access.UserId == userId && access.Role.Name == roleName && access.RoleAction.Name == action);
     }
 
     public bool UserHasAccess(string userId, string[] allowedRoles)
@@ -0,0 +1,151 @@
+using System.Globalization;
+using System.Linq.Expressions;
+using INFRASTRUCTURE.ExceptionHandler;
+
+namespace INFRASTRUCTURE.Util;
+
+
+/// <summary>
+/// The filterable fields of a model, generated per model by make.py. A field maps each of its operators to a typed
+/// predicate factory, the filter value is captured rather than inlined so EF reuses one query plan for every value.
+/// </summary>
+public abstract class FilterMap<TModel> where TModel : class
+{
+    private readonly Dictionary<string, IFilterField<TModel>> _fields = new(StringComparer.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Whether paths missing from the map are rejected instead of resolved by reflection, the map is a whitelist by default
+    /// </summary>
+    public virtual bool Strict => true;
+
+    protected void Add(string path, IFilterField<TModel> field)
+    {
+        _fields[path] = field;
+    }
+
+    /// <summary>
+    /// Build the predicate of a filter
+    /// </summary>
+    /// <param name="path">The field path, case insensitive</param>
+    /// <param name="op">The operator</param>
+    /// <param name="value">The filter value</param>
+    /// <param name="predicate">The predicate, null when the path is not in the map</param>
+    /// <returns>Whether the path is in the map</returns>
+    public bool TryBuild(string path, string op, string value, out Expression<Func<TModel, bool>>? predicate)
+    {
+        if (!_fields.TryGetValue(path, out var field))
+        {
+            if (Strict)
+            {
+                throw new Error400Exception($"Filtering on '{path}' is not allowed");
+            }
+
+            predicate = null;
+            return false;
+        }
+
+        predicate = field.Build(path, op, value);
+        return true;
+    }
+}
+
+public interface IFilterField<TModel> where TModel : class
+{
+    public Expression<Func<TModel, bool>> Build(string path, string op, string value);
+}
+
+/// <summary>
+/// The operators of one field, the ones left null are not supported by its type
+/// </summary>
+public class FilterField<TModel, TValue> : IFilterField<TModel> where TModel : class
+{
+    private readonly Func<string, TValue> _parse;
+
+    public FilterField(Func<string, TValue> parse)
+    {
+        _parse = parse;
+    }
+
+    public Func<TValue, Expression<Func<TModel, bool>>>? Eq { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Ne { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Gt { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Gte { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Lt { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Lte { get; init; }
+    public Func<TValue, TValue, Expression<Func<TModel, bool>>>? Between { get; init; }
+    public Func<TValue, Expression<Func<TModel, bool>>>? Contains { get; init; }
+
+    public Expression<Func<TModel, bool>> Build(string path, string op, string value)
+    {
+        if (op == "between" && Between != null)
+        {
+            var values = value.Split(',');
+            if (values.Length != 2)
+            {
+                throw new Error400Exception($"Invalid value format for property '{path}'");
+            }
+
+            return Between(Parse(path, values[0]), Parse(path, values[1]));
+        }
+
+        var factory = op switch
+        {
+            "eq" => Eq,
+            "ne" => Ne,
+            "gt" => Gt,
+            "gte" => Gte,
+            "lt" => Lt,
+            "lte" => Lte,
+            "contains" => Contains,
+            _ => null
+        } ?? throw new Error400Exception($"Unsupported operator '{op}' for property '{path}', valid operators are: {string.Join(", ", Operators())}");
+
+        return factory(Parse(path, value));
+    }
+
+    private TValue Parse(string path, string value)
+    {
+        try
+        {
+            return _parse(value);
+        }
+        catch (Exception e) when (e is FormatException || e is OverflowException)
+        {
+            throw new Error400Exception($"Invalid value format for property '{path}'");
+        }
+    }
+
+    private IEnumerable<string> Operators()
+    {
+        if (Eq != null) yield return "eq";
+        if (Ne != null) yield return "ne";
+        if (Gt != null) yield return "gt";
+        if (Gte != null) yield return "gte";
+        if (Lt != null) yield return "lt";
+        if (Lte != null) yield return "lte";
+        if (Between != null) yield return "between";
+        if (Contains != null) yield return "contains";
+    }
+}
+
+/// <summary>
+/// Filter value parsers of the generated filter maps, culture invariant
+/// </summary>
+public static class FilterValue
+{
+    public static string String(string value) => value;
+    public static bool Bool(string value) => bool.Parse(value);
+    public static byte Byte(string value) => byte.Parse(value, CultureInfo.InvariantCulture);
+    public static short Short(string value) => short.Parse(value, CultureInfo.InvariantCulture);
+    public static int Int(string value) => int.Parse(value, CultureInfo.InvariantCulture);
+    public static long Long(string value) => long.Parse(value, CultureInfo.InvariantCulture);
+    public static float Float(string value) => float.Parse(value, CultureInfo.InvariantCulture);
+    public static double Double(string value) => double.Parse(value, CultureInfo.InvariantCulture);
+    public static decimal Decimal(string value) => decimal.Parse(value, CultureInfo.InvariantCulture);
+    public static DateTime DateTime(string value) => System.DateTime.Parse(value, CultureInfo.InvariantCulture);
+    public static DateTimeOffset DateTimeOffset(string value) => System.DateTimeOffset.Parse(value, CultureInfo.InvariantCulture);
+    public static DateOnly DateOnly(string value) => System.DateOnly.Parse(value, CultureInfo.InvariantCulture);
+    public static TimeOnly TimeOnly(string value) => System.TimeOnly.Parse(value, CultureInfo.InvariantCulture);
+    public static TimeSpan TimeSpan(string value) => System.TimeSpan.Parse(value, CultureInfo.InvariantCulture);
+    public static Guid Guid(string value) => System.Guid.Parse(value);
+}
@@ -0,0 +1,34 @@
+using INFRASTRUCTURE.ExceptionHandler;
+
+namespace INFRASTRUCTURE.Util;
+
+
+/// <summary>
+/// The named include profiles of a model, generated per model by make.py from its navigations. A profile loads a fixed
+/// set of related data with typed Include calls, as split queries when it includes a collection.
+/// </summary>
+public abstract class IncludeProfiles<TModel> where TModel : class
+{
+    private readonly Dictionary<string, Func<IQueryable<TModel>, IQueryable<TModel>>> _profiles = new(StringComparer.OrdinalIgnoreCase);
+
+    protected void Add(string name, Func<IQueryable<TModel>, IQueryable<TModel>> profile)
+    {
+        _profiles[name] = profile;
+    }
+
+    /// <summary>
+    /// Apply a profile to a query
+    /// </summary>
+    /// <param name="query">The query to include the related data in</param>
+    /// <param name="name">The profile name, case insensitive</param>
+    /// <returns>The query with the profile's related data included</returns>
+    public IQueryable<TModel> Apply(IQueryable<TModel> query, string name)
+    {
+        if (!_profiles.TryGetValue(name, out var profile))
+        {
+            throw new Error400Exception($"Unknown include profile '{name}', valid profiles are: {string.Join(", ", _profiles.Keys)}");
+        }
+
+        return profile(query);
+    }
+}
@@ -9,16 +9,19 @@ namespace INFRASTRUCTURE.Util;
 
 public class QueryBuilder<TModel> where TModel : class
 {
+    private static readonly Regex FilterListPattern = new(@"[^|""\r\n]+=""[^""]*""|[^|""\r\n]+=[^|""\r\n]+", RegexOptions.Compiled);
+    private static readonly Regex FilterPattern = new(@"^(?<path>[\w\.]+)\[(?<op>\w+)\]=(?<value>.+)$", RegexOptions.Compiled);
+
     /// <summary>
     /// Apply filters and relations to the query
     /// </summary>
     /// <param name="query">The query to apply the filters and relations to</param>
     /// <param name="filters">The filters to apply to the query, in the format of "field[operator]=value|field[operator]=value|..."</param>
     /// <param name="relations">The relations to apply to the query, separated by '|'</param>
+    /// <param name="map">The model's generated filter map, paths missing from it are rejected, or resolved by reflection when it is not strict</param>
     /// <returns>The query with the filters and relations applied</returns>
-    public static IQueryable<TModel> Apply(IQueryable<TModel> query, string filters = "", string relations = "")
+    public static IQueryable<TModel> Apply(IQueryable<TModel> query, string filters = "", string relations = "", FilterMap<TModel>? map = null)
     {
-        filters = filters ?? "";
         relations = relations ?? "";
         if (!string.IsNullOrEmpty(relations))
         {
@@ -28,23 +31,63 @@ public class QueryBuilder<TModel> where TModel : class
                 query = query.Include(rel);
             }
         }
-        var matches = Regex.Matches(filters, @"[^|""\r\n]+=""[^""]*""|[^|""\r\n]+=[^|""\r\n]+");
-        var filterList = matches.Cast<Match>().Select(m => m.Value).ToArray();
-        foreach (var filter in filterList)
+        return Apply(query, Parse(filters), map);
+    }
+
+    /// <summary>
+    /// Apply parsed filters to the query
+    /// </summary>
+    /// <param name="query">The query to apply the filters to</param>
+    /// <param name="filters">The filters, from Parse</param>
+    /// <param name="map">The model's generated filter map, paths missing from it are rejected, or resolved by reflection when it is not strict</param>
+    /// <returns>The query with one Where per filter</returns>
+    public static IQueryable<TModel> Apply(IQueryable<TModel> query, IEnumerable<QueryFilter> filters, FilterMap<TModel>? map = null)
+    {
+        foreach (var filter in filters)
         {
-            var match = Regex.Match(filter, @"^(?<path>[\w\.]+)\[(?<op>\w+)\]=(?<value>.+)$");
-            if (!match.Success) throw new Error500Exception($"Invalid filter format: {filter}");
-            string fld = match.Groups["path"].Value;
-            string opt = match.Groups["op"].Value.ToLower();
+            if (map != null && map.TryBuild(filter.Path, filter.Operator, filter.Value, out var predicate))
+            {
+                query = query.Where(predicate!);
+                continue;
+            }
+            query = query.Where(BuildExpression(filter.Path, filter.Operator, filter.Value));
+        }
+        return query;
+    }
+
+    /// <summary>
+    /// Parse a filter string, every '|' separated segment of it must be a filter
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <returns>The filters, empty when the filter string is empty</returns>
+    public static List<QueryFilter> Parse(string filters)
+    {
+        filters = filters ?? "";
+        var result = new List<QueryFilter>();
+        var position = 0;
+        foreach (Match filter in FilterListPattern.Matches(filters))
+        {
+            CheckSeparator(filters, position, filter.Index);
+            var match = FilterPattern.Match(filter.Value);
+            if (!match.Success) throw new Error400Exception($"Invalid filter format: {filter.Value}");
             string val = match.Groups["value"].Value;
             // Remove quotes if val is a quoted string
             if (val.StartsWith("\"") && val.EndsWith("\""))
             {
                 val = val.Substring(1, val.Length - 2);
             }
-            query = query.Where(BuildExpression(fld, opt, val));
+            result.Add(new QueryFilter(match.Groups["path"].Value, match.Groups["op"].Value.ToLower(), val));
+            position = filter.Index + filter.Length;
         }
-        return query;
+        CheckSeparator(filters, position, filters.Length);
+        return result;
+    }
+
+    private static void CheckSeparator(string filters, int start, int end)
+    {
+        // Only '|' may be left between two filters, anything else is a segment that is not a filter
+        var segment = filters.Substring(start, end - start).Trim('|');
+        if (segment.Length > 0) throw new Error400Exception($"Invalid filter format: {segment}");
     }
 
     private static bool IsMultipleValues(string value)
@@ -130,3 +173,11 @@ public class QueryBuilder<TModel> where TModel : class
         return Expression.Lambda<Func<TModel, bool>>(comparison, parameter);
     }
 }
+
+/// <summary>
+/// A filter of a filter string
+/// </summary>
+/// <param name="Path">The field path</param>
+/// <param name="Operator">The operator, lower case</param>
+/// <param name="Value">The value, unquoted</param>
+public record QueryFilter(string Path, string Operator, string Value);
@@ -0,0 +1,59 @@
+using System.Text;
+using INFRASTRUCTURE.ExceptionHandler;
+
+namespace INFRASTRUCTURE.Util;
+
+
+/// <summary>
+/// Opaque continuation tokens of keyset pagination. A token is the last key of a page, base64url encoded
+/// so clients pass it back as is instead of building cursors themselves.
+/// </summary>
+public static class SeekToken
+{
+    /// <summary>
+    /// Encode the last key of a page
+    /// </summary>
+    /// <param name="key">The key value</param>
+    /// <returns>The continuation token</returns>
+    public static string Encode(string key)
+    {
+        return Convert.ToBase64String(Encoding.UTF8.GetBytes(key))
+            .TrimEnd('=')
+            .Replace('+', '-')
+            .Replace('/', '_');
+    }
+
+    /// <summary>
+    /// Decode a continuation token
+    /// </summary>
+    /// <param name="token">The continuation token</param>
+    /// <returns>The key value the next page starts after</returns>
+    public static string Decode(string token)
+    {
+        var base64 = token.Replace('-', '+').Replace('_', '/');
+        base64 = base64.PadRight(base64.Length + (4 - base64.Length % 4) % 4, '=');
+        try
+        {
+            return Encoding.UTF8.GetString(Convert.FromBase64String(base64));
+        }
+        catch (FormatException)
+        {
+            throw new Error400Exception("Invalid continuation token");
+        }
+    }
+
+    /// <summary>
+    /// Decode a continuation token of a numeric key
+    /// </summary>
+    /// <param name="token">The continuation token</param>
+    /// <returns>The key value the next page starts after</returns>
+    public static long DecodeLong(string token)
+    {
+        if (!long.TryParse(Decode(token), out var key))
+        {
+            throw new Error400Exception("Invalid continuation token");
+        }
+
+        return key;
+    }
+}
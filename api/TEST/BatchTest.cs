@@ -0,0 +1,85 @@
+using APPLICATION.Dto.Role;
+using APPLICATION.Dto.User;
+using DOMAIN.Model;
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.ExceptionHandler;
+using INFRASTRUCTURE.Repository;
+using Microsoft.EntityFrameworkCore;
+
+namespace TEST;
+
+public class BatchTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+    private readonly AppDbContext _context;
+
+    public BatchTest()
+    {
+        _context = _database.CreateContext();
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Fact]
+    public async Task EmptyIdsAreRejected()
+    {
+        var repository = new RoleRepository(_context, _database.Mapper);
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.UpdateBatchAsync(new List<long>(), new RoleDto { Name = "Role" }, ["Name"]));
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.DeleteBatchAsync(new List<long>()));
+    }
+
+    [Fact]
+    public async Task IdsOverTheLimitAreRejected()
+    {
+        var repository = new RoleRepository(_context, _database.Mapper);
+        var ids = Enumerable.Range(1, 1001).Select(id => (long)id).ToList();
+        var count = await _context.Roles.CountAsync();
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.UpdateBatchAsync(ids, new RoleDto { Name = "Role" }, ["Name"]));
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.DeleteBatchAsync(ids));
+
+        Assert.Equal(count, await _context.Roles.CountAsync());
+        Assert.True(await _context.Roles.AnyAsync(role => role.Name == "Admin"));
+    }
+
+    [Fact]
+    public async Task MissingOrUnknownFieldsAreRejected()
+    {
+        var repository = new RoleRepository(_context, _database.Mapper);
+        var ids = await _context.Roles.Select(role => role.Id).ToListAsync();
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.UpdateBatchAsync(ids, new RoleDto { Name = "Role" }, []));
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.UpdateBatchAsync(ids, new RoleDto { Name = "Role" }, ["Unknown"]));
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.UpdateBatchAsync(ids, new RoleDto { Name = "Role" }, ["Id"]));
+
+        Assert.True(await _context.Roles.AnyAsync(role => role.Name == "Admin"));
+    }
+
+    [Fact]
+    public async Task OnlyTheGivenFieldsAreWritten()
+    {
+        var birthDate = new DateTime(1990, 1, 2);
+        _context.Users.Add(new User { Id = "user", Email = "user@example.com", UserName = "username", PhoneNumber = "0600000000", FirstName = "First", LastName = "Last", Address = "Address", BirthDate = birthDate });
+        await _context.SaveChangesAsync();
+        _context.ChangeTracker.Clear();
+
+        var repository = new UserRepository(_context, _database.Mapper);
+        var values = new UserDto { Email = "other@example.com", UserName = "other", FirstName = "Updated" };
+
+        Assert.Equal(1, await repository.UpdateBatchAsync(new List<string> { "user" }, values, ["firstName", "PhoneNumber"]));
+
+        var user = await _context.Users.AsNoTracking().SingleAsync(item => item.Id == "user");
+        Assert.Equal("Updated", user.FirstName);
+        Assert.Null(user.PhoneNumber);
+        Assert.Equal("Last", user.LastName);
+        Assert.Equal("Address", user.Address);
+        Assert.Equal("user@example.com", user.Email);
+        Assert.Equal("username", user.UserName);
+        Assert.Equal(birthDate, user.BirthDate);
+    }
+}
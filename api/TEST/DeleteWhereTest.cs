@@ -0,0 +1,54 @@
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.ExceptionHandler;
+using INFRASTRUCTURE.Repository;
+using Microsoft.EntityFrameworkCore;
+
+namespace TEST;
+
+public class DeleteWhereTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+    private readonly AppDbContext _context;
+    private readonly RoleRepository _repository;
+
+    public DeleteWhereTest()
+    {
+        _context = _database.CreateContext();
+        _repository = new RoleRepository(_context, _database.Mapper);
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Theory]
+    [InlineData("")]
+    [InlineData("|")]
+    [InlineData("foo")]
+    [InlineData("Name[eq]")]
+    [InlineData("Name=Admin")]
+    [InlineData("Name[eq]=Admin|foo")]
+    [InlineData("Name[eq]=\"Admin\"foo")]
+    public async Task UnparsedFiltersAreRejected(string filters)
+    {
+        var count = await _context.Roles.CountAsync();
+
+        // Error400Exception is answered with a 400
+        await Assert.ThrowsAsync<Error400Exception>(() => _repository.DeleteWhereAsync(filters));
+
+        Assert.Equal(count, await _context.Roles.CountAsync());
+    }
+
+    [Fact]
+    public async Task MatchingItemsAreDeleted()
+    {
+        var count = await _context.Roles.CountAsync();
+
+        Assert.Equal(1, await _repository.DeleteWhereAsync("Name[eq]=Admin"));
+
+        Assert.Equal(count - 1, await _context.Roles.CountAsync());
+        Assert.False(await _context.Roles.AnyAsync(role => role.Name == "Admin"));
+    }
+}
@@ -0,0 +1,64 @@
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.ExceptionHandler;
+using INFRASTRUCTURE.Repository;
+
+namespace TEST;
+
+public class FilterMapTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+    private readonly AppDbContext _context;
+
+    public FilterMapTest()
+    {
+        _context = _database.CreateContext();
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Theory]
+    [InlineData("PasswordHash[eq]=secret")]
+    [InlineData("SecurityStamp[eq]=secret")]
+    [InlineData("Unknown[eq]=value")]
+    public async Task PathsMissingFromTheMapAreRejected(string filters)
+    {
+        var repository = new UserRepository(_context, _database.Mapper);
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.QueryAsync(filters));
+    }
+
+    [Fact]
+    public async Task NavigationPathsMissingFromTheMapAreRejected()
+    {
+        var repository = new UserXAccessRepository(_context, _database.Mapper);
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.QueryAsync("User.PasswordHash[eq]=secret"));
+    }
+
+    [Theory]
+    [InlineData("Id[eq]=abc")]
+    [InlineData("Id[between]=1")]
+    [InlineData("Id[gt]=99999999999999999999")]
+    [InlineData("Id[contains]=1")]
+    [InlineData("Name[gt]=Admin")]
+    public async Task BadValuesAndOperatorsAreRejected(string filters)
+    {
+        var repository = new RoleRepository(_context, _database.Mapper);
+
+        await Assert.ThrowsAsync<Error400Exception>(() => repository.QueryAsync(filters));
+    }
+
+    [Fact]
+    public async Task PathsOfTheMapAreFiltered()
+    {
+        var repository = new RoleRepository(_context, _database.Mapper);
+
+        var roles = await repository.QueryAsync("Name[eq]=Admin");
+
+        Assert.Equal("Admin", Assert.Single(roles).Name);
+    }
+}
@@ -0,0 +1,48 @@
+using APPLICATION.Dto.Role;
+using INFRASTRUCTURE.Data;
+using INFRASTRUCTURE.Repository;
+using Microsoft.EntityFrameworkCore;
+
+namespace TEST;
+
+public class ReadTrackingTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+    private readonly AppDbContext _context;
+    private readonly RoleRepository _repository;
+
+    public ReadTrackingTest()
+    {
+        _context = _database.CreateContext();
+        _repository = new RoleRepository(_context, _database.Mapper);
+    }
+
+    public void Dispose()
+    {
+        _context.Dispose();
+        _database.Dispose();
+    }
+
+    [Fact]
+    public async Task CompiledReadsAreNotTracked()
+    {
+        var id = await _context.Roles.AsNoTracking().Where(role => role.Name == "Admin").Select(role => role.Id).SingleAsync();
+
+        var role = await _repository.GetAsync(id);
+
+        Assert.Equal("Admin", role?.Name);
+        Assert.Empty(_context.ChangeTracker.Entries());
+    }
+
+    [Fact]
+    public async Task CompiledWritesAreTracked()
+    {
+        var id = await _context.Roles.AsNoTracking().Where(role => role.Name == "Admin").Select(role => role.Id).SingleAsync();
+
+        await _repository.GetAsync(id);
+        var role = await _repository.UpdateAsync(id, new RoleDto { Name = "Administrator" });
+
+        Assert.Equal("Administrator", role?.Name);
+        Assert.Equal("Administrator", await _context.Roles.AsNoTracking().Where(item => item.Id == id).Select(item => item.Name).SingleAsync());
+    }
+}
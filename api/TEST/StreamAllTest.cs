@@ -0,0 +1,79 @@
+using API.Controllers;
+using APPLICATION.Mapper;
+using DOMAIN.Model;
+using INFRASTRUCTURE;
+using INFRASTRUCTURE.Data;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.TestHost;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace TEST;
+
+public class StreamAllTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+
+    public StreamAllTest()
+    {
+        using var context = _database.CreateContext();
+        // Escaped differently by the two serializers' default encoders
+        context.Roles.Add(new Role { Name = "Rôle <&> \"quoted\"" });
+        context.SaveChanges();
+    }
+
+    public void Dispose()
+    {
+        _database.Dispose();
+    }
+
+    [Theory]
+    [InlineData("Newtonsoft")]
+    [InlineData("SystemTextJson")]
+    public async Task StreamIsTheListOfAll(string serializer)
+    {
+        await using var app = await StartAsync(serializer);
+        var client = app.GetTestClient();
+
+        var all = await client.GetStringAsync("Api/Role/all");
+        var stream = await client.GetStringAsync("Api/Role/all/stream");
+
+        Assert.Equal(all, stream);
+    }
+
+    [Theory]
+    [InlineData("Newtonsoft")]
+    [InlineData("SystemTextJson")]
+    public async Task NdjsonLinesAreTheItemsOfAll(string serializer)
+    {
+        await using var app = await StartAsync(serializer);
+        var client = app.GetTestClient();
+
+        var all = await client.GetStringAsync("Api/Role/all");
+        var request = new HttpRequestMessage(HttpMethod.Get, "Api/Role/all/stream");
+        request.Headers.Accept.ParseAdd("application/x-ndjson");
+        var response = await client.SendAsync(request);
+        var lines = (await response.Content.ReadAsStringAsync()).Split('\n', StringSplitOptions.RemoveEmptyEntries);
+
+        Assert.Equal("application/x-ndjson", response.Content.Headers.ContentType?.MediaType);
+        Assert.Equal(all, "[" + string.Join(",", lines) + "]");
+    }
+
+    private async Task<WebApplication> StartAsync(string serializer)
+    {
+        var builder = WebApplication.CreateBuilder(new WebApplicationOptions { EnvironmentName = "Testing" });
+        builder.WebHost.UseTestServer();
+        builder.Configuration["Json:Serializer"] = serializer;
+
+        // The services and the JSON setup of the API, over the test database
+        builder.Services.AddDbContext<AppDbContext>(options => options.UseSqlite(_database.Connection));
+        builder.Services.AddAutoMapper(typeof(RoleMapper));
+        InfraInjector.Inject(builder.Services, builder.Configuration);
+        builder.Services.AddControllers().AddApplicationPart(typeof(RoleController).Assembly);
+
+        var app = builder.Build();
+        app.MapControllers();
+        await app.StartAsync();
+        return app;
+    }
+}
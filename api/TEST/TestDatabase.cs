@@ -0,0 +1,44 @@
+using APPLICATION.Mapper;
+using AutoMapper;
+using INFRASTRUCTURE.Data;
+using Microsoft.Data.Sqlite;
+using Microsoft.EntityFrameworkCore;
+
+namespace TEST;
+
+/// <summary>
+/// An in-memory SQLite AppDbContext with the seeded Roles and RoleActions, kept open until disposed.
+/// </summary>
+public sealed class TestDatabase : IDisposable
+{
+    private readonly SqliteConnection _connection;
+    private readonly DbContextOptions<AppDbContext> _options;
+
+    public IMapper Mapper { get; }
+
+    public TestDatabase()
+    {
+        _connection = new SqliteConnection("DataSource=:memory:");
+        _connection.Open();
+        _options = new DbContextOptionsBuilder<AppDbContext>().UseSqlite(_connection).Options;
+
+        using (var context = CreateContext())
+        {
+            context.Database.EnsureCreated();
+        }
+
+        Mapper = new MapperConfiguration(config => config.AddMaps(typeof(RoleMapper).Assembly)).CreateMapper();
+    }
+
+    public SqliteConnection Connection => _connection;
+
+    public AppDbContext CreateContext()
+    {
+        return new AppDbContext(_options);
+    }
+
+    public void Dispose()
+    {
+        _connection.Dispose();
+    }
+}
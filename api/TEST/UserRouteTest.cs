@@ -0,0 +1,62 @@
+using System.Net;
+using System.Text.Json;
+using API.Controllers;
+using APPLICATION.Mapper;
+using DOMAIN.Model;
+using INFRASTRUCTURE;
+using INFRASTRUCTURE.Data;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.TestHost;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.DependencyInjection;
+
+namespace TEST;
+
+public class UserRouteTest : IDisposable
+{
+    private readonly TestDatabase _database = new();
+
+    public UserRouteTest()
+    {
+        using var context = _database.CreateContext();
+        // Identity ids are strings, the routes used to only match long ids
+        context.Users.Add(new User { Id = "3f2b1c9e-user", Email = "user@example.com", UserName = "username", FirstName = "First", LastName = "Last", Address = "Address", BirthDate = new DateTime(1990, 1, 2) });
+        context.SaveChanges();
+    }
+
+    public void Dispose()
+    {
+        _database.Dispose();
+    }
+
+    [Fact]
+    public async Task UsersAreReadByStringId()
+    {
+        await using var app = await StartAsync();
+        var client = app.GetTestClient();
+
+        var response = await client.GetAsync("Api/User/3f2b1c9e-user");
+        using var user = JsonDocument.Parse(await response.Content.ReadAsStringAsync());
+
+        Assert.Equal(HttpStatusCode.OK, response.StatusCode);
+        Assert.Equal("3f2b1c9e-user", user.RootElement.GetProperty("id").GetString());
+        Assert.Equal("user@example.com", user.RootElement.GetProperty("email").GetString());
+    }
+
+    private async Task<WebApplication> StartAsync()
+    {
+        var builder = WebApplication.CreateBuilder(new WebApplicationOptions { EnvironmentName = "Testing" });
+        builder.WebHost.UseTestServer();
+
+        // The services and the JSON setup of the API, over the test database
+        builder.Services.AddDbContext<AppDbContext>(options => options.UseSqlite(_database.Connection));
+        builder.Services.AddAutoMapper(typeof(UserMapper));
+        InfraInjector.Inject(builder.Services, builder.Configuration);
+        builder.Services.AddControllers().AddApplicationPart(typeof(UserController).Assembly);
+
+        var app = builder.Build();
+        app.MapControllers();
+        await app.StartAsync();
+        return app;
+    }
+}
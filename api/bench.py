@@ -0,0 +1,227 @@
+## Description: Benchmarks for make.py.
+## Runs make.py against a throwaway copy of the solution tree so the real project is never touched.
+
+
+import io
+import sys
+import json
+import shutil
+import platform
+import subprocess
+import tempfile
+from time import perf_counter
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from os.path import dirname, abspath, join, exists
+
+__install_path__ = abspath(dirname(__file__))
+
+PROJECT_DIRS = ["API", "APPLICATION", "DOMAIN", "INFRASTRUCTURE"]
+PROJECT_FILES = ["make.py", "make.info.config"]
+
+# Budget (ms) for a cold `make.py` start, see --startup.
+STARTUP_BUDGET_MS = 100
+
+# Model counts of the synthetic trees, see --suite.
+SUITE_SIZES = [10, 100, 1000]
+SUITE_REPORT = join(__install_path__, ".make", "bench-report.json")
+SUITE_BASELINE = join(__install_path__, "bench.baseline.json")
+# A phase regresses when it is this much slower than the baseline...
+SUITE_TOLERANCE = 0.25
+# ...and at least this many milliseconds slower, so timer noise on tiny phases is ignored.
+SUITE_MIN_DELTA_MS = 5
+
+SYNTHETIC_TYPES = ["string", "int", "long", "decimal", "bool", "DateTime", "Guid", "double", "string?", "int?", "List<string>"]
+
+def copy_tree(destination:str):
+    for folder in PROJECT_DIRS:
+        shutil.copytree(join(__install_path__, folder), join(destination, folder), ignore=shutil.ignore_patterns("bin", "obj"))
+    for file in PROJECT_FILES:
+        shutil.copy(join(__install_path__, file), join(destination, file))
+
+def time_command(root:str, args:list, runs:int):
+    timings = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run([sys.executable, join(root, "make.py"), *args], cwd=root, stdout=subprocess.DEVNULL, check=True)
+        timings.append((perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+def synthetic_model(name:str, index:int):
+    """
+    A DOMAIN/Model class with 4 to 40 properties, some of them with attributes, so models vary in size.
+    """
+    lines = [
+        "using System.ComponentModel.DataAnnotations;",
+        "using System.ComponentModel.DataAnnotations.Schema;",
+        "",
+        "namespace DOMAIN.Model;",
+        "",
+        "[Table(\"{}\")]".format(name),
+        "public class {}".format(name),
+        "{",
+        "    [Key]",
+        "    public long Id { get; set; }",
+    ]
+    for prop in range(4 + (index * 7) % 37):
+        type_name = SYNTHETIC_TYPES[(index + prop) % len(SYNTHETIC_TYPES)]
+        lines.append("")
+        if  prop % 3 == 0:
+            lines.append("    [Required]")
+        if  type_name == "string" and prop % 2 == 0:
+            lines.append("    [MaxLength(255)]")
+        initializer = " = string.Empty;" if type_name == "string" else " = new();" if type_name.startswith("List") else ""
+        lines.append("    public {} Field{} {{ get; set; }}{}".format(type_name, prop, initializer))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def build_synthetic_tree(root:str, count:int):
+    copy_tree(root)
+    models = ["Bench{}".format(index) for index in range(count)]
+    for index, name in enumerate(models):
+        with open(join(root, "DOMAIN", "Model", name + ".cs"), "w") as f:
+            f.write(synthetic_model(name, index))
+    return models
+
+def load_make(root:str, name:str):
+    # A fresh module per tree, make.py resolves every path from its own location.
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(name, join(root, "make.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def time_phase(make, models:list, phase:str):
+    start = perf_counter()
+    if  phase == "patch":
+        make.main(["--patch", "--quiet"])
+    elif phase == "injectors":
+        settings = make.get_settings()
+        injections = {}
+        for model in models:
+            make.queue_injection(injections, settings.repository_list_path, "REPOSITORIES", "{}.AddScoped<I{}Repository, {}Repository>(); /* added by make.py */".format(settings.repository_variable, model, model))
+            make.queue_injection(injections, settings.service_list_path, "SERVICES", "{}.AddScoped<I{}Service, {}Service>(); /* added by make.py */".format(settings.service_variable, model, model))
+            make.queue_injection(injections, settings.mapper_list_path, "AUTOMAPPER", make.get_mapper_injection(model))
+        make.write_injections(injections)
+    else:
+        make_function = getattr(make, "make_" + phase)
+        for model in models:
+            make_function(model)
+    return (perf_counter() - start) * 1000
+
+SUITE_PHASES = ["controller", "repository", "service", "dto", "mapper", "injectors", "patch"]
+
+def bench_suite(sizes:list, runs:int):
+    """
+    Times every generator phase over synthetic trees of each size. Returns {size: {phase: median ms}}.
+    """
+    results = {}
+    for size in sizes:
+        timings = {phase: [] for phase in SUITE_PHASES}
+        for run in range(runs):
+            with tempfile.TemporaryDirectory() as root:
+                models = build_synthetic_tree(root, size)
+                with redirect_stdout(io.StringIO()):
+                    make = load_make(root, "make_bench_{}_{}".format(size, run))
+                    make.QUIET = True
+                    for phase in SUITE_PHASES:
+                        timings[phase].append(time_phase(make, models, phase))
+        results[str(size)] = {phase: sorted(values)[len(values) // 2] for phase, values in timings.items()}
+        for phase in SUITE_PHASES:
+            median = results[str(size)][phase]
+            print("bench::suite: {:>5} models {:<12} {:10.2f} ms {:8.1f} us/model".format(size, phase, median, median * 1000 / size))
+    return results
+
+def compare_baseline(results:dict, baseline:dict, tolerance:float):
+    """
+    Prints every phase next to its baseline timing. Returns whether any phase regressed.
+    """
+    regressed = False
+    for size, phases in results.items():
+        for phase, median in phases.items():
+            previous = baseline.get(size, {}).get(phase)
+            if  previous is None:
+                print("bench::baseline: {:>5} models {:<12} {:10.2f} ms (not in the baseline)".format(size, phase, median))
+                continue
+            slower = median > previous * (1 + tolerance) and median - previous > SUITE_MIN_DELTA_MS
+            regressed = regressed or slower
+            print("bench::baseline: {:>5} models {:<12} {:10.2f} ms vs {:10.2f} ms ({:+6.1f}%) {}".format(
+                size, phase, median, previous, (median / previous - 1) * 100 if previous > 0 else 0, "REGRESSION" if slower else "ok"))
+    return regressed
+
+def write_json(path:str, value:dict):
+    from os import makedirs
+    makedirs(dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(value, f, indent=4)
+
+def run_suite(sizes:list, runs:int, report:str, baseline:str, save_baseline:bool, tolerance:float):
+    results = bench_suite(sizes, runs)
+    measured = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "results": results,
+    }
+    write_json(report, measured)
+    print("bench::suite: report written to {}.".format(report))
+
+    # Timings only compare on the machine they were measured on, the baseline records which one that was.
+    if  save_baseline:
+        write_json(baseline, measured)
+        print("bench::suite: baseline written to {}.".format(baseline))
+        return True
+
+    if  not exists(baseline):
+        print("bench::error: no baseline at {} (run with --save-baseline to create one).".format(baseline))
+        exit(1)
+
+    with open(baseline, "r") as f:
+        return not compare_baseline(results, json.load(f)["results"], tolerance)
+
+def bench_startup(runs:int, budget:float):
+    commands = [
+        ("--help", ["--help"]),
+        # Every model already exists so nothing is generated.
+        ("no-op (--all --quiet)", ["--all", "--quiet"]),
+    ]
+
+    failed = False
+    with tempfile.TemporaryDirectory() as root:
+        copy_tree(root)
+        for name, args in commands:
+            median = time_command(root, args, runs)
+            status = "ok" if median <= budget else "over budget"
+            failed = failed or median > budget
+            print("bench::startup: {:<24} {:8.2f} ms (budget {} ms) {}".format(name, median, budget, status))
+
+    return not failed
+
+def main(argv=None):
+    argparse = ArgumentParser(description="Benchmarks for make.py.")
+    argparse.add_argument("-s", '--startup', action='store_true', help="Time --help and a no-op command against the startup budget.")
+    argparse.add_argument("-S", '--suite', action='store_true', help="Time every make phase over synthetic trees and compare with the baseline.")
+    argparse.add_argument("-r", '--runs', metavar='\b', type=int, default=None, help="Number of runs per measurement, the median is reported (default: 10 for --startup, 3 for --suite).")
+    argparse.add_argument("-b", '--budget', metavar='\b', type=float, default=STARTUP_BUDGET_MS, help="Startup budget in milliseconds (default: {}).".format(STARTUP_BUDGET_MS))
+    argparse.add_argument('--sizes', metavar='\b', type=str, default=",".join(map(str, SUITE_SIZES)), help="Comma separated model counts for --suite (default: {}).".format(",".join(map(str, SUITE_SIZES))))
+    argparse.add_argument('--report', metavar='\b', type=str, default=SUITE_REPORT, help="Where --suite writes its JSON report (default: .make/bench-report.json).")
+    argparse.add_argument('--baseline', metavar='\b', type=str, default=SUITE_BASELINE, help="Baseline report --suite compares against (default: bench.baseline.json).")
+    argparse.add_argument('--save-baseline', action='store_true', help="Store the --suite results as the new baseline instead of comparing.")
+    argparse.add_argument('--tolerance', metavar='\b', type=float, default=SUITE_TOLERANCE, help="Slowdown ratio counted as a regression (default: {}).".format(SUITE_TOLERANCE))
+    args = argparse.parse_args(argv)
+
+    if  args.startup:
+        if  not bench_startup(args.runs or 10, args.budget):
+            print("bench::error: startup budget exceeded.")
+            exit(1)
+    elif args.suite:
+        sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+        if  not run_suite(sizes, args.runs or 3, args.report, args.baseline, args.save_baseline, args.tolerance):
+            print("bench::error: regression against {}.".format(args.baseline))
+            exit(1)
+    else:
+        argparse.print_help()
+
+if  __name__ == "__main__":
+    main()
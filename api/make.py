@@ -4,11 +4,13 @@
 ## Modify to suit your needs.
 
 
+import re
 import sys
 import json
+from time import perf_counter
 from argparse import ArgumentParser
-from os import mkdir, listdir
-from os.path import exists, dirname, abspath, join, isdir, isfile, basename
+from os import mkdir, remove, scandir, stat
+from os.path import exists, dirname, abspath, join, isdir, basename, relpath
 
 def capitalize(s:str):
     return s[0].upper() + s[1:]
@@ -34,6 +36,7 @@ KEY_CONTROLLERS_PATH = "PATH"
 KEY_DTO = "DTO"
 KEY_DTO_PATH = "PATH"
 KEY_DTO_LIST_PATH = "LIST_PATH"
+KEY_DTO_JSON_CONTEXT = "JSON_CONTEXT"
 # 
 KEY_REPOSITORY = "REPOSITORY"
 KEY_REPOSITORY_IPATH = "IPATH"
@@ -41,6 +44,7 @@ KEY_REPOSITORY_PATH = "PATH"
 KEY_REPOSITORY_IGENERIC_NAME = "IGENERIC_NAME"
 KEY_REPOSITORY_GENERIC_NAME = "GENERIC_NAME"
 KEY_REPOSITORY_LIST_PATH = "LIST_PATH"
+KEY_REPOSITORY_PROJECTED_GENERIC_NAME = "PROJECTED_GENERIC_NAME"
 KEY_REPOSITORY_REPOSITORY_VARIABLE_NAME = "REPOSITORY_VARIABLE"
 KEY_REPOSITORY_LIST_PATH = "LIST_PATH"
 # 
@@ -50,6 +54,7 @@ KEY_SERVICE_PATH = "PATH"
 KEY_SERVICE_IGENERIC_NAME = "IGENERIC_NAME"
 KEY_SERVICE_GENERIC_NAME = "GENERIC_NAME"
 KEY_SERVICE_SERVICE_VARIABLE_NAME = "SERVICE_VARIABLE"
+KEY_SERVICE_CACHED_GENERIC_NAME = "CACHED_GENERIC_NAME"
 KEY_SERVICE_LIST_PATH = "LIST_PATH"
 # 
 KEY_MAPPER = "MAPPER"
@@ -63,8 +68,41 @@ KEY_DATA_PATH = "PATH"
 KEY_MODEL = "MODEL"
 KEY_MODEL_PATH = "PATH"
 KEY_MODEL_LIST = "LIST"
+KEY_MODEL_OPTIONS = "OPTIONS"
+
+# Per-model generator options, overridable in MODEL.OPTIONS under "DEFAULT" (every model) or the model name.
+DEFAULT_MODEL_OPTIONS = {
+    # Generate a repository that reads Get{Model}Dto with a SQL projection instead of load-then-map.
+    "PROJECTION": False,
+    # EF Core QueryTrackingBehavior of the generated repository's read paths, write paths always track.
+    "READ_TRACKING": "TrackAll",
+    # Generate the unbounded `all` list action next to the `all/stream` one.
+    "LIST_ALL": True,
+    # Generate compiled EF queries for the repository's lookups by key (get, update, delete, exists).
+    "COMPILED_QUERIES": False,
+    # Items CreateAllAsync saves per SaveChanges, 0 keeps GenericRepository's default.
+    "INSERT_BATCH_SIZE": 0,
+    # Generate a read-through cache decorator of the service, registered in the CACHING injector region.
+    "CACHE": False,
+    # Items the cache holds (a list counts its items) and seconds a cached read lives.
+    "CACHE_SIZE": 1000,
+    "CACHE_TTL_SECONDS": 300,
+    # Generate a {Model}FilterMap of typed filter predicates for the repository's Query, unknown paths are rejected...
+    "FILTER_MAP": False,
+    # ...or resolved by reflection when FILTER_STRICT is off.
+    "FILTER_STRICT": True,
+    # Generate {Model}IncludeProfiles, the named sets of navigations Query and the `query` action may include.
+    "INCLUDE_PROFILES": False,
+    # Generate {Model}ModelMapper, explicit mapping code and projection the repository uses in place of AutoMapper.
+    "MODEL_MAPPER": False,
+}
+
+# Allowed values of the string options.
+MODEL_OPTION_CHOICES = {
+    "READ_TRACKING": ("TrackAll", "NoTracking", "NoTrackingWithIdentityResolution"),
+}
 
-CONFIG = ({
+DEFAULT_CONFIG = ({
     KEY_API_PATH: "API",
     KEY_APPLICATION_PATH: "APPLICATION",
     KEY_DOMAIN_PATH: "DOMAIN",
@@ -77,7 +115,8 @@ CONFIG = ({
     # 
     KEY_DTO: {
         KEY_DTO_PATH: "APPLICATION_PATH/Dto",
-        KEY_DTO_LIST_PATH: "APPLICATION_PATH/AppInjector.cs"
+        KEY_DTO_LIST_PATH: "APPLICATION_PATH/AppInjector.cs",
+        KEY_DTO_JSON_CONTEXT: False
     },
     KEY_REPOSITORY: {
         KEY_REPOSITORY_IPATH: "APPLICATION_PATH/IRepository",
@@ -85,7 +124,8 @@ CONFIG = ({
         KEY_REPOSITORY_IGENERIC_NAME: "IGenericRepository",
         KEY_REPOSITORY_GENERIC_NAME: "GenericRepository",
         KEY_REPOSITORY_REPOSITORY_VARIABLE_NAME: "services",
-        KEY_REPOSITORY_LIST_PATH: "INFRASTRUCTURE_PATH/InfraInjector.cs"
+        KEY_REPOSITORY_LIST_PATH: "INFRASTRUCTURE_PATH/InfraInjector.cs",
+        KEY_REPOSITORY_PROJECTED_GENERIC_NAME: "ProjectedRepository"
     },
     KEY_SERVICE: {
         KEY_SERVICE_IPATH: "APPLICATION_PATH/IService",
@@ -93,7 +133,8 @@ CONFIG = ({
         KEY_SERVICE_IGENERIC_NAME: "IGenericService",
         KEY_SERVICE_GENERIC_NAME: "GenericService",
         KEY_SERVICE_SERVICE_VARIABLE_NAME: "services",
-        KEY_SERVICE_LIST_PATH: "INFRASTRUCTURE_PATH/InfraInjector.cs"
+        KEY_SERVICE_LIST_PATH: "INFRASTRUCTURE_PATH/InfraInjector.cs",
+        KEY_SERVICE_CACHED_GENERIC_NAME: "CachedService"
     },
     KEY_MAPPER: {
         KEY_MAPPER_PATH: "APPLICATION_PATH/Mapper",
@@ -107,27 +148,122 @@ CONFIG = ({
         KEY_MODEL_PATH: "DOMAIN_PATH/Model",
         KEY_MODEL_LIST: [
             "User"
-        ]
+        ],
+        KEY_MODEL_OPTIONS: {}
     }
 })
 
-try:
-    fobj = open(PATH_CONFIG, "r")
-    CONFIG = {
-        **CONFIG,
-        **json.load(fobj)
-    }
-    fobj.close()
-except Exception as e:
-    print("make::error: failed to read config file.")
-    exit(1)
+# Quiet mode (--quiet) hides info messages, warnings and errors are always printed.
+QUIET = False
+
+def info(message:str):
+    if  not QUIET:
+        print(message)
+
+###############################################
+# Instrumentation (--timings / --profile)
+###############################################
+# phase name -> counters, only collected when --timings is given.
+TIMINGS = None
+TIMING_COUNTERS = ("files_read", "bytes_read", "files_written", "bytes_written", "cache_hits", "cache_misses")
+
+_TIMINGS_LOCK = None
+_TIMINGS_STACK = None
+
+def enable_timings():
+    global TIMINGS, _TIMINGS_LOCK, _TIMINGS_STACK
+    import threading
+    TIMINGS = {}
+    _TIMINGS_LOCK = threading.Lock()
+    # Per thread stack of open phases, --jobs workers start with an empty one.
+    _TIMINGS_STACK = threading.local()
+
+def get_timing(name:str):
+    timing = TIMINGS.get(name)
+    if  timing is None:
+        timing = TIMINGS[name] = {"calls": 0, "time": 0.0, **{counter: 0 for counter in TIMING_COUNTERS}}
+    return timing
+
+class Phase:
+    """
+    Attributes wall time and I/O counters to a named phase. Nested phases each record their inclusive time,
+    counters go to the innermost open phase. Does nothing unless --timings is given.
+    """
+    __slots__ = ("name", "start")
+
+    def __init__(self, name:str):
+        self.name = name
+
+    def __enter__(self):
+        if  TIMINGS is not None:
+            stack = _TIMINGS_STACK.__dict__.setdefault("phases", [])
+            stack.append(self.name)
+            self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if  TIMINGS is not None:
+            elapsed = perf_counter() - self.start
+            _TIMINGS_STACK.phases.pop()
+            with _TIMINGS_LOCK:
+                timing = get_timing(self.name)
+                timing["calls"] += 1
+                timing["time"] += elapsed
+        return False
+
+def run_phase(name:str, function, *args):
+    with Phase(name):
+        return function(*args)
+
+def count(counter:str, amount:int=1):
+    if  TIMINGS is None:
+        return
+    stack = _TIMINGS_STACK.__dict__.get("phases")
+    with _TIMINGS_LOCK:
+        get_timing(stack[-1] if stack else "other")[counter] += amount
+
+def print_timings(format:str):
+    if  format == "json":
+        print(json.dumps({name: {**timing, "time": round(timing["time"] * 1000, 3)} for name, timing in TIMINGS.items()}, indent=4))
+        return
+
+    header = ("phase", "calls", "time (ms)", "read", "read bytes", "written", "written bytes", "cache hits", "misses")
+    rows = [(name, timing["calls"], "{:.2f}".format(timing["time"] * 1000), *[timing[counter] for counter in TIMING_COUNTERS]) for name, timing in TIMINGS.items()]
+    widths = [max(len(str(row[column])) for row in [header] + rows) for column in range(len(header))]
+    print()
+    for row in [header] + rows:
+        print("    " + "  ".join(str(value).ljust(width) if column == 0 else str(value).rjust(width) for column, (value, width) in enumerate(zip(row, widths))))
+
+_CONFIG = None
+
+def get_config():
+    # Raw config (defaults merged with make.info.config), only read when a command needs it.
+    global _CONFIG
+    if  _CONFIG is not None:
+        return _CONFIG
+
+    try:
+        fobj = open(PATH_CONFIG, "r")
+        content = fobj.read()
+        fobj.close()
+        count("files_read")
+        count("bytes_read", len(content))
+        _CONFIG = {
+            **DEFAULT_CONFIG,
+            **json.loads(content)
+        }
+    except Exception as e:
+        print("make::error: failed to read config file.")
+        exit(1)
+
+    return _CONFIG
 
 def get_value_from_namespace(json_namespace:str):
     nested = json_namespace.split('.')[::-1]
     if  len(nested) == 0:
         return None
     
-    current = CONFIG[nested.pop()]
+    current = get_config()[nested.pop()]
     while len(nested) > 0:
         top = nested[-1]
         if  not isinstance(current, dict):
@@ -147,7 +283,7 @@ def check_type_namespace(json_namespace:str, t:type):
     if  len(nested) == 0:
         return False
     
-    current = CONFIG[nested.pop()]
+    current = get_config()[nested.pop()]
     while len(nested) > 0:
         top = nested[-1]
         if  not isinstance(current, dict):
@@ -166,96 +302,456 @@ def assert_type_namespace(json_namespace:str, t:type):
         print("[make.info.config]make::error: invalid namespace type: {} (requires {})".format(json_namespace, t.__name__))
         exit(1)
 
-def resolve_path(path:str):
-    return path\
-        .replace('ROOT_PATH', __install_path__)\
-        .replace(KEY_API_PATH, join(__install_path__, CONFIG[KEY_API_PATH]))\
-        .replace(KEY_APPLICATION_PATH, join(__install_path__, CONFIG[KEY_APPLICATION_PATH]))\
-        .replace(KEY_DOMAIN_PATH, join(__install_path__, CONFIG[KEY_DOMAIN_PATH]))\
-        .replace(KEY_INFRASTRUCTURE_PATH, join(__install_path__, CONFIG[KEY_INFRASTRUCTURE_PATH]))\
-        .replace('/', get_path_separator())\
-        .replace('\\', get_path_separator())
-
-assert_type_namespace(KEY_CONTROLLERS, dict)
-assert_type_namespace('CONTROLLERS.GENERIC_NAME', str)
-assert_type_namespace('CONTROLLERS.PATH', str)
-assert_type_namespace(KEY_DTO, dict)
-assert_type_namespace('DTO.PATH', str)
-assert_type_namespace('DTO.LIST_PATH', str)
-assert_type_namespace(KEY_SERVICE, dict)
-assert_type_namespace(KEY_REPOSITORY, dict)
-assert_type_namespace('REPOSITORY.IPATH', str)
-assert_type_namespace('REPOSITORY.PATH', str)
-assert_type_namespace('REPOSITORY.IGENERIC_NAME', str)
-assert_type_namespace('REPOSITORY.GENERIC_NAME', str)
-assert_type_namespace('REPOSITORY.REPOSITORY_VARIABLE', str)
-assert_type_namespace('REPOSITORY.LIST_PATH', str)
-assert_type_namespace('SERVICE.IPATH', str)
-assert_type_namespace('SERVICE.PATH', str)
-assert_type_namespace('SERVICE.IGENERIC_NAME', str)
-assert_type_namespace('SERVICE.GENERIC_NAME', str)
-assert_type_namespace('SERVICE.SERVICE_VARIABLE', str)
-assert_type_namespace('SERVICE.LIST_PATH', str)
-assert_type_namespace(KEY_MAPPER, dict)
-assert_type_namespace('MAPPER.PATH', str)
-assert_type_namespace('MAPPER.SERVICE_VARIABLE', str)
-assert_type_namespace('MAPPER.LIST_PATH', str)
-assert_type_namespace(KEY_DATA, dict)
-assert_type_namespace('DATA.PATH', str)
-assert_type_namespace(KEY_MODEL, dict)
-assert_type_namespace('MODEL.PATH', str)
-assert_type_namespace('MODEL.LIST', list)
-
-# API
-PATH_API=resolve_path('API_PATH')
-PATH_API_CONTROLLER=resolve_path(get_value_from_namespace('CONTROLLERS.PATH'))
-# APP
-PATH_APPLICATION=resolve_path('APPLICATION_PATH')
-PATH_APPLICATION_DTO=resolve_path(get_value_from_namespace('DTO.PATH'))
-PATH_APPLICATION_IREPOSITORY=resolve_path(get_value_from_namespace('REPOSITORY.IPATH'))
-PATH_APPLICATION_ISERVICE=resolve_path(get_value_from_namespace('SERVICE.IPATH'))
-PATH_APPLICATION_MAPPER=resolve_path(get_value_from_namespace('MAPPER.PATH'))
-# DOM
-PATH_DOMAIN=resolve_path('DOMAIN_PATH')
-PATH_DOMAIN_MODEL=resolve_path(get_value_from_namespace('MODEL.PATH'))
-# INF
-PATH_INFRASTRUCTURE=resolve_path('INFRASTRUCTURE_PATH')
-PATH_INFRASTRUCTURE_DATA=resolve_path(get_value_from_namespace('DATA.PATH'))
-PATH_INFRASTRUCTURE_REPOSITORY=resolve_path(get_value_from_namespace('REPOSITORY.PATH'))
-PATH_INFRASTRUCTURE_SERVICE=resolve_path(get_value_from_namespace('SERVICE.PATH'))
+CONFIG_SCHEMA = [
+    (KEY_CONTROLLERS, dict),
+    ('CONTROLLERS.GENERIC_NAME', str),
+    ('CONTROLLERS.PATH', str),
+    (KEY_DTO, dict),
+    ('DTO.PATH', str),
+    ('DTO.LIST_PATH', str),
+    (KEY_SERVICE, dict),
+    (KEY_REPOSITORY, dict),
+    ('REPOSITORY.IPATH', str),
+    ('REPOSITORY.PATH', str),
+    ('REPOSITORY.IGENERIC_NAME', str),
+    ('REPOSITORY.GENERIC_NAME', str),
+    ('REPOSITORY.REPOSITORY_VARIABLE', str),
+    ('REPOSITORY.LIST_PATH', str),
+    ('SERVICE.IPATH', str),
+    ('SERVICE.PATH', str),
+    ('SERVICE.IGENERIC_NAME', str),
+    ('SERVICE.GENERIC_NAME', str),
+    ('SERVICE.SERVICE_VARIABLE', str),
+    ('SERVICE.LIST_PATH', str),
+    (KEY_MAPPER, dict),
+    ('MAPPER.PATH', str),
+    ('MAPPER.SERVICE_VARIABLE', str),
+    ('MAPPER.LIST_PATH', str),
+    (KEY_DATA, dict),
+    ('DATA.PATH', str),
+    (KEY_MODEL, dict),
+    ('MODEL.PATH', str),
+    ('MODEL.LIST', list),
+]
+
+PATH_KEY_PATTERN = re.compile("ROOT_PATH|" + "|".join([KEY_API_PATH, KEY_APPLICATION_PATH, KEY_DOMAIN_PATH, KEY_INFRASTRUCTURE_PATH]))
 
-# 
-PATH_MAPPER_LIST_PATH=resolve_path(get_value_from_namespace('MAPPER.LIST_PATH'))
-PATH_REPOSITORY_LIST_PATH=resolve_path(get_value_from_namespace('REPOSITORY.LIST_PATH'))
-PATH_SERVICE_LIST_PATH=resolve_path(get_value_from_namespace('SERVICE.LIST_PATH'))
-
-VALID_SEARCH_PATHS = [
-    PATH_API,
-    PATH_API_CONTROLLER,
-    PATH_APPLICATION,
-    PATH_APPLICATION_DTO,
-    PATH_APPLICATION_IREPOSITORY,
-    PATH_APPLICATION_ISERVICE,
-    PATH_APPLICATION_MAPPER,
-    PATH_DOMAIN,
-    PATH_DOMAIN_MODEL,
-    PATH_INFRASTRUCTURE,
-    PATH_INFRASTRUCTURE_DATA,
-    PATH_INFRASTRUCTURE_SERVICE,
+def resolve_path(path:str, config:dict):
+    # All *_PATH keys are substituted in a single pass, separators are normalized once.
+    roots = {
+        'ROOT_PATH': __install_path__,
+        KEY_API_PATH: join(__install_path__, config[KEY_API_PATH]),
+        KEY_APPLICATION_PATH: join(__install_path__, config[KEY_APPLICATION_PATH]),
+        KEY_DOMAIN_PATH: join(__install_path__, config[KEY_DOMAIN_PATH]),
+        KEY_INFRASTRUCTURE_PATH: join(__install_path__, config[KEY_INFRASTRUCTURE_PATH]),
+    }
+    separator = get_path_separator()
+    return PATH_KEY_PATTERN.sub(lambda match: roots[match.group(0)], path).replace('\\', '/').replace('/', separator)
+
+SETTINGS_PATHS = (
+    # API
+    ('api', 'API_PATH'),
+    ('api_controller', 'CONTROLLERS.PATH'),
+    # APP
+    ('application', 'APPLICATION_PATH'),
+    ('application_dto', 'DTO.PATH'),
+    ('application_irepository', 'REPOSITORY.IPATH'),
+    ('application_iservice', 'SERVICE.IPATH'),
+    ('application_mapper', 'MAPPER.PATH'),
+    # DOM
+    ('domain', 'DOMAIN_PATH'),
+    ('domain_model', 'MODEL.PATH'),
+    # INF
+    ('infrastructure', 'INFRASTRUCTURE_PATH'),
+    ('infrastructure_data', 'DATA.PATH'),
+    ('infrastructure_repository', 'REPOSITORY.PATH'),
+    ('infrastructure_service', 'SERVICE.PATH'),
     # 
-    PATH_MAPPER_LIST_PATH,
-    PATH_REPOSITORY_LIST_PATH,
-    PATH_SERVICE_LIST_PATH
-]
+    ('mapper_list_path', 'MAPPER.LIST_PATH'),
+    ('repository_list_path', 'REPOSITORY.LIST_PATH'),
+    ('service_list_path', 'SERVICE.LIST_PATH'),
+)
+
+SETTINGS_NAMESPACES = (
+    ('controller_namespace', 'api_controller'),
+    ('dto_namespace', 'application_dto'),
+    ('irepository_namespace', 'application_irepository'),
+    ('iservice_namespace', 'application_iservice'),
+    ('mapper_namespace', 'application_mapper'),
+    ('model_namespace', 'domain_model'),
+    ('data_namespace', 'infrastructure_data'),
+    ('repository_namespace', 'infrastructure_repository'),
+    ('service_namespace', 'infrastructure_service'),
+)
+
+SETTINGS_VALUES = (
+    ('controller_generic_name', 'CONTROLLERS.GENERIC_NAME'),
+    ('repository_igeneric_name', 'REPOSITORY.IGENERIC_NAME'),
+    ('repository_generic_name', 'REPOSITORY.GENERIC_NAME'),
+    ('repository_variable', 'REPOSITORY.REPOSITORY_VARIABLE'),
+    ('service_igeneric_name', 'SERVICE.IGENERIC_NAME'),
+    ('service_generic_name', 'SERVICE.GENERIC_NAME'),
+    ('service_variable', 'SERVICE.SERVICE_VARIABLE'),
+    ('mapper_variable', 'MAPPER.SERVICE_VARIABLE'),
+    ('model_list', 'MODEL.LIST'),
+)
+
+# (field, json namespace, default, type) for keys older configs may not have, defaulting to their DEFAULT_CONFIG value.
+SETTINGS_OPTIONAL_VALUES = (
+    ('repository_projected_name', 'REPOSITORY.PROJECTED_GENERIC_NAME', DEFAULT_CONFIG[KEY_REPOSITORY][KEY_REPOSITORY_PROJECTED_GENERIC_NAME], str),
+    ('service_cached_name', 'SERVICE.CACHED_GENERIC_NAME', DEFAULT_CONFIG[KEY_SERVICE][KEY_SERVICE_CACHED_GENERIC_NAME], str),
+    ('dto_json_context', 'DTO.JSON_CONTEXT', DEFAULT_CONFIG[KEY_DTO][KEY_DTO_JSON_CONTEXT], bool),
+    ('model_options', 'MODEL.OPTIONS', DEFAULT_CONFIG[KEY_MODEL][KEY_MODEL_OPTIONS], dict),
+)
+
+def get_optional_value(json_namespace:str, default):
+    current = get_config()
+    for key in json_namespace.split('.'):
+        if  not isinstance(current, dict) or not key in current:
+            return default
+        current = current[key]
+    return current
 
-print("make::info: checking paths...")
-for path in VALID_SEARCH_PATHS:
-    if  not exists(path):
-        print("make::error: path not found: {}".format(path))
+class Settings:
+    """
+    Validated, immutable snapshot of make.info.config with every path and namespace resolved.
+    """
+    __slots__ = ('config_hash',) + tuple(field for field, _ in SETTINGS_PATHS + SETTINGS_NAMESPACES + SETTINGS_VALUES) + tuple(field for field, _, _, _ in SETTINGS_OPTIONAL_VALUES)
+
+    def __init__(self, values:dict):
+        for field in self.__slots__:
+            object.__setattr__(self, field, values[field])
+        object.__setattr__(self, 'model_list', tuple(self.model_list))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settings is immutable.")
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def get_model_options(self, model:str):
+        """
+        The options of a model: DEFAULT_MODEL_OPTIONS, overridden by MODEL.OPTIONS.DEFAULT, overridden by MODEL.OPTIONS.{model}.
+        """
+        return {**DEFAULT_MODEL_OPTIONS, **self.model_options.get("DEFAULT", {}), **self.model_options.get(capitalize(model), {})}
+
+    def valid_search_paths(self):
+        return [
+            self.api,
+            self.api_controller,
+            self.application,
+            self.application_dto,
+            self.application_irepository,
+            self.application_iservice,
+            self.application_mapper,
+            self.domain,
+            self.domain_model,
+            self.infrastructure,
+            self.infrastructure_data,
+            self.infrastructure_service,
+            # 
+            self.mapper_list_path,
+            self.repository_list_path,
+            self.service_list_path
+        ]
+
+def build_settings(config_hash:str):
+    for json_namespace, t in CONFIG_SCHEMA:
+        assert_type_namespace(json_namespace, t)
+
+    config = get_config()
+    values = {'config_hash': config_hash}
+    for field, json_namespace in SETTINGS_PATHS:
+        # Root keys (API_PATH, ...) resolve by themselves, nested keys hold a path template.
+        values[field] = resolve_path(json_namespace if not '.' in json_namespace else get_value_from_namespace(json_namespace), config)
+    for field, path_field in SETTINGS_NAMESPACES:
+        values[field] = get_name_space_from_root(values[path_field])
+    for field, json_namespace in SETTINGS_VALUES:
+        values[field] = get_value_from_namespace(json_namespace)
+    for field, json_namespace, default, t in SETTINGS_OPTIONAL_VALUES:
+        values[field] = get_optional_value(json_namespace, default)
+        if  not isinstance(values[field], t):
+            print("[make.info.config]make::error: invalid namespace type: {} (requires {})".format(json_namespace, t.__name__))
+            exit(1)
+
+    for model, options in values['model_options'].items():
+        if  not isinstance(options, dict):
+            print("[make.info.config]make::error: invalid namespace type: MODEL.OPTIONS.{} (requires dict)".format(model))
+            exit(1)
+        for key, value in options.items():
+            if  not key in DEFAULT_MODEL_OPTIONS:
+                print("[make.info.config]make::warning: unknown model option MODEL.OPTIONS.{}.{}".format(model, key))
+            elif type(value) is not type(DEFAULT_MODEL_OPTIONS[key]):
+                print("[make.info.config]make::error: invalid namespace type: MODEL.OPTIONS.{}.{} (requires {})".format(model, key, type(DEFAULT_MODEL_OPTIONS[key]).__name__))
+                exit(1)
+            elif key in MODEL_OPTION_CHOICES and not value in MODEL_OPTION_CHOICES[key]:
+                print("[make.info.config]make::error: invalid value for MODEL.OPTIONS.{}.{}: {} (one of {})".format(model, key, value, ", ".join(MODEL_OPTION_CHOICES[key])))
+                exit(1)
+            elif type(value) is int and value < 0:
+                print("[make.info.config]make::error: invalid value for MODEL.OPTIONS.{}.{}: {} (requires >= 0)".format(model, key, value))
+                exit(1)
+    return Settings(values)
+
+# Bump when the Settings fields change so stale caches are rebuilt.
+SETTINGS_CACHE_VERSION = 4
+PATH_CACHE = join(__install_path__, ".make")
+PATH_SETTINGS_CACHE = join(PATH_CACHE, "settings.json")
+
+_SETTINGS = None
+
+def get_settings():
+    """
+    The Settings of this run. Cached on disk keyed by the config file's mtime and hash,
+    so repeat runs with an unchanged make.info.config skip parsing and validation.
+    """
+    global _SETTINGS
+    if  _SETTINGS is not None:
+        return _SETTINGS
+
+    try:
+        mtime = stat(PATH_CONFIG).st_mtime_ns
+    except Exception as e:
+        print("make::error: failed to read config file.")
+        exit(1)
+
+    cache = None
+    try:
+        with open(PATH_SETTINGS_CACHE, "r", encoding="utf-8") as f:
+            content = f.read()
+        count("files_read")
+        count("bytes_read", len(content))
+        cache = json.loads(content)
+        if  cache.get("version") != SETTINGS_CACHE_VERSION or cache.get("root") != __install_path__:
+            cache = None
+    except Exception as e:
+        cache = None
+
+    if  cache is not None and cache.get("mtime") == mtime:
+        count("cache_hits")
+        _SETTINGS = Settings(cache["settings"])
+        return _SETTINGS
+
+    import hashlib
+    try:
+        with open(PATH_CONFIG, "rb") as f:
+            raw = f.read()
+        count("files_read")
+        count("bytes_read", len(raw))
+        config_hash = hashlib.sha1(raw).hexdigest()
+    except Exception as e:
+        print("make::error: failed to read config file.")
         exit(1)
-print("make::info: paths are valid.")
 
-print("""
+    if  cache is not None and cache["settings"].get("config_hash") == config_hash:
+        # Touched but unchanged.
+        count("cache_hits")
+        _SETTINGS = Settings(cache["settings"])
+    else:
+        count("cache_misses")
+        _SETTINGS = build_settings(config_hash)
+
+    try:
+        write_cache(PATH_SETTINGS_CACHE, json.dumps({"version": SETTINGS_CACHE_VERSION, "root": __install_path__, "mtime": mtime, "settings": _SETTINGS.to_dict()}))
+    except Exception as e:
+        print("make::warning: failed to write settings cache {}.".format(PATH_SETTINGS_CACHE))
+
+    return _SETTINGS
+
+class FileIndex:
+    """
+    One os.scandir listing per directory, taken once per run and kept current as files are written.
+    Every existence and membership check of a run is answered from it.
+    """
+    def __init__(self, directories:list):
+        import threading
+        self._lock = threading.Lock()
+        # directory -> {name: DirEntry or None (created by this run)}, None when the directory does not exist
+        self._entries = {}
+        with Phase("index"):
+            for directory in directories:
+                self._scan(directory)
+
+    def _scan(self, directory:str):
+        entries = None
+        try:
+            with scandir(directory) as iterator:
+                entries = {entry.name: entry for entry in iterator}
+        except Exception as e:
+            entries = None
+        self._entries[directory] = entries
+        return entries
+
+    def _listing(self, directory:str):
+        with self._lock:
+            if  directory in self._entries:
+                return self._entries[directory]
+            return self._scan(directory)
+
+    def listdir(self, directory:str):
+        entries = self._listing(directory)
+        return [] if entries is None else list(entries.keys())
+
+    def exists(self, path:str):
+        entries = self._listing(dirname(path))
+        return entries is not None and basename(path) in entries
+
+    def isfile(self, path:str):
+        entries = self._listing(dirname(path))
+        entry = None if entries is None else entries.get(basename(path), False)
+        if  entry is False:
+            return False
+        return entry is None or entry.is_file()
+
+    def stat(self, path:str):
+        entries = self._listing(dirname(path))
+        entry = None if entries is None else entries.get(basename(path))
+        # DirEntry caches its stat, entries written by this run are stat'ed directly.
+        return entry.stat() if entry is not None else stat(path)
+
+    def refresh(self, directory:str):
+        with self._lock:
+            self._scan(directory)
+
+    def add(self, path:str, is_dir:bool=False):
+        with self._lock:
+            entries = self._entries.get(dirname(path))
+            if  entries is not None:
+                entries[basename(path)] = None
+            if  is_dir:
+                self._entries[path] = {}
+
+_FILE_INDEX = None
+
+def get_file_index():
+    global _FILE_INDEX
+    if  _FILE_INDEX is None:
+        settings = get_settings()
+        _FILE_INDEX = FileIndex([
+            __install_path__,
+            settings.api,
+            settings.application,
+            settings.domain,
+            settings.infrastructure,
+            settings.api_controller,
+            settings.application_dto,
+            settings.application_irepository,
+            settings.application_iservice,
+            settings.application_mapper,
+            settings.domain_model,
+            settings.infrastructure_data,
+            settings.infrastructure_repository,
+            settings.infrastructure_service,
+        ])
+    return _FILE_INDEX
+
+###############################################
+# Output
+###############################################
+# "write", or "dry-run"/"diff" to only report what would be written.
+OUTPUT_MODE = "write"
+
+def read_output(path:str):
+    # Newlines are kept as they are on disk so CRLF files compare and round-trip unchanged.
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        content = f.read()
+    count("files_read")
+    count("bytes_read", len(content))
+    return content
+
+def report_output(path:str, old, new:str):
+    name = relpath(path, __install_path__)
+    if  OUTPUT_MODE == "diff":
+        import difflib
+        lines = difflib.unified_diff(
+            [] if old is None else old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            "/dev/null" if old is None else "a/" + name, "b/" + name)
+        print("".join(line if line.endswith("\n") else line + "\n" for line in lines), end="")
+    else:
+        print("{}::info: would {} {}.".format(OUTPUT_MODE, "create" if old is None else "update", name))
+
+def write_output(path:str, content:str, backup:bool=False):
+    """
+    Writes content ("\n" newlines) to path only when it differs from the file on disk. The file is written to a
+    temporary sibling and renamed over path, so a build never sees a half written file and an unchanged file keeps
+    its mtime. Existing files keep their newline style, new files get the platform's.
+    backup: keep the previous content in path.bak, only written when path actually changes.
+    Returns whether path changed (or would change under --dry-run/--diff).
+    """
+    from os import linesep
+    files = get_file_index()
+    old = read_output(path) if files.exists(path) else None
+    newline = linesep if old is None else ("\r\n" if "\r\n" in old else "\n")
+    content = content.replace("\r\n", "\n")
+    if  newline != "\n":
+        content = content.replace("\n", newline)
+    if  old == content:
+        return False
+
+    if  OUTPUT_MODE != "write":
+        report_output(path, old, content)
+        files.add(path)
+        return True
+
+    from os import replace, chmod, getpid
+    from threading import get_ident
+    temp_path = "{}.{}.{}.tmp".format(path, getpid(), get_ident())
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        if  old is not None:
+            chmod(temp_path, stat(path).st_mode & 0o7777)
+            if  backup:
+                with open(path + ".bak", "w", encoding="utf-8", newline="") as f:
+                    f.write(old)
+        replace(temp_path, path)
+        count("files_written")
+        count("bytes_written", len(content))
+    except BaseException:
+        if  exists(temp_path):
+            remove(temp_path)
+        raise
+    files.add(path)
+    return True
+
+def write_cache(path:str, content:str):
+    """
+    Writes a state file of .make (settings, model cache, manifest). Skipped under --dry-run/--diff, which leave the tree
+    byte-identical: nothing was generated to record, and the next run rebuilds what was not cached.
+    Returns whether the file was written.
+    """
+    if  OUTPUT_MODE != "write":
+        return False
+    if  not isdir(PATH_CACHE):
+        mkdir(PATH_CACHE)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    count("files_written")
+    count("bytes_written", len(content))
+    return True
+
+def make_directory(path:str):
+    files = get_file_index()
+    if  files.exists(path):
+        return
+    if  OUTPUT_MODE != "write":
+        print("{}::info: would create folder {}.".format(OUTPUT_MODE, relpath(path, __install_path__)))
+    else:
+        mkdir(path)
+    files.add(path, is_dir=True)
+
+def check_paths():
+    info("make::info: checking paths...")
+    files = get_file_index()
+    for path in get_settings().valid_search_paths():
+        if  not files.exists(path):
+            print("make::error: path not found: {}".format(path))
+            exit(1)
+    info("make::info: paths are valid.")
+
+def print_make_info():
+    settings = get_settings()
+    info("""
 MAKE INFO:
     - CONFIG PATH: {}
     - API PATH: {}
@@ -290,29 +786,30 @@ MAKE INFO:
                 // services.AddScoped</*IService*/, /*Service*/>();
 """.format(
     PATH_CONFIG,
-    PATH_API,
-    PATH_API_CONTROLLER,
-    PATH_APPLICATION,
-    PATH_APPLICATION_DTO,
-    PATH_APPLICATION_IREPOSITORY,
-    PATH_APPLICATION_ISERVICE,
-    PATH_APPLICATION_MAPPER,
-    PATH_DOMAIN,
-    PATH_DOMAIN_MODEL,
-    PATH_INFRASTRUCTURE,
-    PATH_INFRASTRUCTURE_DATA,
-    PATH_INFRASTRUCTURE_REPOSITORY,
-    PATH_INFRASTRUCTURE_SERVICE,
+    settings.api,
+    settings.api_controller,
+    settings.application,
+    settings.application_dto,
+    settings.application_irepository,
+    settings.application_iservice,
+    settings.application_mapper,
+    settings.domain,
+    settings.domain_model,
+    settings.infrastructure,
+    settings.infrastructure_data,
+    settings.infrastructure_repository,
+    settings.infrastructure_service,
     # OTHER
-    PATH_MAPPER_LIST_PATH,
-    PATH_REPOSITORY_LIST_PATH,
-    PATH_SERVICE_LIST_PATH
+    settings.mapper_list_path,
+    settings.repository_list_path,
+    settings.service_list_path
 ))
 
 CONTROLLER_TEMPLATE = """
 using Microsoft.AspNetCore.Mvc;
 using Swashbuckle.AspNetCore.Annotations;
 using {dto-namespace}.{controller-name};
+using {dto-namespace}.Request;
 using {dto-namespace}.Response;
 using {iservice-namespace};
 using {model-namespace};
@@ -336,23 +833,24 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
 
     /****************** ACTION ROUTES ******************/
     
-    /// <summary>
-    /// Get all data.
+{list-all-action}    /// <summary>
+    /// Stream all data.
     /// </summary>
-    /// <returns>A list of all {controller-name}s</returns>
-    /// <response code="200">When all {controller-name}s are successfully retrieved</response>
+    /// <returns>All {controller-name}s as they are read: a JSON array, or one JSON object per line when application/x-ndjson is accepted</returns>
+    /// <response code="200">When the {controller-name}s are successfully streamed</response>
     /// <response code="401">When the user is not authenticated</response>
     /// <response code="403">When the user is not authorized</response>
     /// <response code="500">When an unexpected error occurs during retrieval</response>
-    [HttpGet("all", Name = "getAll{controller-name}s")]
-    [SwaggerOperation(OperationId = "getAll{controller-name}s")]
+    [HttpGet("all/stream")]
+    [SwaggerOperation(OperationId = "streamAll{controller-name}s")]
+    [Produces("application/json", "application/x-ndjson")]
     [ProducesResponseType<List<Get{controller-name}Dto>>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status401Unauthorized)]
     [ProducesResponseType(StatusCodes.Status403Forbidden)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> GetAllAction()
+    public async Task GetAllStreamAction()
     {
-        return await GenericGetAll();
+        await GenericStreamAll();
     }
 
     /// <summary>
@@ -396,6 +894,52 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     {
         return await GenericGetByChunk(page, rows);
     }
+
+    /// <summary>
+    /// Get data after a continuation token, ordered by key.
+    /// </summary>
+    /// <param name="after">The continuation token of the previous page, omitted for the first page</param>
+    /// <param name="rows">The number of rows to retrieve</param>
+    /// <returns>A page of {controller-name}s and the continuation token of the next page</returns>
+    /// <response code="200">When the {controller-name}s are successfully retrieved</response>
+    /// <response code="400">When the continuation token is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("seek")]
+    [SwaggerOperation(OperationId = "seek{controller-name}s")]
+    [ProducesResponseType<SeekResponseDto<Get{controller-name}Dto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> SeekAction([FromQuery] string? after=null, [FromQuery] int rows=10)
+    {
+        return await GenericSeek(after, rows);
+    }
+
+    /// <summary>
+    /// Get the data matching filters.
+    /// </summary>
+    /// <param name="filters">The filters, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <param name="include">The include profile of the related data to load, one of the profiles make.py generates for the model</param>
+    /// <returns>The {controller-name}s matching the filters</returns>
+    /// <response code="200">When the {controller-name}s are successfully retrieved</response>
+    /// <response code="400">When the include profile is unknown</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("query")]
+    [SwaggerOperation(OperationId = "query{controller-name}s")]
+    [ProducesResponseType<List<Get{controller-name}Dto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> QueryAction([FromQuery] string filters="", [FromQuery] string include="")
+    {
+        return await GenericQuery(filters, include);
+    }
     
     /// <summary>
     /// Get specific data ({controller-name}) by id.
@@ -405,12 +949,12 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     /// <response code="200">When the {controller-name} is successfully retrieved</response>
     /// <response code="404">When the {controller-name} with specified ID is not found</response>
     /// <response code="500">When an unexpected error occurs during retrieval</response>
-    [HttpGet("{id:long}")]
+    [HttpGet("{key-route}")]
     [SwaggerOperation(OperationId = "get{controller-name}ById")]
     [ProducesResponseType<Get{controller-name}Dto>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> GetAction(long id)
+    public async Task<ActionResult> GetAction({key-type} id)
     {
         return await GenericGet(id);
     }
@@ -471,7 +1015,7 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     /// <response code="403">When the user is not authorized</response>
     /// <response code="404">When the {controller-name} with specified ID is not found</response>
     /// <response code="500">When an unexpected error occurs during update</response>
-    [HttpPatch("patch/{id:long}")]
+    [HttpPatch("patch/{key-route}")]
     [SwaggerOperation(OperationId = "patch{controller-name}")]
     [ProducesResponseType<Get{controller-name}Dto>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status400BadRequest)]
@@ -479,7 +1023,7 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     [ProducesResponseType(StatusCodes.Status403Forbidden)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> PatchAction(long id, {controller-name}Dto item)
+    public async Task<ActionResult> PatchAction({key-type} id, {controller-name}Dto item)
     {
         return await GenericUpdate(id, item);
     }
@@ -496,7 +1040,7 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     /// <response code="403">When the user is not authorized</response>
     /// <response code="404">When the {controller-name} with specified ID is not found</response>
     /// <response code="500">When an unexpected error occurs during update</response>
-    [HttpPut("update/{id:long}")]
+    [HttpPut("update/{key-route}")]
     [SwaggerOperation(OperationId = "update{controller-name}")]
     [ProducesResponseType<Get{controller-name}Dto>(StatusCodes.Status200OK)]
     [ProducesResponseType(StatusCodes.Status400BadRequest)]
@@ -504,10 +1048,32 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     [ProducesResponseType(StatusCodes.Status403Forbidden)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> UpdateAction(long id, {controller-name}Dto item)
+    public async Task<ActionResult> UpdateAction({key-type} id, {controller-name}Dto item)
     {
         return await GenericUpdate(id, item);
     }
+
+    /// <summary>
+    /// Updates multiple {controller-name}s with the same values in a single statement.
+    /// </summary>
+    /// <param name="batch">The IDs of the {controller-name}s and the values to write, only the given fields are written</param>
+    /// <returns>The number of updated {controller-name}s</returns>
+    /// <response code="200">When the {controller-name}s are successfully updated</response>
+    /// <response code="400">When the ids are empty or too many, no or unknown fields are given, or the provided data is invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during update</response>
+    [HttpPut("update/batch")]
+    [SwaggerOperation(OperationId = "updateBatch{controller-name}s")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> UpdateBatchAction(BatchUpdateDto<{key-type}, {controller-name}Dto> batch)
+    {
+        return await GenericUpdateBatch(batch.Ids, batch.Item, batch.Fields);
+    }
     
     /// <summary>
     /// Deletes single {controller-name} entry.
@@ -519,20 +1085,87 @@ public class {controller-name}Controller : {generic-name}<{controller-name}, I{c
     /// <response code="403">When the user is not authorized</response>
     /// <response code="404">When the {controller-name} with specified ID is not found</response>
     /// <response code="500">When an unexpected error occurs during deletion</response>
-    [HttpDelete("delete/{id:long}")]
+    [HttpDelete("delete/{key-route}")]
     [SwaggerOperation(OperationId = "delete{controller-name}")]
     [ProducesResponseType(StatusCodes.Status204NoContent)]
     [ProducesResponseType(StatusCodes.Status401Unauthorized)]
     [ProducesResponseType(StatusCodes.Status403Forbidden)]
     [ProducesResponseType(StatusCodes.Status404NotFound)]
     [ProducesResponseType(StatusCodes.Status500InternalServerError)]
-    public async Task<ActionResult> DeleteAction(long id)
+    public async Task<ActionResult> DeleteAction({key-type} id)
     {
         return await GenericDelete(id);
     }
+
+    /// <summary>
+    /// Deletes multiple {controller-name} entries in a single statement.
+    /// </summary>
+    /// <param name="ids">The IDs of the {controller-name}s to delete</param>
+    /// <returns>The number of deleted {controller-name}s</returns>
+    /// <response code="200">When the {controller-name}s are successfully deleted</response>
+    /// <response code="400">When the ids are empty or too many</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpPost("delete/batch")]
+    [SwaggerOperation(OperationId = "deleteBatch{controller-name}s")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteBatchAction(List<{key-type}> ids)
+    {
+        return await GenericDeleteBatch(ids);
+    }
+
+    /// <summary>
+    /// Deletes the {controller-name} entries matching filters in a single statement.
+    /// </summary>
+    /// <param name="filters">The filters of the {controller-name}s to delete, in the format of "field[operator]=value|field[operator]=value|..."</param>
+    /// <returns>The number of deleted {controller-name}s</returns>
+    /// <response code="200">When the {controller-name}s are successfully deleted</response>
+    /// <response code="400">When the filters are missing or invalid</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during deletion</response>
+    [HttpDelete("delete/where")]
+    [SwaggerOperation(OperationId = "deleteWhere{controller-name}s")]
+    [ProducesResponseType<int>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status400BadRequest)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> DeleteWhereAction([FromQuery] string filters)
+    {
+        return await GenericDeleteWhere(filters);
+    }
 }
 """
 
+# The unbounded list action of CONTROLLER_TEMPLATE, left out when MODEL.OPTIONS LIST_ALL is false.
+CONTROLLER_LIST_ALL_TEMPLATE = """\
+    /// <summary>
+    /// Get all data.
+    /// </summary>
+    /// <returns>A list of all {controller-name}s</returns>
+    /// <response code="200">When all {controller-name}s are successfully retrieved</response>
+    /// <response code="401">When the user is not authenticated</response>
+    /// <response code="403">When the user is not authorized</response>
+    /// <response code="500">When an unexpected error occurs during retrieval</response>
+    [HttpGet("all", Name = "getAll{controller-name}s")]
+    [SwaggerOperation(OperationId = "getAll{controller-name}s")]
+    [ProducesResponseType<List<Get{controller-name}Dto>>(StatusCodes.Status200OK)]
+    [ProducesResponseType(StatusCodes.Status401Unauthorized)]
+    [ProducesResponseType(StatusCodes.Status403Forbidden)]
+    [ProducesResponseType(StatusCodes.Status500InternalServerError)]
+    public async Task<ActionResult> GetAllAction()
+    {
+        return await GenericGetAll();
+    }
+
+"""
+
 IREPOSITORY_TEMPLATE = """
 using {dto-namespace}.{irepository-name};
 using {model-namespace};
@@ -545,12 +1178,7 @@ public interface I{irepository-name}Repository : {igeneric-name}<{repository-nam
 """
 
 REPOSITORY_TEMPLATE = """
-using AutoMapper;
-using {dto-namespace}.{repository-name};
-using {irepository-namespace};
-using {model-namespace};
-using {data-namespace};
-
+{repository-usings}
 namespace {repository-namespace};
 
 public class {repository-name}Repository:{generic-name}<{repository-name}, {repository-name}Dto, Get{repository-name}Dto>, I{repository-name}Repository
@@ -558,7 +1186,7 @@ public class {repository-name}Repository:{generic-name}<{repository-name}, {repo
     public {repository-name}Repository(AppDbContext context, IMapper mapper):base(context, mapper)
     {
     }
-}
+{repository-members}}
 
 """
 
@@ -573,6 +1201,25 @@ public interface I{service-name}Service:{igeneric-name}<{service-name}, {service
 }
 """
 
+# A repository reading Get{Model}Dto through a SQL projection (MODEL.OPTIONS PROJECTION).
+PROJECTED_REPOSITORY_TEMPLATE = """
+{repository-usings}
+namespace {repository-namespace};
+
+public class {repository-name}Repository:{generic-name}<{repository-name}, {repository-name}Dto, Get{repository-name}Dto>, I{repository-name}Repository
+{
+    public {repository-name}Repository(AppDbContext context, IMapper mapper):base(context, mapper)
+    {
+    }
+{repository-members}
+    protected override Expression<Func<{repository-name}, Get{repository-name}Dto>> Projection => item => new Get{repository-name}Dto
+    {
+{projection-members}
+    };
+}
+
+"""
+
 SERVICE_TEMPLATE = """
 using {dto-namespace}.{service-name};
 using {iservice-namespace};
@@ -589,6 +1236,68 @@ public class {service-name}Service:{generic-name}<I{service-name}Repository, {se
 }
 """
 
+# The typed filters of a repository (MODEL.OPTIONS FILTER_MAP).
+FILTER_MAP_TEMPLATE = """
+using INFRASTRUCTURE.Util;
+using {model-namespace};
+
+namespace {repository-namespace};
+
+/// <summary>
+/// The filterable fields of {repository-name} and of the models it navigates to.
+/// </summary>
+public class {repository-name}FilterMap : FilterMap<{repository-name}>
+{
+    public static readonly {repository-name}FilterMap Instance = new();
+{filter-strict}
+    private {repository-name}FilterMap()
+    {
+{filter-fields}
+    }
+}
+"""
+
+# The include profiles of a repository (MODEL.OPTIONS INCLUDE_PROFILES).
+INCLUDE_PROFILES_TEMPLATE = """
+using Microsoft.EntityFrameworkCore;
+using INFRASTRUCTURE.Util;
+using {model-namespace};
+
+namespace {repository-namespace};
+
+/// <summary>
+/// The navigations of {repository-name} Query may include, by profile name.
+/// </summary>
+public class {repository-name}IncludeProfiles : IncludeProfiles<{repository-name}>
+{
+    public static readonly {repository-name}IncludeProfiles Instance = new();
+
+    private {repository-name}IncludeProfiles()
+    {
+{include-profiles}
+    }
+}
+"""
+
+# A read-through cache decorator of a service (MODEL.OPTIONS CACHE).
+CACHED_SERVICE_TEMPLATE = """
+using {dto-namespace}.{service-name};
+using {iservice-namespace};
+using {model-namespace};
+
+namespace {service-namespace};
+
+public class {service-name}CachedService:{generic-name}<{service-name}, {service-name}Dto, Get{service-name}Dto>, I{service-name}Service
+{
+    public const long CacheSize = {cache-size};
+    public const int CacheTtlSeconds = {cache-ttl};
+
+    public {service-name}CachedService(I{service-name}Service service, ServiceCache<{service-name}> cache):base(service, cache)
+    {
+    }
+}
+"""
+
 DTO_TEMPLATE = """\
 using System.ComponentModel.DataAnnotations;
 
@@ -597,6 +1306,25 @@ namespace {dto-namespace};
 {dto-class}
 """
 
+# The System.Text.Json source generation context of every model's dtos (DTO.JSON_CONTEXT).
+JSON_CONTEXT_TEMPLATE = """\
+using System.Text.Json;
+using System.Text.Json.Serialization;
+{json-usings}
+
+namespace {dto-namespace};
+
+/// <summary>
+/// Serialization metadata of the dtos the controllers read and write.
+/// Registered in the JSON region of the injector, used when Json:Serializer is SystemTextJson.
+/// </summary>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+{json-types}
+public partial class {json-context} : JsonSerializerContext
+{
+}
+"""
+
 MAPPER_TEMPLATE="""\
 using {dto-namespace}.{mapper-name};
 using {model-namespace};
@@ -614,202 +1342,737 @@ public class {mapper-name}Mapper : Profile
 }
 """
 
-def get_model_class(_modelName):
-    modelName = capitalize(_modelName)
-    if  not (modelName + '.cs') in listdir(PATH_DOMAIN_MODEL):
-        print("get_model_class::error: model class {}.cs not found.".format(modelName))
-        exit(1)
+# Explicit mapping of a model and its dtos (MODEL.OPTIONS MODEL_MAPPER), the members {mapper-name}Mapper maps.
+MODEL_MAPPER_TEMPLATE = """\
+using System.Linq.Expressions;
+using System.Runtime.InteropServices;
+using {dto-namespace}.{mapper-name};
+{mapper-usings}using {model-namespace};
 
-    CLASS_PATH = join(PATH_DOMAIN_MODEL, modelName + '.cs')
-    content = ""
-    try:
-        fobj = open(CLASS_PATH, "r")
-        content = fobj.read()
-        fobj.close()
-    except Exception as e:
-        print("get_model_class::error: failed to read model class.")
-        exit(1)
-    
-    ## First class inside the file is the model class
-    index_of_public = content.find("public class")
+namespace {mapper-namespace};
 
-    if  index_of_public == -1:
-        print("get_model_class::error: public class not found.")
-        exit(1)
+public sealed class {mapper-name}ModelMapper : IModelMapper<{mapper-name}, {mapper-name}Dto, Get{mapper-name}Dto>
+{
+    public static readonly {mapper-name}ModelMapper Instance = new();
 
-    index = index_of_public
-    class_content = ""
+    private static readonly Expression<Func<{mapper-name}, Get{mapper-name}Dto>> ProjectionExpression = item => new Get{mapper-name}Dto
+    {
+{projection-members}
+    };
 
-    bracket_stack = []
+    public Expression<Func<{mapper-name}, Get{mapper-name}Dto>> Projection => ProjectionExpression;
 
-    while index < len(content):
-        char = content[index]
-        class_content += char
+    public {mapper-name} ToModel({mapper-name}Dto item)
+    {
+        return new {mapper-name}
+        {
+{model-members}
+        };
+    }
 
-        if  char == "{":
-            bracket_stack.append("{")
-        elif char == "}":
-            bracket_stack.pop()
+    public List<{mapper-name}> ToModels(ReadOnlySpan<{mapper-name}Dto> items)
+    {
+        var models = new List<{mapper-name}>(items.Length);
+        foreach (var item in items)
+        {
+            models.Add(ToModel(item));
+        }
+        return models;
+    }
 
-            if  len(bracket_stack) == 0:
-                break
+    public void Update({mapper-name}Dto item, {mapper-name} model)
+    {
+{update-members}
+    }
 
-        index += 1
-    
-    return class_content
+    public Get{mapper-name}Dto ToGetter({mapper-name} item)
+    {
+        return new Get{mapper-name}Dto
+        {
+{getter-members}
+        };
+    }
 
-def to_new_class(class_name, new_class_name):
-    class_content = get_model_class(class_name)
-    index = class_content.find("{")
-    if  index == -1:
-        print("to_new_class::error: public class not found.")
-        exit(1)
+    public List<Get{mapper-name}Dto> ToGetters(ReadOnlySpan<{mapper-name}> items)
+    {
+        var getters = new List<Get{mapper-name}Dto>(items.Length);
+        foreach (var item in items)
+        {
+            getters.Add(ToGetter(item));
+        }
+        return getters;
+    }
 
-    return "public class " + new_class_name + "\n" + class_content[index:]
+    public List<Get{mapper-name}Dto> ToGetters(List<{mapper-name}> items)
+    {
+        return ToGetters(CollectionsMarshal.AsSpan(items));
+    }
+}
+"""
 
-def get_repository_list():
-    content = ""
-    try:
-        fobj = open(PATH_REPOSITORY_LIST_PATH, "r", encoding="utf-8")
-        content = fobj.read()
-        fobj.close()
-    except Exception as e:
-        print("get_repository_list::error: failed to read repository list.")
-        exit(1)
-    
-    SEARCH_KEY="#region REPOSITORIES"
-    SEACRH_END="#endregion"
+# Every placeholder a template may use, anything else in {lower-dashed} form is rejected when the template is compiled.
+TEMPLATE_FIELDS = {
+    "cache-size", "cache-ttl",
+    "controller-name", "controller-namespace",
+    "dto-class", "dto-namespace",
+    "filter-fields", "filter-strict",
+    "generic-name", "getter-members", "igeneric-name",
+    "include-profiles",
+    "json-context", "json-types", "json-usings",
+    "irepository-name", "irepository-namespace",
+    "iservice-namespace",
+    "key-route", "key-type",
+    "list-all-action",
+    "mapper-name", "mapper-namespace", "mapper-usings",
+    "model-members", "model-namespace", "data-namespace",
+    "projection-members", "repository-members", "repository-usings",
+    "repository-name", "repository-namespace",
+    "service-name", "service-namespace",
+    "update-members",
+}
 
-    index_start = content.find(SEARCH_KEY)
-    index_ended = content.find(SEACRH_END, max(index_start, 0))
+# Placeholders always contain a dash so C# braces and route templates ({id:long}, {page:int}) stay literal.
+PLACEHOLDER_PATTERN = re.compile(r"\{([a-z]+(?:-[a-z]+)+)\}")
+
+class Template:
+    """
+    A template parsed once into literal and placeholder segments and rendered in a single pass.
+    """
+    __slots__ = ("name", "segments", "fields")
+
+    def __init__(self, name:str, text:str):
+        self.name = name
+        # re.split with one group alternates literal, placeholder, literal, ...
+        self.segments = PLACEHOLDER_PATTERN.split(text)
+        self.fields = [(index, self.segments[index]) for index in range(1, len(self.segments), 2)]
+        for _, field in self.fields:
+            if  not field in TEMPLATE_FIELDS:
+                print("template::error: unknown placeholder {{{}}} in {}.".format(field, name))
+                exit(1)
+
+    def render(self, context:dict):
+        parts = self.segments[:]
+        for index, field in self.fields:
+            value = context.get(field)
+            if  value is None:
+                print("template::error: missing value for placeholder {{{}}} in {}.".format(field, self.name))
+                exit(1)
+            parts[index] = value
+        return "".join(parts)
+
+TEMPLATES = {
+    "CONTROLLER": CONTROLLER_TEMPLATE,
+    "CONTROLLER_LIST_ALL": CONTROLLER_LIST_ALL_TEMPLATE,
+    "IREPOSITORY": IREPOSITORY_TEMPLATE,
+    "REPOSITORY": REPOSITORY_TEMPLATE,
+    "PROJECTED_REPOSITORY": PROJECTED_REPOSITORY_TEMPLATE,
+    "FILTER_MAP": FILTER_MAP_TEMPLATE,
+    "INCLUDE_PROFILES": INCLUDE_PROFILES_TEMPLATE,
+    "ISERVICE": ISERVICE_TEMPLATE,
+    "SERVICE": SERVICE_TEMPLATE,
+    "CACHED_SERVICE": CACHED_SERVICE_TEMPLATE,
+    "DTO": DTO_TEMPLATE,
+    "JSON_CONTEXT": JSON_CONTEXT_TEMPLATE,
+    "MAPPER": MAPPER_TEMPLATE,
+    "MODEL_MAPPER": MODEL_MAPPER_TEMPLATE,
+}
 
-    if  index_start == -1 or index_ended == -1:
-        print("get_repository_list::error: REPOSITORIES region not found.")
-        exit(1)
+_COMPILED_TEMPLATES = {}
+
+def get_template(name:str):
+    template = _COMPILED_TEMPLATES.get(name)
+    if  template is None:
+        template = _COMPILED_TEMPLATES[name] = Template(name + "_TEMPLATE", TEMPLATES[name])
+    return template
+
+_TEMPLATE_CONTEXTS = {}
+
+def get_template_context(name:str):
+    """
+    Model independent placeholder values of a template, computed once per run.
+    """
+    context = _TEMPLATE_CONTEXTS.get(name)
+    if  context is not None:
+        return context
+
+    settings = get_settings()
+    namespaces = {
+        "dto-namespace": settings.dto_namespace,
+        "iservice-namespace": settings.iservice_namespace,
+        "irepository-namespace": settings.irepository_namespace,
+        "model-namespace": settings.model_namespace,
+        "data-namespace": settings.data_namespace,
+    }
+    context = {
+        "CONTROLLER": lambda: {
+            **namespaces,
+            "controller-namespace": settings.controller_namespace,
+            "generic-name": settings.controller_generic_name,
+        },
+        "CONTROLLER_LIST_ALL": lambda: {},
+        "IREPOSITORY": lambda: {
+            **namespaces,
+            "igeneric-name": settings.repository_igeneric_name,
+        },
+        "REPOSITORY": lambda: {
+            **namespaces,
+            "repository-namespace": settings.repository_namespace,
+            "generic-name": settings.repository_generic_name,
+        },
+        "PROJECTED_REPOSITORY": lambda: {
+            **namespaces,
+            "repository-namespace": settings.repository_namespace,
+            "generic-name": settings.repository_projected_name,
+        },
+        "FILTER_MAP": lambda: {
+            **namespaces,
+            "repository-namespace": settings.repository_namespace,
+        },
+        "INCLUDE_PROFILES": lambda: {
+            **namespaces,
+            "repository-namespace": settings.repository_namespace,
+        },
+        "ISERVICE": lambda: {
+            **namespaces,
+            "igeneric-name": settings.service_igeneric_name,
+        },
+        "SERVICE": lambda: {
+            **namespaces,
+            "service-namespace": settings.service_namespace,
+            "generic-name": settings.service_generic_name,
+        },
+        "CACHED_SERVICE": lambda: {
+            **namespaces,
+            "service-namespace": settings.service_namespace,
+            "generic-name": settings.service_cached_name,
+        },
+        "DTO": lambda: {},
+        "JSON_CONTEXT": lambda: {
+            **namespaces,
+            "json-context": JSON_CONTEXT_NAME,
+        },
+        "MAPPER": lambda: {
+            **namespaces,
+            "mapper-namespace": settings.mapper_namespace,
+        },
+        "MODEL_MAPPER": lambda: {
+            **namespaces,
+            "mapper-namespace": settings.mapper_namespace,
+        },
+    }[name]()
+    _TEMPLATE_CONTEXTS[name] = context
+    return context
+
+def render_template(name:str, values:dict):
+    return get_template(name).render({**get_template_context(name), **values})
 
-    index = 0
-    new_content = ""
-
-    tab_index = 0
-
-    while (index < len(content)):
-        if  index >= index_start and index <= index_ended:
-            copy = index
-            while (copy < index_ended):
-                new_content += content[copy]
-                copy += 1
-            
-            new_content += ("\t{new-repository}\n")
-            new_content += ("\t" * tab_index)
-
-            index = index_ended
-            while (index < (index_ended + len(SEACRH_END))):
-                new_content += content[index]
-                index += 1
+###############################################
+# C# model parser
+###############################################
+
+CSHARP_TOKEN_PATTERN = re.compile(r"""
+      (?P<space>\s+)
+    | (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<directive>\#[^\n]*)
+    | (?P<raw>(?P<quotes>"{3,}).*?(?P=quotes))
+    | (?P<verbatim>(?:\$@|@\$|@)"(?:[^"]|"")*")
+    | (?P<string>\$?"(?:[^"\\\n]|\\.)*")
+    | (?P<char>'(?:[^'\\\n]|\\.)+')
+    | (?P<ident>@?[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<number>[0-9][A-Za-z0-9_.]*)
+    | (?P<punct>.)
+""", re.S | re.X)
+
+CSHARP_SKIPPED_TOKENS = {"space", "comment", "directive"}
+
+CSHARP_MODIFIERS = {
+    "public", "private", "protected", "internal", "static", "virtual", "override", "abstract",
+    "sealed", "readonly", "required", "new", "partial", "const", "extern", "unsafe", "volatile",
+}
+
+CSHARP_TYPE_KEYWORDS = {"class", "struct", "interface", "enum", "record", "delegate"}
+
+CSHARP_COLLECTION_TYPES = {
+    "List", "IList", "ICollection", "IEnumerable", "HashSet", "ISet",
+    "IReadOnlyCollection", "IReadOnlyList", "Collection",
+}
+
+def tokenize_csharp(content:str):
+    """
+    Splits C# source into (kind, text, start, end) tokens, whitespace, comments and
+    preprocessor lines are dropped so braces inside them never count.
+    """
+    tokens = []
+    for match in CSHARP_TOKEN_PATTERN.finditer(content):
+        kind = match.lastgroup
+        if  kind == "quotes":
+            kind = "raw"
+        if  kind in CSHARP_SKIPPED_TOKENS:
+            continue
+        tokens.append((kind, match.group(), match.start(), match.end()))
+    return tokens
+
+def find_closing_token(tokens:list, index:int, opening:str, closing:str):
+    depth = 0
+    while index < len(tokens):
+        text = tokens[index][1]
+        if  text == opening:
+            depth += 1
+        elif text == closing:
+            depth -= 1
+            if  depth == 0:
+                return index
+        index += 1
+    return -1
+
+def join_type_tokens(tokens:list):
+    return "".join((text + " ") if text == "," else text for _, text, _, _ in tokens)
+
+def split_type_arguments(type_name:str):
+    # "Dictionary<string, List<int>>" -> ["string", "List<int>"]
+    start = type_name.find("<")
+    if  start == -1 or not type_name.endswith(">"):
+        return []
+    arguments, depth, current = [], 0, ""
+    for char in type_name[start + 1:-1]:
+        if  char == "<":
+            depth += 1
+        elif char == ">":
+            depth -= 1
+        if  char == "," and depth == 0:
+            arguments.append(current.strip())
+            current = ""
+        else:
+            current += char
+    arguments.append(current.strip())
+    return arguments
+
+class ModelProperty:
+    """
+    A property of a parsed model class.
+    """
+    __slots__ = ("name", "type", "nullable", "attributes", "is_collection", "element_type", "has_setter", "is_key")
+
+    def __init__(self, name:str, type:str, nullable:bool, attributes:list, is_collection:bool, element_type:str, has_setter:bool, is_key:bool=False):
+        self.name = name
+        self.type = type
+        self.nullable = nullable
+        self.attributes = attributes
+        self.is_collection = is_collection
+        self.element_type = element_type
+        self.has_setter = has_setter
+        self.is_key = is_key
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+class ModelClass:
+    """
+    Lightweight result of parsing a model file: the class header, its properties and key member.
+    """
+    __slots__ = ("name", "source_hash", "attributes", "base_types", "properties", "key_name", "key_type", "class_text", "body")
+
+    def __init__(self, name:str, source_hash:str, attributes:list, base_types:list, properties:list, key_name, key_type, class_text:str, body:str):
+        self.name = name
+        self.source_hash = source_hash
+        self.attributes = attributes
+        self.base_types = base_types
+        self.properties = properties
+        self.key_name = key_name
+        self.key_type = key_type
+        self.class_text = class_text
+        self.body = body
+
+    def to_dict(self):
+        values = {field: getattr(self, field) for field in self.__slots__}
+        values["properties"] = [prop.to_dict() for prop in self.properties]
+        return values
+
+    @staticmethod
+    def from_dict(values:dict):
+        values = dict(values)
+        values["properties"] = [ModelProperty(**prop) for prop in values["properties"]]
+        return ModelClass(**values)
+
+    def get_property(self, name:str):
+        return next((prop for prop in self.properties if prop.name == name), None)
+
+def read_attribute_list(tokens:list, index:int):
+    # [Key, MaxLength(50)] -> ["Key", "MaxLength(50)"], returns the attributes and the index after "]"
+    ended = find_closing_token(tokens, index, "[", "]")
+    if  ended == -1:
+        return [], len(tokens)
+    attributes, current, depth = [], [], 0
+    for token in tokens[index + 1:ended]:
+        text = token[1]
+        if  text in ("(", "["):
+            depth += 1
+        elif text in (")", "]"):
+            depth -= 1
+        if  text == "," and depth == 0:
+            attributes.append(join_type_tokens(current))
+            current = []
         else:
-            if  content[index] == "{":
-                tab_index += 1
+            current.append(token)
+    if  len(current) > 0:
+        attributes.append(join_type_tokens(current))
+    return attributes, ended + 1
+
+def parse_members(tokens:list, index:int, ended:int, class_name:str):
+    """
+    Reads the properties declared directly inside a class body (tokens[index:ended]).
+    Methods, fields, constructors and nested types are skipped.
+    """
+    properties = []
+    attributes = []
+    member = []
+    while index < ended:
+        kind, text, _, _ = tokens[index]
+
+        if  text == "[" and len(member) == 0:
+            found, index = read_attribute_list(tokens, index)
+            attributes += found
+            continue
+
+        if  text == ";":
+            member, attributes = [], []
+            index += 1
+            continue
 
-            new_content += content[index]
+        if  text == "(":
+            # Method or constructor, skip its parameters and then its body or expression.
+            index = find_closing_token(tokens, index, "(", ")") + 1
+            while index < ended and tokens[index][1] not in ("{", ";"):
+                index += 1
+            if  index < ended and tokens[index][1] == "{":
+                index = find_closing_token(tokens, index, "{", "}")
+            member, attributes = [], []
+            index += 1
+            continue
+
+        if  text == "{":
+            close = find_closing_token(tokens, index, "{", "}")
+            words = [token[1] for token in member]
+            is_type = any(word in CSHARP_TYPE_KEYWORDS for word in words)
+            accessors = [token[1] for token in tokens[index + 1:close]]
+            if  not is_type and len(member) >= 2 and member[-1][0] == "ident" and not "static" in words and ("get" in accessors or "set" in accessors or "init" in accessors):
+                type_tokens = [token for token in member[:-1] if not token[1] in CSHARP_MODIFIERS]
+                type_name = join_type_tokens(type_tokens)
+                nullable = type_name.endswith("?")
+                type_name = type_name.rstrip("?")
+                generic_name = type_name.split("<")[0].split(".")[-1]
+                arguments = split_type_arguments(type_name)
+                is_collection = type_name.endswith("[]") or (generic_name in CSHARP_COLLECTION_TYPES and len(arguments) == 1)
+                element_type = type_name[:-2] if type_name.endswith("[]") else (arguments[0] if is_collection else type_name)
+                name = member[-1][1].lstrip("@")
+                properties.append(ModelProperty(
+                    name, type_name, nullable, attributes, is_collection, element_type.rstrip("?"),
+                    "set" in accessors or "init" in accessors,
+                    "Key" in attributes or name == "Id" or name == class_name + "Id"))
+                index = close + 1
+                # Initializer: = value;
+                if  index < ended and tokens[index][1] == "=":
+                    depth = 0
+                    while index < ended:
+                        if  tokens[index][1] in ("(", "{", "["):
+                            depth += 1
+                        elif tokens[index][1] in (")", "}", "]"):
+                            depth -= 1
+                        elif tokens[index][1] == ";" and depth == 0:
+                            break
+                        index += 1
+            else:
+                index = close + 1
+            member, attributes = [], []
+            continue
+
+        if  text == "=" and index + 1 < ended and tokens[index + 1][1] == ">":
+            # Expression bodied member, computed and never mapped.
+            while index < ended and tokens[index][1] != ";":
+                index += 1
+            member, attributes = [], []
+            continue
+
+        member.append(tokens[index])
+        index += 1
+
+    return properties
+
+def parse_model_class(content:str, model_name:str, source_hash:str=""):
+    """
+    Parses the model class of a C# file: the class named after the model, otherwise the first public class.
+    Returns None when the file declares no public class.
+    """
+    tokens = tokenize_csharp(content)
+    candidates = []
+    attributes = []
+    modifiers_start = None
+    index = 0
+    while index < len(tokens):
+        kind, text, start, _ = tokens[index]
+        if  text == "[":
+            found, index = read_attribute_list(tokens, index)
+            attributes += found
+            continue
+        if  text in CSHARP_MODIFIERS:
+            if  modifiers_start is None:
+                modifiers_start = index
+            index += 1
+            continue
+        if  text == "class" and index + 1 < len(tokens) and tokens[index + 1][0] == "ident":
+            first = modifiers_start if modifiers_start is not None else index
+            is_public = any(token[1] == "public" for token in tokens[first:index])
+            name = tokens[index + 1][1]
+            open_index = index + 2
+            while open_index < len(tokens) and tokens[open_index][1] != "{":
+                open_index += 1
+            close_index = find_closing_token(tokens, open_index, "{", "}")
+            if  close_index == -1:
+                break
+            if  is_public:
+                candidates.append((name, attributes, first, index + 2, open_index, close_index))
+            index = close_index + 1
+        elif text in ("{", "}", ";") or text in CSHARP_TYPE_KEYWORDS:
+            index += 1
+        else:
             index += 1
+            continue
+        attributes = []
+        modifiers_start = None
+
+    if  len(candidates) == 0:
+        return None
 
-    return new_content
+    name, attributes, first, header_index, open_index, close_index = next((candidate for candidate in candidates if candidate[0] == model_name), candidates[0])
+
+    # Base types: class X<T> : Base<T>, IFoo where T : ...
+    base_types = []
+    header = tokens[header_index:open_index]
+    if  len(header) > 0 and header[0][1] == "<":
+        header = header[find_closing_token(header, 0, "<", ">") + 1:]
+    if  len(header) > 0 and header[0][1] == ":":
+        current, depth = [], 0
+        for token in header[1:]:
+            if  token[1] == "where" and depth == 0:
+                break
+            if  token[1] == "<":
+                depth += 1
+            elif token[1] == ">":
+                depth -= 1
+            if  token[1] == "," and depth == 0:
+                base_types.append(join_type_tokens(current))
+                current = []
+            else:
+                current.append(token)
+        if  len(current) > 0:
+            base_types.append(join_type_tokens(current))
+
+    properties = parse_members(tokens, open_index + 1, close_index, name)
+
+    key = next((prop for prop in properties if "Key" in prop.attributes), None) \
+        or next((prop for prop in properties if prop.name == "Id"), None) \
+        or next((prop for prop in properties if prop.name == name + "Id"), None)
+    key_name, key_type = (key.name, key.type) if key is not None else (None, None)
+    for prop in properties:
+        prop.is_key = prop is key
+    if  key is None:
+        # Identity entities inherit their key: IdentityUser -> string, IdentityUser<TKey> -> TKey
+        for base in base_types:
+            if  base.split("<")[0].split(".")[-1].startswith("Identity"):
+                arguments = split_type_arguments(base)
+                key_name, key_type = "Id", (arguments[0] if len(arguments) > 0 else "string")
+                break
 
-def get_services_list():
-    content = ""
+    body_start = tokens[open_index][2]
+    body_end = tokens[close_index][3]
+    return ModelClass(
+        name, source_hash, attributes, base_types, properties, key_name, key_type,
+        content[tokens[first][2]:body_end], content[body_start:body_end])
+
+# Bump when ModelClass changes so stale cache entries are parsed again.
+MODEL_CACHE_VERSION = 1
+PATH_MODEL_CACHE = join(PATH_CACHE, "models.json")
+
+_MODEL_CACHE = None
+_MODEL_CACHE_DIRTY = False
+
+def load_model_cache():
+    # path -> {"mtime", "size", "hash", "model"}, shared by every run through .make/models.json
+    global _MODEL_CACHE
+    if  _MODEL_CACHE is not None:
+        return _MODEL_CACHE
     try:
-        fobj = open(PATH_SERVICE_LIST_PATH, "r", encoding="utf-8")
-        content = fobj.read()
-        fobj.close()
+        with open(PATH_MODEL_CACHE, "r", encoding="utf-8") as f:
+            content = f.read()
+        count("files_read")
+        count("bytes_read", len(content))
+        cache = json.loads(content)
+        _MODEL_CACHE = cache["entries"] if cache.get("version") == MODEL_CACHE_VERSION else {}
     except Exception as e:
-        print("get_services_list::error: failed to read services list.")
-        exit(1)
-    
-    SEARCH_KEY="#region SERVICES"
-    SEACRH_END="#endregion"
+        _MODEL_CACHE = {}
+    return _MODEL_CACHE
 
-    index_start = content.find(SEARCH_KEY)
-    index_ended = content.find(SEACRH_END, max(index_start, 0))
-
-    if  index_start == -1 or index_ended == -1:
-        print("get_services_list::error: SERVICES region not found.")
-        exit(1)
+def save_model_cache():
+    global _MODEL_CACHE_DIRTY
+    if  not _MODEL_CACHE_DIRTY:
+        return
+    try:
+        if  write_cache(PATH_MODEL_CACHE, json.dumps({"version": MODEL_CACHE_VERSION, "entries": _MODEL_CACHE})):
+            _MODEL_CACHE_DIRTY = False
+    except Exception as e:
+        print("make::warning: failed to write model cache {}.".format(PATH_MODEL_CACHE))
 
-    index = 0
-    new_content = ""
-
-    tab_index = 0
-
-    while (index < len(content)):
-        if  index >= index_start and index <= index_ended:
-            copy = index
-            while (copy < index_ended):
-                new_content += content[copy]
-                copy += 1
-            
-            new_content += ("\t{new-service}\n")
-            new_content += ("\t" * tab_index)
-
-            index = index_ended
-            while (index < (index_ended + len(SEACRH_END))):
-                new_content += content[index]
-                index += 1
-        else:
-            if  content[index] == "{":
-                tab_index += 1
+_PARSED_MODELS = {}
 
-            new_content += content[index]
-            index += 1
+def get_model(_modelName):
+    """
+    The parsed model class of DOMAIN/Model/{Model}.cs. Parsed once per run, and reused across runs
+    while the file's content hash is unchanged.
+    """
+    modelName = capitalize(_modelName)
+    model = _PARSED_MODELS.get(modelName)
+    if  model is not None:
+        return model
 
-    return new_content
+    with Phase("parse"):
+        model = _PARSED_MODELS[modelName] = load_model(modelName)
+    return model
 
-def get_automapper_list():
-    content = ""
+def load_model(modelName:str):
+    global _MODEL_CACHE_DIRTY
+    CLASS_PATH = join(get_settings().domain_model, modelName + '.cs')
     try:
-        fobj = open(PATH_MAPPER_LIST_PATH, "r", encoding="utf-8")
-        content = fobj.read()
-        fobj.close()
+        file_stat = get_file_index().stat(CLASS_PATH)
     except Exception as e:
-        print("get_services_list::error: failed to read automapper list.")
+        print("get_model_class::error: model class {}.cs not found.".format(modelName))
         exit(1)
-    
-    SEARCH_KEY="#region AUTOMAPPER"
-    SEACRH_END="#endregion"
 
-    index_start = content.find(SEARCH_KEY)
-    index_ended = content.find(SEACRH_END, max(index_start, 0))
+    cache = load_model_cache()
+    entry = cache.get(CLASS_PATH)
+    if  entry is not None and entry["mtime"] == file_stat.st_mtime_ns and entry["size"] == file_stat.st_size:
+        count("cache_hits")
+        return ModelClass.from_dict(entry["model"])
 
-    if  index_start == -1 or index_ended == -1:
-        print("get_services_list::error: AUTOMAPPER region not found.")
+    import hashlib
+    try:
+        with open(CLASS_PATH, "rb") as f:
+            raw = f.read()
+        count("files_read")
+        count("bytes_read", len(raw))
+    except Exception as e:
+        print("get_model_class::error: failed to read model class.")
         exit(1)
 
-    index = 0
-    new_content = ""
-
-    tab_index = 0
-
-    while (index < len(content)):
-        if  index >= index_start and index <= index_ended:
-            copy = index
-            while (copy < index_ended):
-                new_content += content[copy]
-                copy += 1
-            
-            new_content += ("\t{new-mapper}\n")
-            new_content += ("\t" * tab_index)
-
-            index = index_ended
-            while (index < (index_ended + len(SEACRH_END))):
-                new_content += content[index]
-                index += 1
-        else:
-            if  content[index] == "{":
-                tab_index += 1
+    source_hash = hashlib.sha1(raw).hexdigest()
+    if  entry is not None and entry["hash"] == source_hash:
+        count("cache_hits")
+        model = ModelClass.from_dict(entry["model"])
+    else:
+        count("cache_misses")
+        model = parse_model_class(raw.decode("utf-8-sig"), modelName, source_hash)
+        if  model is None:
+            print("get_model_class::error: public class not found.")
+            exit(1)
 
-            new_content += content[index]
-            index += 1
+    cache[CLASS_PATH] = {"mtime": file_stat.st_mtime_ns, "size": file_stat.st_size, "hash": source_hash, "model": model.to_dict()}
+    _MODEL_CACHE_DIRTY = True
+    return model
+
+def get_model_class(_modelName):
+    return get_model(_modelName).class_text
+
+def to_new_class(class_name, new_class_name):
+    return "public class " + new_class_name + "\n" + get_model(class_name).body
+
+REGION_START = "#region"
+REGION_END = "#endregion"
+
+def normalize_statement(line:str):
+    # Compare injector lines without comments and whitespace so hand written lines dedupe against generated ones.
+    index = line.find("//")
+    if  index != -1:
+        line = line[:index]
+    while True:
+        start = line.find("/*")
+        if  start == -1:
+            break
+        ended = line.find("*/", start + 2)
+        line = line[:start] + ("" if ended == -1 else line[ended + 2:])
+    return "".join(line.split())
+
+def splice_regions(content:str, regions:dict):
+    """
+    Inserts lines into any number of `#region NAME ... #endregion` blocks in a single scan.
+    regions: region name -> list of lines to add. Lines already present in the region are skipped,
+    new lines take the indentation of the last line inside the region.
+    Returns the new content and the number of lines added.
+    """
+    newline = "\r\n" if "\r\n" in content else "\n"
+    lines = content.splitlines(keepends=True)
+    output = []
+    # (region name, indentation of #region, body lines)
+    stack = []
+    found = set()
+    added = 0
+
+    for line in lines:
+        stripped = line.strip()
+        if  stripped.startswith(REGION_END):
+            if  len(stack) > 0:
+                name, indent, body = stack.pop()
+                if  name in regions:
+                    found.add(name)
+                    existing = set(normalize_statement(entry) for entry in body)
+                    indent = next((entry[:len(entry) - len(entry.lstrip())] for entry in reversed(body) if entry.strip()), indent + "    ")
+                    for new_line in regions[name]:
+                        key = normalize_statement(new_line)
+                        if  key in existing:
+                            continue
+                        existing.add(key)
+                        output.append(indent + new_line.strip() + newline)
+                        added += 1
+        elif stripped.startswith(REGION_START):
+            parts = stripped[len(REGION_START):].split()
+            stack.append((parts[0] if len(parts) > 0 else "", line[:len(line) - len(line.lstrip())], []))
+            output.append(line)
+            continue
+
+        if  len(stack) > 0:
+            stack[-1][2].append(line)
+        output.append(line)
+
+    for name in regions:
+        if  not name in found:
+            print("splice_regions::error: {} region not found.".format(name))
+            exit(1)
+
+    return "".join(output), added
+
+def queue_injection(injections:dict, path:str, region:str, line):
+    if  line is None:
+        return
+    lines = injections.setdefault(path, {}).setdefault(region, [])
+    if  not line in lines:
+        lines.append(line)
 
-    return new_content
+def write_injections(injections:dict):
+    # Each injector file is read once and only written (and backed up) when a line was actually added.
+    for path, regions in injections.items():
+        try:
+            content = read_output(path)
+        except Exception as e:
+            print("write_injections::error: failed to read {}.".format(path))
+            exit(1)
+
+        content, added = splice_regions(content, regions)
+        if  added == 0:
+            continue
+
+        try:
+            write_output(path, content, backup=True)
+        except Exception as e:
+            print("write_injections::error: failed to write {}.".format(path))
+            exit(1)
 
 ###############################################
 def get_name_space_from_root(path:str):
@@ -821,16 +2084,10 @@ def make_controller(_controllerName):
 
     try:
 
-        if  not exists(join(PATH_API_CONTROLLER, f"{controllerName}Controller.cs")):
-            with open(join(PATH_API_CONTROLLER, f"{controllerName}Controller.cs"), "w") as f:
-                f.write(CONTROLLER_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{iservice-namespace}", get_name_space_from_root(PATH_APPLICATION_ISERVICE))
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL))
-                    .replace("{controller-namespace}", get_name_space_from_root(PATH_API_CONTROLLER))
-                    .replace("{controller-name}", controllerName)
-                    .replace("{generic-name}", get_value_from_namespace('CONTROLLERS.GENERIC_NAME')))
-                f.close()
+        CONTROLLER_PATH = join(get_settings().api_controller, f"{controllerName}Controller.cs")
+        if  not get_file_index().exists(CONTROLLER_PATH):
+            list_all = render_template("CONTROLLER_LIST_ALL", {"controller-name": controllerName}) if get_settings().get_model_options(controllerName)["LIST_ALL"] else ""
+            write_output(CONTROLLER_PATH, render_template("CONTROLLER", {"controller-name": controllerName, "list-all-action": list_all, **get_controller_key(controllerName)}))
         else:
             print("make_controller::warning: controller already exists (skipped).")
 
@@ -840,19 +2097,391 @@ def make_controller(_controllerName):
 
 def get_irepository_path(_repositoryName):
     repositoryName = capitalize(_repositoryName)
-    return join(PATH_APPLICATION_IREPOSITORY, f"I{repositoryName}Repository.cs")
+    return join(get_settings().application_irepository, f"I{repositoryName}Repository.cs")
 
 def get_repository_path(_repositoryName):
     repositoryName = capitalize(_repositoryName)
-    return join(PATH_INFRASTRUCTURE_REPOSITORY, f"{repositoryName}Repository.cs")
+    return join(get_settings().infrastructure_repository, f"{repositoryName}Repository.cs")
 
 def get_iservice_path(_serviceName):
     serviceName = capitalize(_serviceName)
-    return join(PATH_APPLICATION_ISERVICE, f"I{serviceName}Service.cs")
+    return join(get_settings().application_iservice, f"I{serviceName}Service.cs")
 
 def get_service_path(_serviceName):
     serviceName = capitalize(_serviceName)
-    return join(PATH_INFRASTRUCTURE_SERVICE, f"{serviceName}Service.cs")
+    return join(get_settings().infrastructure_service, f"{serviceName}Service.cs")
+
+# Value types a projection may copy as is, anything else that is not a model (a navigation) is assumed to be an enum or struct.
+CSHARP_VALUE_TYPES = {
+    "bool", "byte", "sbyte", "char", "short", "ushort", "int", "uint", "long", "ulong", "float", "double", "decimal",
+    "DateTime", "DateTimeOffset", "DateOnly", "TimeOnly", "TimeSpan", "Guid",
+}
+
+# Members a model inherits from IdentityUser (name -> type, nullable).
+IDENTITY_USER_MEMBERS = {
+    "Id": ("string", False), "UserName": ("string", True), "NormalizedUserName": ("string", True),
+    "Email": ("string", True), "NormalizedEmail": ("string", True), "EmailConfirmed": ("bool", False),
+    "PasswordHash": ("string", True), "SecurityStamp": ("string", True), "ConcurrencyStamp": ("string", True),
+    "PhoneNumber": ("string", True), "PhoneNumberConfirmed": ("bool", False), "TwoFactorEnabled": ("bool", False),
+    "LockoutEnd": ("DateTimeOffset", True), "LockoutEnabled": ("bool", False), "AccessFailedCount": ("int", False),
+}
+
+def get_model_members(_modelName):
+    """
+    Every property of a model, including those inherited from base classes in DOMAIN/Model and from IdentityUser.
+    """
+    model = get_model(_modelName)
+    files = get_file_index()
+    members = {}
+    for base_type in model.base_types:
+        if  base_type.startswith("IdentityUser"):
+            for name, (type_name, nullable) in IDENTITY_USER_MEMBERS.items():
+                members[name] = ModelProperty(name, type_name, nullable, [], False, type_name, True)
+        elif files.exists(join(get_settings().domain_model, base_type + '.cs')):
+            members.update(get_model_members(base_type))
+    for prop in model.properties:
+        members[prop.name] = prop
+    return members
+
+# Key types the generic controller, service and repository take: C# type -> (route template, action parameter type).
+CONTROLLER_KEY_TYPES = {
+    "long": ("{id:long}", "long"), "Int64": ("{id:long}", "long"),
+    "string": ("{id}", "string"), "String": ("{id}", "string"),
+}
+
+def get_model_key(_modelName):
+    """
+    The key member (name, type) of a model, inherited from its base classes in DOMAIN/Model when it declares none.
+    (None, None) when the model has no key the parser recognizes.
+    """
+    model = get_model(_modelName)
+    if  model.key_type is not None:
+        return model.key_name, model.key_type.rstrip("?").split(".")[-1]
+    files = get_file_index()
+    for base_type in model.base_types:
+        if  files.exists(join(get_settings().domain_model, base_type + '.cs')):
+            key = get_model_key(base_type)
+            if  key[1] is not None:
+                return key
+    return None, None
+
+def get_controller_key(_modelName):
+    """
+    The {key-route} and {key-type} of a model's controller.
+    """
+    modelName = capitalize(_modelName)
+    _, key_type = get_model_key(modelName)
+    if  key_type not in CONTROLLER_KEY_TYPES:
+        print("make_controller::warning: {} key type of {} is not supported by the generic controller, using long.".format(key_type or "no", modelName))
+        key_type = "long"
+    route, parameter_type = CONTROLLER_KEY_TYPES[key_type]
+    return {"key-route": route, "key-type": parameter_type}
+
+def read_dto_class(_modelName, index:int):
+    """
+    The parsed Get{Model}Dto (index 0) or {Model}Dto (index 1) of a model as it is on disk, or as make_dto would write it.
+    None when the file has no such public class.
+    """
+    DTO_PATH, DTO = get_dto_files(_modelName)[index]
+    try:
+        return parse_model_class(read_output(DTO_PATH), DTO)
+    except OSError as e:
+        # Not written yet (make_repository runs before make_dto, or --dry-run).
+        return parse_model_class(render_dto(_modelName, DTO), DTO)
+
+def get_projection_members(_modelName):
+    """
+    The `Member = item.Member` assignments of a model's Get{Model}Dto projection. Based on the properties of
+    Get{Model}Dto as it is on disk (or as make_dto would write it), keeping the members SQL can read directly:
+    navigations, collections and members whose type differs from the model's are left to AutoMapper.
+    """
+    modelName = capitalize(_modelName)
+    getter = read_dto_class(_modelName, 0)
+    files = get_file_index()
+    if  getter is None:
+        print("make_repository::warning: public class {} not found, projection skipped.".format(get_dto_files(_modelName)[0][1]))
+        return []
+
+    members = get_model_members(modelName)
+    assignments = []
+    for prop in getter.properties:
+        member = members.get(prop.name)
+        if  member is None or not prop.has_setter or member.is_collection or prop.is_collection:
+            continue
+        if  member.type != prop.type or files.exists(join(get_settings().domain_model, member.type + '.cs')):
+            continue
+        if  member.nullable and not prop.nullable and member.type != "string":
+            if  not member.type in CSHARP_VALUE_TYPES:
+                continue
+            assignments.append("{} = item.{} ?? default".format(prop.name, member.name))
+        else:
+            assignments.append("{} = item.{}".format(prop.name, member.name))
+    return assignments
+
+READ_TRACKING_MEMBER = """
+    protected override QueryTrackingBehavior ReadTracking => QueryTrackingBehavior.{};
+"""
+
+# The tracking of the compiled read query, by READ_TRACKING (TrackAll reads use the write query).
+COMPILED_QUERY_TRACKING = {
+    "NoTracking": ".AsNoTracking()",
+    "NoTrackingWithIdentityResolution": ".AsNoTrackingWithIdentityResolution()",
+}
+
+COMPILED_READ_QUERY_MEMBER = """
+    private static readonly Func<AppDbContext, {key_type}, Task<{model}?>> FindByKeyForReadQuery =
+        EF.CompileAsyncQuery((AppDbContext context, {key_type} id) => context.Set<{model}>(){tracking}.FirstOrDefault(item => item.{key} == id));
+"""
+
+COMPILED_QUERIES_MEMBERS = """
+    private static readonly Func<AppDbContext, {key_type}, Task<{model}?>> FindByKeyQuery =
+        EF.CompileAsyncQuery((AppDbContext context, {key_type} id) => context.Set<{model}>().FirstOrDefault(item => item.{key} == id));
+{read_query}
+    private static readonly Func<AppDbContext, {key_type}, Task<bool>> ExistsQuery =
+        EF.CompileAsyncQuery((AppDbContext context, {key_type} id) => context.Set<{model}>().Any(item => item.{key} == id));
+
+    protected override async Task<{model}?> FindForReadAsync({key_type} id)
+    {{
+        return await {read_query_name}(_dbContext, id);
+    }}
+
+    protected override async Task<{model}?> FindForWriteAsync({key_type} id)
+    {{
+        return await FindByKeyQuery(_dbContext, id);
+    }}
+
+    public override async Task<bool> ExistsAsync({key_type} id)
+    {{
+        return await ExistsQuery(_dbContext, id);
+    }}
+"""
+
+# Added to COMPILED_QUERIES_MEMBERS in projected repositories, GetAsync reads Get{Model}Dto in SQL as the list reads do.
+COMPILED_PROJECTION_MEMBERS = """
+    private static readonly Func<AppDbContext, {key_type}, Task<Get{model}Dto?>> GetByKeyQuery =
+        EF.CompileAsyncQuery((AppDbContext context, {key_type} id) => context.Set<{model}>().AsNoTracking().Where(item => item.{key} == id).Select(item => new Get{model}Dto
+        {{
+{members}
+        }}).FirstOrDefault());
+
+    public override async Task<Get{model}Dto?> GetAsync({key_type} id)
+    {{
+        return await GetByKeyQuery(_dbContext, id) ?? throw new Error404Exception("Item not found");
+    }}
+"""
+
+INSERT_BATCH_SIZE_MEMBER = """
+    protected override int InsertBatchSize => {};
+"""
+
+def has_repository_options(_repositoryName):
+    # Whether the repository of a model differs from the plain REPOSITORY template.
+    options = get_settings().get_model_options(_repositoryName)
+    return options["PROJECTION"] or options["COMPILED_QUERIES"] or options["INSERT_BATCH_SIZE"] > 0 or options["FILTER_MAP"] \
+        or has_include_profiles(_repositoryName) or options["MODEL_MAPPER"] or options["READ_TRACKING"] != DEFAULT_MODEL_OPTIONS["READ_TRACKING"]
+
+FILTER_MAP_MEMBER = """
+    protected override FilterMap<{model}> Filters => {model}FilterMap.Instance;
+"""
+
+FILTER_LENIENT_MEMBER = """
+    public override bool Strict => false;
+"""
+
+# Operators of a filterable type, in FilterField property order.
+FILTER_EQUALITY = ("eq", "ne")
+FILTER_ORDERED = ("eq", "ne", "gt", "gte", "lt", "lte", "between")
+
+# C# type -> (FilterValue parser, operators) of the members a filter map covers, others are unfilterable unless FILTER_STRICT is off.
+FILTER_VALUE_TYPES = {
+    "string": ("String", ("eq", "ne", "contains")),
+    "bool": ("Bool", FILTER_EQUALITY), "Guid": ("Guid", FILTER_EQUALITY),
+    "byte": ("Byte", FILTER_ORDERED), "short": ("Short", FILTER_ORDERED), "int": ("Int", FILTER_ORDERED), "long": ("Long", FILTER_ORDERED),
+    "float": ("Float", FILTER_ORDERED), "double": ("Double", FILTER_ORDERED), "decimal": ("Decimal", FILTER_ORDERED),
+    "DateTime": ("DateTime", FILTER_ORDERED), "DateTimeOffset": ("DateTimeOffset", FILTER_ORDERED),
+    "DateOnly": ("DateOnly", FILTER_ORDERED), "TimeOnly": ("TimeOnly", FILTER_ORDERED), "TimeSpan": ("TimeSpan", FILTER_ORDERED),
+}
+
+FILTER_OPERATORS = {
+    "eq": "Eq = value => item => {member} == value",
+    "ne": "Ne = value => item => {member} != value",
+    "gt": "Gt = value => item => {member} > value",
+    "gte": "Gte = value => item => {member} >= value",
+    "lt": "Lt = value => item => {member} < value",
+    "lte": "Lte = value => item => {member} <= value",
+    "between": "Between = (low, high) => item => {member} >= low && {member} <= high",
+    "contains": "Contains = value => item => {member}{nullable}.Contains(value)",
+}
+
+# Identity secrets a filter map never covers, unfilterable unless FILTER_STRICT is off.
+FILTER_EXCLUDED_MEMBERS = {"PasswordHash", "SecurityStamp", "ConcurrencyStamp"}
+
+def get_filter_members(_modelName):
+    """
+    The (path, C# accessor, type) of the filterable members of a model: its mapped members of a FILTER_VALUE_TYPES type
+    and those of the models it navigates to, one level deep.
+    """
+    files = get_file_index()
+    members = []
+    for member in get_model_members(_modelName).values():
+        if  not member.has_setter or member.is_collection or "NotMapped" in member.attributes:
+            continue
+        if  member.type in FILTER_VALUE_TYPES and not member.name in FILTER_EXCLUDED_MEMBERS:
+            members.append((member.name, "item." + member.name, member.type, member.nullable))
+        elif files.exists(join(get_settings().domain_model, member.type + '.cs')):
+            navigation = "item.{}{}".format(member.name, "!" if member.nullable else "")
+            for target in get_model_members(member.type).values():
+                if  target.has_setter and not target.is_collection and not "NotMapped" in target.attributes \
+                    and target.type in FILTER_VALUE_TYPES and not target.name in FILTER_EXCLUDED_MEMBERS:
+                    members.append((member.name + "." + target.name, navigation + "." + target.name, target.type, target.nullable))
+    return members
+
+INCLUDE_PROFILES_MEMBER = """
+    protected override IncludeProfiles<{model}> Includes => {model}IncludeProfiles.Instance;
+"""
+
+def get_navigations(_modelName):
+    """
+    The (name, is collection) of the navigations of a model: its members typed as, or as a collection of, a model in DOMAIN/Model.
+    """
+    files = get_file_index()
+    navigations = []
+    for member in get_model_members(_modelName).values():
+        target = member.element_type if member.is_collection else member.type
+        if  not "NotMapped" in member.attributes and files.exists(join(get_settings().domain_model, target + '.cs')):
+            navigations.append((member.name, member.is_collection))
+    return navigations
+
+def has_include_profiles(_repositoryName):
+    # Models without navigations have nothing to include.
+    return get_settings().get_model_options(_repositoryName)["INCLUDE_PROFILES"] and len(get_navigations(_repositoryName)) > 0
+
+def get_include_profile(navigations:list):
+    # A collection multiplies the rows of a single query, so profiles including one are split per navigation.
+    includes = "".join(".Include(item => item.{})".format(name) for name, _ in navigations)
+    split = ".AsSplitQuery()" if any(is_collection for _, is_collection in navigations) else ""
+    return "query => query{}{}".format(includes, split)
+
+def get_include_profiles_path(_repositoryName):
+    repositoryName = capitalize(_repositoryName)
+    return join(get_settings().infrastructure_repository, f"{repositoryName}IncludeProfiles.cs")
+
+def render_include_profiles(_repositoryName):
+    """
+    The (path, content) of the {Model}IncludeProfiles of a model: a profile per navigation, named after it, and "All".
+    """
+    repositoryName = capitalize(_repositoryName)
+    navigations = get_navigations(repositoryName)
+    profiles = [(name, [(name, is_collection)]) for name, is_collection in navigations]
+    if  len(navigations) > 1:
+        profiles.append(("All", navigations))
+    return (get_include_profiles_path(repositoryName), render_template("INCLUDE_PROFILES", {
+        "repository-name": repositoryName,
+        "include-profiles": "\n".join("        Add(\"{}\", {});".format(name, get_include_profile(profile)) for name, profile in profiles),
+    }))
+
+def get_filter_map_path(_repositoryName):
+    repositoryName = capitalize(_repositoryName)
+    return join(get_settings().infrastructure_repository, f"{repositoryName}FilterMap.cs")
+
+def render_filter_map(_repositoryName):
+    """
+    The (path, content) of the {Model}FilterMap of a model, one FilterField per filterable member.
+    """
+    repositoryName = capitalize(_repositoryName)
+    fields = []
+    for path, accessor, type_name, nullable in get_filter_members(repositoryName):
+        parser, operators = FILTER_VALUE_TYPES[type_name]
+        fields.append("        Add(\"{}\", new FilterField<{}, {}>(FilterValue.{})\n        {{\n{}\n        }});".format(
+            path, repositoryName, type_name, parser,
+            ",\n".join("            " + FILTER_OPERATORS[operator].format(member=accessor, nullable="!" if nullable else "") for operator in operators)))
+    strict = "" if get_settings().get_model_options(repositoryName)["FILTER_STRICT"] else FILTER_LENIENT_MEMBER
+    return (get_filter_map_path(repositoryName), render_template("FILTER_MAP", {
+        "repository-name": repositoryName,
+        "filter-strict": strict,
+        "filter-fields": "\n".join(fields),
+    }))
+
+def get_compiled_query_key(_repositoryName):
+    """
+    The (name, C# type) of the key the compiled queries look up, None when the key type is not one the generic repository takes.
+    """
+    key_name, key_type = get_model_key(_repositoryName)
+    if  key_type not in CONTROLLER_KEY_TYPES:
+        print("make_repository::warning: {} key type of {} is not supported, compiled queries skipped.".format(key_type or "no", capitalize(_repositoryName)))
+        return None
+    return key_name, CONTROLLER_KEY_TYPES[key_type][1]
+
+def get_repository_usings(repositoryName:str, usings=()):
+    """
+    The using block of a repository: the usings of every repository and the given ones, each once,
+    System namespaces first then in ordinal order, so a repository renders the same whatever options added them.
+    """
+    settings = get_settings()
+    usings = [
+        "using AutoMapper;",
+        "using {}.{};".format(settings.dto_namespace, repositoryName),
+        "using {};".format(settings.irepository_namespace),
+        "using {};".format(settings.model_namespace),
+        "using {};".format(settings.data_namespace),
+        *usings,
+    ]
+    return "".join(using + "\n" for using in sorted(set(usings), key=lambda using: (not using.startswith("using System"), using)))
+
+def render_repository(_repositoryName):
+    """
+    The (path, content) of the repository of a model, shaped by its MODEL.OPTIONS: a projected repository
+    when PROJECTION is on, a ReadTracking override when READ_TRACKING is not TrackAll, an InsertBatchSize override
+    when INSERT_BATCH_SIZE is set, compiled lookups by key when COMPILED_QUERIES is on, a Filters override when FILTER_MAP is on, an Includes override
+    when INCLUDE_PROFILES is on and the model has navigations and a ModelMapper override when MODEL_MAPPER is on and the dtos are mappable.
+    """
+    repositoryName = capitalize(_repositoryName)
+    options = get_settings().get_model_options(repositoryName)
+    usings = []
+    members = []
+    if  options["READ_TRACKING"] != DEFAULT_MODEL_OPTIONS["READ_TRACKING"]:
+        usings.append("using Microsoft.EntityFrameworkCore;")
+        members.append(READ_TRACKING_MEMBER.format(options["READ_TRACKING"]))
+    if  options["INSERT_BATCH_SIZE"] > 0:
+        members.append(INSERT_BATCH_SIZE_MEMBER.format(options["INSERT_BATCH_SIZE"]))
+    if  options["FILTER_MAP"]:
+        usings.append("using INFRASTRUCTURE.Util;")
+        members.append(FILTER_MAP_MEMBER.format(model=repositoryName))
+    if  has_include_profiles(repositoryName):
+        usings.append("using INFRASTRUCTURE.Util;")
+        members.append(INCLUDE_PROFILES_MEMBER.format(model=repositoryName))
+    if  has_model_mapper(repositoryName):
+        usings.append("using {};".format(get_settings().mapper_namespace))
+        members.append(MODEL_MAPPER_MEMBER.format(model=repositoryName))
+
+    assignments = get_projection_members(repositoryName) if options["PROJECTION"] else []
+    key = get_compiled_query_key(repositoryName) if options["COMPILED_QUERIES"] else None
+    if  key is not None:
+        key_name, key_type = key
+        usings.append("using Microsoft.EntityFrameworkCore;")
+        tracking = COMPILED_QUERY_TRACKING.get(options["READ_TRACKING"])
+        read_query = "" if tracking is None else COMPILED_READ_QUERY_MEMBER.format(model=repositoryName, key=key_name, key_type=key_type, tracking=tracking)
+        members.append(COMPILED_QUERIES_MEMBERS.format(
+            model=repositoryName, key=key_name, key_type=key_type, read_query=read_query,
+            read_query_name="FindByKeyQuery" if tracking is None else "FindByKeyForReadQuery"))
+        if  len(assignments) > 0:
+            usings.append("using INFRASTRUCTURE.ExceptionHandler;")
+            members.append(COMPILED_PROJECTION_MEMBERS.format(
+                model=repositoryName, key=key_name, key_type=key_type, members=",\n".join("            " + assignment for assignment in assignments)))
+
+    values = {
+        "repository-name": repositoryName,
+        "repository-usings": get_repository_usings(repositoryName, usings),
+        "repository-members": "".join(members),
+    }
+    if  options["PROJECTION"]:
+        if  len(assignments) > 0:
+            values["repository-usings"] = get_repository_usings(repositoryName, usings + ["using System.Linq.Expressions;"])
+            values["projection-members"] = ",\n".join("        " + assignment for assignment in assignments)
+            return (get_repository_path(_repositoryName), render_template("PROJECTED_REPOSITORY", values))
+        print("make_repository::warning: no projectable member in Get{}Dto, using {} without projection.".format(repositoryName, get_settings().repository_projected_name))
+        values["generic-name"] = get_settings().repository_projected_name
+    return (get_repository_path(_repositoryName), render_template("REPOSITORY", values))
 
 def make_repository(_repositoryName):
     repositoryName = capitalize(_repositoryName)
@@ -860,20 +2489,12 @@ def make_repository(_repositoryName):
     irepository_exists = False
 
     try:
-        if  not (get_value_from_namespace('REPOSITORY.IGENERIC_NAME') + '.cs') in listdir(PATH_APPLICATION_IREPOSITORY):
-            print("make_repository::error: {}.cs not found at {}.".format(get_value_from_namespace('REPOSITORY.IGENERIC_NAME'), PATH_APPLICATION_IREPOSITORY))
+        if  not get_file_index().exists(join(get_settings().application_irepository, get_settings().repository_igeneric_name + '.cs')):
+            print("make_repository::error: {}.cs not found at {}.".format(get_settings().repository_igeneric_name, get_settings().application_irepository))
             exit(1)
 
-        if  not exists(get_irepository_path(_repositoryName)):
-            with open(get_irepository_path(_repositoryName), "w") as f:
-                f.write(IREPOSITORY_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{irepository-namespace}", get_name_space_from_root(PATH_APPLICATION_IREPOSITORY))
-                    .replace("{irepository-name}", repositoryName)
-                    .replace("{igeneric-name}", get_value_from_namespace('REPOSITORY.IGENERIC_NAME'))
-                    .replace("{repository-name}", repositoryName)
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL)))
-                f.close()
+        if  not get_file_index().exists(get_irepository_path(_repositoryName)):
+            write_output(get_irepository_path(_repositoryName), render_template("IREPOSITORY", {"irepository-name": repositoryName, "repository-name": repositoryName}))
         
         else:
             irepository_exists = True
@@ -885,21 +2506,23 @@ def make_repository(_repositoryName):
     repository_exists = False
 
     try:
-        if  not (get_value_from_namespace('REPOSITORY.GENERIC_NAME') + '.cs') in listdir(PATH_INFRASTRUCTURE_REPOSITORY):
-            print("make_repository::error: {}.cs not found at {}.".format(get_value_from_namespace('REPOSITORY.GENERIC_NAME'), PATH_INFRASTRUCTURE_REPOSITORY))
+        if  not get_file_index().exists(join(get_settings().infrastructure_repository, get_settings().repository_generic_name + '.cs')):
+            print("make_repository::error: {}.cs not found at {}.".format(get_settings().repository_generic_name, get_settings().infrastructure_repository))
             exit(1)
         
-        if  not exists(get_repository_path(_repositoryName)):
-            with open(get_repository_path(_repositoryName), "w") as f:
-                f.write(REPOSITORY_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{irepository-namespace}", get_name_space_from_root(PATH_APPLICATION_IREPOSITORY))
-                    .replace("{repository-namespace}", get_name_space_from_root(PATH_INFRASTRUCTURE_REPOSITORY))
-                    .replace("{generic-name}", get_value_from_namespace('REPOSITORY.GENERIC_NAME'))
-                    .replace("{repository-name}", repositoryName)
-                    .replace("{data-namespace}", get_name_space_from_root(PATH_INFRASTRUCTURE_DATA))
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL)))
-                f.close()
+        if  not get_file_index().exists(get_repository_path(_repositoryName)):
+            REPOSITORY_PATH, content = render_repository(_repositoryName)
+            write_output(REPOSITORY_PATH, content)
+            if  has_repository_options(repositoryName):
+                record_output(REPOSITORY_PATH, content)
+            if  get_settings().get_model_options(repositoryName)["FILTER_MAP"] and not get_file_index().exists(get_filter_map_path(repositoryName)):
+                FILTER_MAP_PATH, content = render_filter_map(repositoryName)
+                write_output(FILTER_MAP_PATH, content)
+                record_output(FILTER_MAP_PATH, content)
+            if  has_include_profiles(repositoryName) and not get_file_index().exists(get_include_profiles_path(repositoryName)):
+                INCLUDE_PROFILES_PATH, content = render_include_profiles(repositoryName)
+                write_output(INCLUDE_PROFILES_PATH, content)
+                record_output(INCLUDE_PROFILES_PATH, content)
         else:
             repository_exists = True
             print("make_repository::warning: repository implementation already exists (skipped).")
@@ -908,32 +2531,10 @@ def make_repository(_repositoryName):
         exit(1)
 
     if  repository_exists and irepository_exists:
-        print("make_repository::info: repository already exists (repository list not updated, skipped).")
-        return
-    
-    BAK = PATH_REPOSITORY_LIST_PATH + ".bak"
-    try:
-        fobj0 = open(PATH_REPOSITORY_LIST_PATH, "r", encoding="utf-8")
-        fobj1 = open(BAK, "w", encoding="utf-8")
-        content = fobj0.read()
-        fobj1.write(content)
-        fobj0.close()
-        fobj1.close()
-    except Exception as e:
-        print("make_repository::error: failed to backup repository list.")
-        exit(1)
+        info("make_repository::info: repository already exists (repository list not updated, skipped).")
+        return None
 
-    # Save
-    LINE = get_value_from_namespace('REPOSITORY.REPOSITORY_VARIABLE') + ".AddScoped<I{}Repository, {}Repository>(); /* added by make.py */".format(repositoryName, repositoryName)
-    NEW_REPOSITORY_LIST = get_repository_list().replace("{new-repository}", LINE)
-
-    try:
-        fobj = open(PATH_REPOSITORY_LIST_PATH, "w", encoding="utf-8")
-        fobj.write(NEW_REPOSITORY_LIST)
-        fobj.close()
-    except Exception as e:
-        print("make_repository::error: failed to write repository list.")
-        exit(1)
+    return get_settings().repository_variable + ".AddScoped<I{}Repository, {}Repository>(); /* added by make.py */".format(repositoryName, repositoryName)
 
 def make_service(_serviceName):
     serviceName = capitalize(_serviceName)
@@ -941,19 +2542,12 @@ def make_service(_serviceName):
     iservice_exists = False
 
     try:
-        if  not (get_value_from_namespace('SERVICE.IGENERIC_NAME') + '.cs') in listdir(PATH_APPLICATION_ISERVICE):
-            print("make_service:IService::error: {}.cs not found at {}.".format(get_value_from_namespace('SERVICE.IGENERIC_NAME'), PATH_APPLICATION_ISERVICE))
+        if  not get_file_index().exists(join(get_settings().application_iservice, get_settings().service_igeneric_name + '.cs')):
+            print("make_service:IService::error: {}.cs not found at {}.".format(get_settings().service_igeneric_name, get_settings().application_iservice))
             exit(1)
 
-        if  not exists(get_iservice_path(_serviceName)):
-            with open(get_iservice_path(_serviceName), "w") as f:
-                f.write(ISERVICE_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{igeneric-name}", get_value_from_namespace('SERVICE.IGENERIC_NAME'))
-                    .replace("{iservice-namespace}", get_name_space_from_root(PATH_APPLICATION_ISERVICE))
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL))
-                    .replace("{service-name}", serviceName))
-                f.close()
+        if  not get_file_index().exists(get_iservice_path(_serviceName)):
+            write_output(get_iservice_path(_serviceName), render_template("ISERVICE", {"service-name": serviceName}))
         else:
             iservice_exists = True
             print("make_service:IService::warning: service interface already exists (skipped).")
@@ -964,22 +2558,12 @@ def make_service(_serviceName):
     service_exists = False
 
     try:
-        if  not (get_value_from_namespace('SERVICE.GENERIC_NAME') + '.cs') in listdir(PATH_INFRASTRUCTURE_SERVICE):
-            print("make_service:Service::error: {}.cs not found at {}.".format(get_value_from_namespace('SERVICE.GENERIC_NAME'), PATH_INFRASTRUCTURE_SERVICE))
+        if  not get_file_index().exists(join(get_settings().infrastructure_service, get_settings().service_generic_name + '.cs')):
+            print("make_service:Service::error: {}.cs not found at {}.".format(get_settings().service_generic_name, get_settings().infrastructure_service))
             exit(1)
 
-        if  not exists(get_service_path(_serviceName)):
-            with open(get_service_path(_serviceName), "w") as f:
-                f.write(SERVICE_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{generic-name}", get_value_from_namespace('SERVICE.GENERIC_NAME'))
-                    .replace("{iservice-namespace}", get_name_space_from_root(PATH_APPLICATION_ISERVICE))
-                    .replace("{irepository-namespace}", get_name_space_from_root(PATH_APPLICATION_IREPOSITORY))
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL))
-                    .replace("{data-namespace}", get_name_space_from_root(PATH_INFRASTRUCTURE_DATA))
-                    .replace("{service-namespace}", get_name_space_from_root(PATH_INFRASTRUCTURE_SERVICE))
-                    .replace("{service-name}", serviceName))
-                f.close()
+        if  not get_file_index().exists(get_service_path(_serviceName)):
+            write_output(get_service_path(_serviceName), render_template("SERVICE", {"service-name": serviceName}))
         else:
             service_exists = True
             print("make_service:Service::warning: service implementation already exists (skipped).")
@@ -988,80 +2572,276 @@ def make_service(_serviceName):
         exit(1)
 
     if  service_exists and iservice_exists:
-        print("make_service::info: service already exists (services list not updated, skipped).")
-        return
+        info("make_service::info: service already exists (services list not updated, skipped).")
+        return None
 
-    BAK = PATH_SERVICE_LIST_PATH + ".bak"
-    try:
-        fobj0 = open(PATH_SERVICE_LIST_PATH, "r", encoding="utf-8")
-        fobj1 = open(BAK, "w", encoding="utf-8")
-        content = fobj0.read()
-        fobj1.write(content)
-        fobj0.close()
-        fobj1.close()
-    except Exception as e:
-        print("make_service::error: failed to backup service list.")
-        exit(1)
+    return get_settings().service_variable + ".AddScoped<I{}Service, {}Service>(); /* added by make.py */".format(serviceName, serviceName)
 
-    # Save
-    LINE = get_value_from_namespace('SERVICE.SERVICE_VARIABLE') + ".AddScoped<I{}Service, {}Service>(); /* added by make.py */".format(serviceName, serviceName)
-    NEW_SERVICE_LIST = get_services_list().replace("{new-service}", LINE)
+def get_cached_service_path(_serviceName):
+    serviceName = capitalize(_serviceName)
+    return join(get_settings().infrastructure_service, f"{serviceName}CachedService.cs")
+
+def render_cached_service(_serviceName):
+    """
+    The (path, content) of the cache decorator of a service, sized by its MODEL.OPTIONS CACHE_SIZE and CACHE_TTL_SECONDS.
+    """
+    serviceName = capitalize(_serviceName)
+    options = get_settings().get_model_options(serviceName)
+    return (get_cached_service_path(serviceName), render_template("CACHED_SERVICE", {
+        "service-name": serviceName,
+        "cache-size": str(options["CACHE_SIZE"]),
+        "cache-ttl": str(options["CACHE_TTL_SECONDS"]),
+    }))
+
+def get_cached_service_injection(_serviceName):
+    serviceName = capitalize(_serviceName)
+    # Size and TTL are read from the decorator's constants so the line stays the same when they change.
+    return get_settings().service_variable + ".AddCachedService<{0}, I{0}Service, {0}Service, {0}CachedService>({0}CachedService.CacheSize, {0}CachedService.CacheTtlSeconds); /* added by make.py */".format(serviceName)
+
+def make_cached_service(_serviceName):
+    if  not get_settings().get_model_options(_serviceName)["CACHE"]:
+        return None
 
     try:
-        fobj = open(PATH_SERVICE_LIST_PATH, "w", encoding="utf-8")
-        fobj.write(NEW_SERVICE_LIST)
-        fobj.close()
+        if  not get_file_index().exists(join(get_settings().infrastructure_service, get_settings().service_cached_name + '.cs')):
+            print("make_cached_service::error: {}.cs not found at {}.".format(get_settings().service_cached_name, get_settings().infrastructure_service))
+            exit(1)
+
+        if  get_file_index().exists(get_cached_service_path(_serviceName)):
+            print("make_cached_service::warning: cached service already exists (caching list not updated, skipped).")
+            return None
+
+        CACHED_SERVICE_PATH, content = render_cached_service(_serviceName)
+        write_output(CACHED_SERVICE_PATH, content)
+        record_output(CACHED_SERVICE_PATH, content)
     except Exception as e:
-        print("make_service::error: failed to write service list.")
+        print("make_cached_service::error: failed to create cached service {}.".format(get_cached_service_path(_serviceName)))
         exit(1)
 
+    return get_cached_service_injection(_serviceName)
+
 def get_dto_path(_dtoName):
-    return join(PATH_APPLICATION_DTO, capitalize(_dtoName))
+    return join(get_settings().application_dto, capitalize(_dtoName))
 
-def make_dto(_dtoName):
+def get_dto_files(_dtoName):
     dtoName = capitalize(_dtoName)
-    GETTER = f"Get{dtoName}Dto"
-    SETTER = f"{dtoName}Dto"
-    REQUIRED_FILES = [GETTER, SETTER]
+    DTO_MODEL_FOLDER = get_dto_path(_dtoName)
+    return [(join(DTO_MODEL_FOLDER, file) + '.cs', file) for file in (f"Get{dtoName}Dto", f"{dtoName}Dto")]
 
+def render_dto(_dtoName, file):
+    return render_template("DTO", {"dto-namespace": get_settings().dto_namespace + "." + capitalize(_dtoName), "dto-class": to_new_class(_dtoName, file)})
+
+def make_dto(_dtoName):
     DTO_MODEL_FOLDER = get_dto_path(_dtoName)
 
-    if  not exists(DTO_MODEL_FOLDER):
+    files = get_file_index()
+
+    if  not files.exists(DTO_MODEL_FOLDER):
         try:
-            print(f"make_dto::info: creating folder {DTO_MODEL_FOLDER}.")
-            mkdir(DTO_MODEL_FOLDER)
+            info(f"make_dto::info: creating folder {DTO_MODEL_FOLDER}.")
+            make_directory(DTO_MODEL_FOLDER)
         except Exception as e:
             print(f"make_dto::error: failed to create folder {DTO_MODEL_FOLDER}.")
             exit(1)
 
     try:
-        for file in REQUIRED_FILES:
-            if  not exists(join(DTO_MODEL_FOLDER, file) + '.cs'):
-                with open(join(DTO_MODEL_FOLDER, file) + '.cs', "w") as f:
-                    f.write(DTO_TEMPLATE
-                        .replace("{dto-namespace}", get_name_space_from_root(DTO_MODEL_FOLDER))
-                        .replace("{dto-class}", to_new_class(_dtoName, file)))
-                    f.close()
+        for DTO_PATH, file in get_dto_files(_dtoName):
+            if  not files.exists(DTO_PATH):
+                content = render_dto(_dtoName, file)
+                write_output(DTO_PATH, content)
+                record_output(DTO_PATH, content)
             else:
-                print(f"make_dto::warning: {file}.cs already exists (skipped).")
+                print(f"make_dto::warning: {basename(DTO_PATH)} already exists (skipped).")
     except Exception as e:
         print("make_dto::error: failed to create dto.")
         exit(1)
 
+JSON_CONTEXT_NAME = "AppJsonContext"
+# The types the json context lists per model ({0} the model, {1} its key type), the bodies and results of the generated controller.
+JSON_CONTEXT_TYPES = (
+    "{0}Dto", "List<{0}Dto>", "Get{0}Dto", "List<Get{0}Dto>",
+    "PaginationResponseDto<Get{0}Dto>", "SeekResponseDto<Get{0}Dto>", "BatchUpdateDto<{1}, {0}Dto>",
+)
+
+def get_json_context_path():
+    return join(get_settings().application_dto, JSON_CONTEXT_NAME + '.cs')
+
+def get_json_context_injection():
+    return "options.JsonSerializerOptions.TypeInfoResolverChain.Insert(0, {}.Default); /* added by make.py */".format(JSON_CONTEXT_NAME)
+
+def render_json_context(models:list):
+    """
+    The (path, content) of the json context, listing the dtos, their lists, pages and batches of every model that has both dtos.
+    """
+    settings = get_settings()
+    files = get_file_index()
+    model_files = files.listdir(settings.domain_model)
+    usings = ["using {}.Request;".format(settings.dto_namespace), "using {}.Response;".format(settings.dto_namespace)]
+    types = []
+    keys = []
+    for model in models:
+        if  not all(files.exists(path) for path, _ in get_dto_files(model)):
+            continue
+        key_type = get_model_key(model)[1] if (model + '.cs') in model_files else None
+        key_type = CONTROLLER_KEY_TYPES[key_type][1] if key_type in CONTROLLER_KEY_TYPES else "long"
+        if  not key_type in keys:
+            keys.append(key_type)
+        usings.append("using {}.{};".format(settings.dto_namespace, model))
+        types += [type_name.format(model, key_type) for type_name in JSON_CONTEXT_TYPES]
+    types += ["List<{}>".format(key_type) for key_type in keys]
+    return (get_json_context_path(), render_template("JSON_CONTEXT", {
+        "json-usings": "\n".join(usings),
+        "json-types": "\n".join("[JsonSerializable(typeof({}))]".format(type_name) for type_name in types),
+    }))
+
+def make_json_context(models:list):
+    """
+    Brings the json context up to date with MODEL.LIST and the models of this run. Returns its injection when it was written.
+    """
+    if  not get_settings().dto_json_context:
+        return None
+    manifest = load_manifest()
+    changed, written = sync_project_output(manifest, render_json_context(models))
+    if  changed:
+        save_manifest(manifest)
+    return get_json_context_injection() if written else None
+
+def render_mapper(_serviceName):
+    """
+    The (path, content) of the mapper of a model.
+    """
+    serviceName = capitalize(_serviceName)
+    return (join(get_settings().application_mapper, f"{serviceName}Mapper.cs"), render_template("MAPPER", {"mapper-name": serviceName}))
+
+MODEL_MAPPER_MEMBER = """
+    protected override IModelMapper<{model}, {model}Dto, Get{model}Dto> ModelMapper => {model}ModelMapper.Instance;
+"""
+
+def get_model_mapper_path(_mapperName):
+    return join(get_settings().application_mapper, f"{capitalize(_mapperName)}ModelMapper.cs")
+
+def is_model_type(type_name:str):
+    return get_file_index().exists(join(get_settings().domain_model, type_name + '.cs'))
+
+def get_flattened_value(members:dict, prop, source:str):
+    """
+    The value of a Get{Model}Dto member the model lacks, flattened from a navigation as AutoMapper does
+    (RoleName from Role.Name). None when no navigation has it.
+    """
+    for member in members.values():
+        if  member.is_collection or not prop.name.startswith(member.name) or prop.name == member.name or not is_model_type(member.type):
+            continue
+        nested = get_model_members(member.type).get(prop.name[len(member.name):])
+        if  nested is None or nested.is_collection or nested.type != prop.type:
+            continue
+        if  nested.nullable and not prop.nullable and nested.type != "string":
+            continue
+        return "{0}.{1} != null ? {0}.{1}.{2} : default".format(source, member.name, nested.name)
+    return None
+
+def get_getter_assignments(_modelName, source:str, indent:str, dtos:set, visited:tuple, warn:bool):
+    """
+    The `Member = value` lines of a Get{Model}Dto initializer reading the model from source. Members of the model's
+    type are copied, navigations read as their Get{Navigation}Dto are mapped inline, members the model lacks are flattened
+    from a navigation or left unset. None when a member needs a conversion only AutoMapper does.
+    dtos: collects the models whose Get{Model}Dto is mapped inline.
+    """
+    modelName = capitalize(_modelName)
+    getter = read_dto_class(modelName, 0)
+    if  getter is None:
+        if  warn:
+            print("make_mapper::warning: public class Get{}Dto not found, model mapper skipped.".format(modelName))
+        return None
+    members = get_model_members(modelName)
+    lines = []
+    for prop in getter.properties:
+        if  not prop.has_setter:
+            continue
+        member = members.get(prop.name)
+        if  member is None:
+            value = get_flattened_value(members, prop, source)
+            if  value is not None:
+                lines.append("{}{} = {}".format(indent, prop.name, value))
+        elif member.type == prop.type:
+            default = " ?? default" if member.nullable and not prop.nullable and member.type != "string" else ""
+            lines.append("{}{} = {}.{}{}".format(indent, prop.name, source, member.name, default))
+        elif not member.is_collection and prop.type == "Get{}Dto".format(member.type) and is_model_type(member.type) and not member.type in visited:
+            nested = get_getter_assignments(member.type, "{}.{}".format(source, member.name), indent + "    ", dtos, visited + (member.type,), warn)
+            if  nested is None:
+                return None
+            dtos.add(member.type)
+            lines.append("{0}{1} = {2}.{3} == null ? null : new {4}\n{0}{{\n{5}\n{0}}}".format(indent, prop.name, source, member.name, prop.type, ",\n".join(nested)))
+        else:
+            if  warn:
+                print("make_mapper::warning: Get{}Dto.{} ({}) is not mappable from {}.{} ({}), model mapper skipped.".format(
+                    modelName, prop.name, prop.type, modelName, member.name, member.type))
+            return None
+    return lines
+
+def get_setter_assignments(_modelName, warn:bool):
+    """
+    The (model member, value) pairs a {Model}Dto writes to the model, None when a member needs a conversion only AutoMapper does.
+    """
+    modelName = capitalize(_modelName)
+    setter = read_dto_class(modelName, 1)
+    if  setter is None:
+        if  warn:
+            print("make_mapper::warning: public class {}Dto not found, model mapper skipped.".format(modelName))
+        return None
+    members = get_model_members(modelName)
+    assignments = []
+    for prop in setter.properties:
+        member = members.get(prop.name)
+        if  member is None or not member.has_setter:
+            continue
+        if  member.type != prop.type:
+            if  warn:
+                print("make_mapper::warning: {}Dto.{} ({}) is not mappable to {}.{} ({}), model mapper skipped.".format(
+                    modelName, prop.name, prop.type, modelName, member.name, member.type))
+            return None
+        default = " ?? default" if prop.nullable and not member.nullable and prop.type != "string" else ""
+        assignments.append((member.name, "item.{}{}".format(prop.name, default)))
+    return assignments
+
+def render_model_mapper(_mapperName, warn:bool=True):
+    """
+    The (path, content) of the model mapper of a model, None when its dtos need AutoMapper conversions.
+    """
+    mapperName = capitalize(_mapperName)
+    dtos = set()
+    setters = get_setter_assignments(mapperName, warn)
+    getters = None if setters is None else get_getter_assignments(mapperName, "item", "            ", dtos, (mapperName,), warn)
+    if  getters is None:
+        return None
+    # The same members at the indentation of the projection field
+    projection = get_getter_assignments(mapperName, "item", "        ", set(), (mapperName,), False)
+    settings = get_settings()
+    return (get_model_mapper_path(mapperName), render_template("MODEL_MAPPER", {
+        "mapper-name": mapperName,
+        "mapper-usings": "".join("using {}.{};\n".format(settings.dto_namespace, dto) for dto in sorted(dtos)),
+        "model-members": ",\n".join("            {} = {}".format(name, value) for name, value in setters),
+        "update-members": "\n".join("        model.{} = {};".format(name, value) for name, value in setters),
+        "getter-members": ",\n".join(getters),
+        "projection-members": ",\n".join(projection),
+    }))
+
+def has_model_mapper(_mapperName):
+    # Whether the repository of a model maps with a generated model mapper.
+    return get_settings().get_model_options(_mapperName)["MODEL_MAPPER"] and render_model_mapper(_mapperName, False) is not None
+
+def get_mapper_injection(_serviceName):
+    return get_settings().mapper_variable + ".AddAutoMapper(typeof({}Mapper)); /* added by make.py */".format(capitalize(_serviceName))
+
 def make_mapper(_serviceName):
     serviceName = capitalize(_serviceName)
 
     mapper_exists = False
 
     try:
-        if  not exists(join(PATH_APPLICATION_MAPPER, f"{serviceName}Mapper.cs")):
-            with open(join(PATH_APPLICATION_MAPPER, f"{serviceName}Mapper.cs"), "w") as f:
-                f.write(MAPPER_TEMPLATE
-                    .replace("{dto-namespace}", get_name_space_from_root(PATH_APPLICATION_DTO))
-                    .replace("{model-namespace}", get_name_space_from_root(PATH_DOMAIN_MODEL))
-                    .replace("{mapper-namespace}", get_name_space_from_root(PATH_APPLICATION_MAPPER))
-                    .replace("{mapper-name}", serviceName))
-                f.close()
+        MAPPER_PATH, content = render_mapper(_serviceName)
+        if  not get_file_index().exists(MAPPER_PATH):
+            write_output(MAPPER_PATH, content)
+            record_output(MAPPER_PATH, content)
         else:
             mapper_exists = True
             print(f"make_mapper::warning: mapper {serviceName}Mapper.cs already exists (skipped).")
@@ -1069,73 +2849,686 @@ def make_mapper(_serviceName):
         print("make_mapper::error: failed to create mapper.")
         exit(1)
 
+    if  get_settings().get_model_options(serviceName)["MODEL_MAPPER"]:
+        try:
+            if  not get_file_index().exists(get_model_mapper_path(serviceName)):
+                rendered = render_model_mapper(serviceName)
+                if  rendered is not None:
+                    MODEL_MAPPER_PATH, content = rendered
+                    write_output(MODEL_MAPPER_PATH, content)
+                    record_output(MODEL_MAPPER_PATH, content)
+            else:
+                print(f"make_mapper::warning: model mapper {serviceName}ModelMapper.cs already exists (skipped).")
+        except Exception as e:
+            print("make_mapper::error: failed to create model mapper {}.".format(get_model_mapper_path(serviceName)))
+            exit(1)
+
     if  mapper_exists:
-        print("make_mapper::info: mapper already exists (mapper list not updated, skipped).")
-        return
-    
-    BAK = PATH_MAPPER_LIST_PATH + ".bak"
-    try:
-        fobj0 = open(PATH_MAPPER_LIST_PATH, "r", encoding="utf-8")
-        fobj1 = open(BAK, "w", encoding="utf-8")
-        content = fobj0.read()
-        fobj1.write(content)
-        fobj0.close()
-        fobj1.close()
-    except Exception as e:
-        print("make_service::error: failed to backup mapper list.")
-        exit(1)
+        info("make_mapper::info: mapper already exists (mapper list not updated, skipped).")
+        return None
 
-    # Save
-    LINE = get_value_from_namespace('MAPPER.SERVICE_VARIABLE') + ".AddAutoMapper(typeof({}Mapper)); /* added by make.py */".format(serviceName)
-    NEW_MAPPER_LIST = get_automapper_list().replace("{new-mapper}", LINE)
+    return get_mapper_injection(_serviceName)
+
+def parse_model_list(value:str):
+    models = []
+    for model in value.split(','):
+        model = model.strip()
+        if  len(model) > 0 and not capitalize(model) in models:
+            models.append(capitalize(model))
+    return models
+
+def make_models(models:list, jobs:int=1):
+    model_files = get_file_index().listdir(get_settings().domain_model)
+    for model in models:
+        # Check if model exists
+        if  not ((model + '.cs') in model_files):
+            print("make::error: model {} not found at {}.".format(model + '.cs', get_settings().domain_model))
+            exit(1)
 
+    # (step name, make function, injector list path)
+    steps = [
+        ("controller", make_controller, None),
+        ("repository", make_repository, (get_settings().repository_list_path, "REPOSITORIES")),
+        ("service", make_service, (get_settings().service_list_path, "SERVICES")),
+        ("cached service", make_cached_service, (get_settings().service_list_path, "CACHING")),
+        ("dto", make_dto, None),
+        ("mapper", make_mapper, (get_settings().mapper_list_path, "AUTOMAPPER")),
+    ]
+
+    results = []
+    if  jobs <= 1:
+        for model in models:
+            for index, (name, make, target) in enumerate(steps):
+                info("make::info:[{}][step {} of {}]: running make {}...".format(model, index + 1, len(steps), name))
+                with Phase(name):
+                    results.append((target, make(model)))
+    else:
+        # Per-model files never overlap, only the injectors and the config are shared.
+        # Those are committed below in submission order so the output does not depend on scheduling.
+        from concurrent.futures import ThreadPoolExecutor
+        info("make::info: running {} make tasks on {} workers...".format(len(models) * len(steps), jobs))
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [(target, executor.submit(run_phase, name, make, model)) for model in models for (name, make, target) in steps]
+            try:
+                for target, future in futures:
+                    results.append((target, future.result()))
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    injections = {}
+    for target, line in results:
+        if  target is not None:
+            queue_injection(injections, target[0], target[1], line)
+
+    with Phase("permissions"):
+        make_permissions()
+
+    with Phase("json context"):
+        models_listed = parse_model_list(",".join(list(get_settings().model_list) + models))
+        queue_injection(injections, get_settings().service_list_path, "JSON", make_json_context(models_listed))
+
+    info("make::info: updating injectors...")
+    with Phase("injectors"):
+        write_injections(injections)
+    with Phase("manifest"):
+        update_manifest(models)
+        save_model_cache()
+
+    for model in models:
+        if not model in get_config()["MODEL"]["LIST"]: get_config()["MODEL"]["LIST"].append(model)
+    write_config()
+    info("make::info: done.")
+
+def write_config():
     try:
-        fobj = open(PATH_MAPPER_LIST_PATH, "w", encoding="utf-8")
-        fobj.write(NEW_MAPPER_LIST)
-        fobj.close()
+        with Phase("write config"):
+            write_output(PATH_CONFIG, json.dumps(get_config(), indent=4))
     except Exception as e:
-        print("make_service::error: failed to write mapper list.")
+        print("make::error: failed to write config file.")
         exit(1)
 
 
-argparse = ArgumentParser(description="A simple script to generate controller, service, dto, and mapper classes for a given model.")
-argparse.add_argument("-m", '--model', metavar='\b', type=str, help="Generate controller, service, dto, and mapper.")
-argparse.add_argument("-p", '--patch', action='store_true', help="Update model list inside config file.")
+###############################################
+# Incremental regeneration (--sync)
+###############################################
+# Bump when a change to make.py itself alters generated dto or mapper output.
+MANIFEST_VERSION = 1
+PATH_MANIFEST = join(PATH_CACHE, "manifest.json")
+
+# Templates whose output --sync keeps up to date.
+SYNC_TEMPLATES = ("DTO", "MAPPER", "REPOSITORY", "PROJECTED_REPOSITORY", "FILTER_MAP", "INCLUDE_PROFILES", "CACHED_SERVICE", "MODEL_MAPPER")
+
+# path -> content hash of every dto and mapper written by this run, see record_output.
+_GENERATED_OUTPUTS = {}
+
+def hash_text(text:str):
+    import hashlib
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def record_output(path:str, content:str):
+    _GENERATED_OUTPUTS[path] = hash_text(content)
+
+def get_sync_inputs():
+    """
+    Generator inputs shared by every model. MODEL.LIST is left out so adding a model does not
+    invalidate the others.
+    """
+    settings = get_settings().to_dict()
+    del settings["config_hash"], settings["model_list"]
+    return {
+        "version": MANIFEST_VERSION,
+        "config": hash_text(json.dumps(settings, sort_keys=True)),
+        "templates": {name: hash_text(TEMPLATES[name]) for name in SYNC_TEMPLATES},
+    }
 
-args = argparse.parse_args()
+def load_manifest():
+    # {"inputs": get_sync_inputs(), "models": {model: {"mtime", "size", "hash", "outputs": {relative path: hash}}},
+    #  "outputs": {relative path: hash} of the files not generated per model}
+    try:
+        with open(PATH_MANIFEST, "r", encoding="utf-8") as f:
+            content = f.read()
+        count("files_read")
+        count("bytes_read", len(content))
+        manifest = json.loads(content)
+        if  isinstance(manifest.get("models"), dict):
+            return manifest
+    except Exception as e:
+        pass
+    return {"inputs": None, "models": {}}
 
-if  args.model:
-    model = args.model
-    # Check if model exists
-    if  not ((capitalize(str(model)) + '.cs') in listdir(PATH_DOMAIN_MODEL)):
-        print("make::error: model {} not found at {}.".format(capitalize(str(model)) + '.cs', PATH_DOMAIN_MODEL))
-        exit(1)
-    print("make::info:[step 1 of 5]: running make service...")
-    make_controller(model)
-    print("make::info:[step 2 of 5]: running make repository...")
-    make_repository(model)
-    print("make::info:[step 3 of 5]: running make service...")
-    make_service(model)
-    print("make::info:[step 4 of 5]: running make dto...")
-    make_dto(model)
-    print("make::info:[step 5 of 5]: running make mapper...")
-    make_mapper(model)
-    print("make::info: done.")
-    if not model in CONFIG["MODEL"]["LIST"]: CONFIG["MODEL"]["LIST"].append(model)
+def save_manifest(manifest:dict):
     try:
-        json.dump(CONFIG, open(PATH_CONFIG, "w"), indent=4)
+        write_cache(PATH_MANIFEST, json.dumps(manifest))
     except Exception as e:
-        print("make::error: failed to write config file.")
+        print("make::warning: failed to write manifest {}.".format(PATH_MANIFEST))
+
+def get_model_entry(manifest:dict, model:str):
+    modelObj = get_model(model)
+    file_stat = get_file_index().stat(join(get_settings().domain_model, model + '.cs'))
+    entry = manifest["models"].setdefault(model, {"outputs": {}})
+    entry["mtime"] = file_stat.st_mtime_ns
+    entry["size"] = file_stat.st_size
+    entry["hash"] = modelObj.source_hash
+    return entry
+
+def get_sync_paths(model:str):
+    # dtos, mapper and, when MODEL.OPTIONS shape it (a projection depends on Get{Model}Dto), the repository
+    # and the files the options add next to it.
+    options = get_settings().get_model_options(model)
+    paths = [path for path, _ in get_dto_files(model)] + [join(get_settings().application_mapper, f"{capitalize(model)}Mapper.cs")]
+    if  has_repository_options(model):
+        paths.append(get_repository_path(model))
+    if  options["FILTER_MAP"]:
+        paths.append(get_filter_map_path(model))
+    if  has_include_profiles(model):
+        paths.append(get_include_profiles_path(model))
+    if  options["CACHE"]:
+        paths.append(get_cached_service_path(model))
+    if  options["MODEL_MAPPER"]:
+        paths.append(get_model_mapper_path(model))
+    return paths
+
+def update_manifest(models:list):
+    """
+    Records the dtos and mappers written by --model/--all so a later --sync can tell them apart from files edited by hand.
+    """
+    if  len(_GENERATED_OUTPUTS) == 0:
+        return
+    manifest = load_manifest()
+    if  manifest["inputs"] is None:
+        manifest["inputs"] = get_sync_inputs()
+    # Under different inputs the next --sync re-renders every model anyway, the recorded hashes still mark ownership.
+
+    for model in models:
+        paths = get_sync_paths(model)
+        generated = [path for path in paths if path in _GENERATED_OUTPUTS]
+        if  len(generated) == 0:
+            continue
+        entry = get_model_entry(manifest, model)
+        for path in generated:
+            entry["outputs"][relpath(path, __install_path__)] = _GENERATED_OUTPUTS[path]
+    save_manifest(manifest)
+
+def sync_output(path:str, content:str, recorded_hash, pristine:str=None):
+    """
+    Writes a generated file unless it was edited by hand. Returns the hash to record for it (None when
+    the file is not owned by make.py) and whether the file was written.
+    pristine: what make.py writes without MODEL.OPTIONS, an untracked file still equal to it is taken over.
+    """
+    files = get_file_index()
+    content_hash = hash_text(content)
+    if  not files.exists(path):
+        make_directory(dirname(path))
+        write_output(path, content)
+        info("sync::info: created {}.".format(relpath(path, __install_path__)))
+        return content_hash, True
+
+    current_hash = hash_text(read_output(path).replace("\r\n", "\n"))
+
+    if  current_hash == content_hash:
+        return content_hash, False
+
+    if  recorded_hash is None and pristine is not None and current_hash == hash_text(pristine):
+        recorded_hash = current_hash
+
+    if  recorded_hash is None:
+        print("sync::warning: {} was not generated by make.py (skipped).".format(relpath(path, __install_path__)))
+        return None, False
+
+    if  current_hash != recorded_hash:
+        print("sync::warning: {} was edited by hand (skipped).".format(relpath(path, __install_path__)))
+        return recorded_hash, False
+
+    write_output(path, content)
+    info("sync::info: updated {}.".format(relpath(path, __install_path__)))
+    return content_hash, True
+
+def remove_output(path:str, recorded_hash):
+    """
+    Removes a file make.py no longer generates (a model mapper whose dtos now need AutoMapper), unless it was edited by hand.
+    Returns whether the file was removed.
+    """
+    files = get_file_index()
+    if  recorded_hash is None or not files.exists(path):
+        return False
+    if  hash_text(read_output(path).replace("\r\n", "\n")) != recorded_hash:
+        print("sync::warning: {} was edited by hand (kept).".format(relpath(path, __install_path__)))
+        return False
+    if  OUTPUT_MODE == "write":
+        remove(path)
+        files.refresh(dirname(path))
+    info("sync::info: removed {}.".format(relpath(path, __install_path__)))
+    return True
+
+def sync_project_output(manifest:dict, rendered):
+    """
+    Writes a generated file that is not generated per model (rendered: its (path, content), None to skip), with the
+    manifest's "outputs" telling generated files from edited ones. Returns (whether the manifest changed, whether the file was written).
+    """
+    if  rendered is None:
+        return False, False
+    path, content = rendered
+    key = relpath(path, __install_path__)
+    recorded = manifest.setdefault("outputs", {})
+    try:
+        content_hash, written = sync_output(path, content, recorded.get(key))
+    except Exception as e:
+        print("sync::error: failed to write {}.".format(path))
         exit(1)
+    if  content_hash == recorded.get(key):
+        return False, written
+    if  content_hash is None:
+        recorded.pop(key, None)
+    else:
+        recorded[key] = content_hash
+    return True, written
+
+def sync_models(models:list, manifest:dict=None):
+    """
+    Regenerates the dtos, mappers, model mappers, option-shaped repositories, filter maps, include profiles and cached services of MODEL.LIST whose model, template or config changed since the last run,
+    then the permissions and the json context, which are rendered on every run.
+    Models whose file has the recorded mtime and size are skipped without being read.
+    manifest: the manifest to update in place (--watch keeps it in memory), loaded from disk when None.
+    """
+    settings = get_settings()
+    files = get_file_index()
+    manifest = load_manifest() if manifest is None else manifest
+    inputs = get_sync_inputs()
+    inputs_changed = manifest["inputs"] != inputs
+    manifest["inputs"] = inputs
+
+    model_files = files.listdir(settings.domain_model)
+    injections = {}
+    dirty = inputs_changed
+    updated = 0
+    for model in models:
+        if  not ((model + '.cs') in model_files):
+            print("sync::warning: model {} not found at {} (skipped).".format(model + '.cs', settings.domain_model))
+            continue
+
+        entry = manifest["models"].get(model)
+        if  entry is not None and not inputs_changed:
+            file_stat = files.stat(join(settings.domain_model, model + '.cs'))
+            if  entry.get("mtime") == file_stat.st_mtime_ns and entry.get("size") == file_stat.st_size:
+                continue
+            if  entry.get("hash") == get_model(model).source_hash:
+                # Touched but unchanged.
+                get_model_entry(manifest, model)
+                dirty = True
+                continue
+
+        dirty = True
+        entry = get_model_entry(manifest, model)
+        outputs = entry["outputs"]
+        # Rendered one after the other, a projected repository reads the Get{Model}Dto written before it.
+        # (path, render, pristine content)
+        targets = [(path, lambda model=model, file=file: render_dto(model, file), None) for path, file in get_dto_files(model)]
+        MAPPER_PATH, mapper = render_mapper(model)
+        if  not files.exists(MAPPER_PATH):
+            # A recreated mapper has to be registered again, splice_regions skips it when it still is.
+            queue_injection(injections, settings.mapper_list_path, "AUTOMAPPER", get_mapper_injection(model))
+        targets.append((MAPPER_PATH, lambda mapper=mapper: mapper, None))
+        if  settings.get_model_options(model)["MODEL_MAPPER"]:
+            # Rendered after the dtos it reads, skipped when they need AutoMapper.
+            targets.append((get_model_mapper_path(model), lambda model=model: (render_model_mapper(model) or (None, None))[1], None))
+        if  has_repository_options(model):
+            pristine = render_template("REPOSITORY", {"repository-name": capitalize(model), "repository-usings": get_repository_usings(capitalize(model)), "repository-members": ""})
+            targets.append((get_repository_path(model), lambda model=model: render_repository(model)[1], pristine))
+        if  settings.get_model_options(model)["FILTER_MAP"]:
+            targets.append((get_filter_map_path(model), lambda model=model: render_filter_map(model)[1], None))
+        if  has_include_profiles(model):
+            targets.append((get_include_profiles_path(model), lambda model=model: render_include_profiles(model)[1], None))
+        if  settings.get_model_options(model)["CACHE"]:
+            if  not files.exists(get_cached_service_path(model)):
+                queue_injection(injections, settings.service_list_path, "CACHING", get_cached_service_injection(model))
+            targets.append((get_cached_service_path(model), lambda model=model: render_cached_service(model)[1], None))
+        try:
+            for path, render, pristine in targets:
+                content = render()
+                key = relpath(path, __install_path__)
+                if  content is None:
+                    updated += 1 if remove_output(path, outputs.pop(key, None)) else 0
+                    continue
+                content_hash, written = sync_output(path, content, outputs.get(key), pristine)
+                if  content_hash is None:
+                    outputs.pop(key, None)
+                else:
+                    outputs[key] = content_hash
+                updated += 1 if written else 0
+        except Exception as e:
+            print("sync::error: failed to write {} for model {}.".format(path, model))
+            exit(1)
+
+    changed, written = sync_project_output(manifest, render_permissions())
+    dirty = dirty or changed
+    updated += 1 if written else 0
+    if  settings.dto_json_context:
+        # Every model of MODEL.LIST, --watch only syncs the models that changed.
+        changed, written = sync_project_output(manifest, render_json_context(parse_model_list(",".join(settings.model_list))))
+        dirty = dirty or changed
+        updated += 1 if written else 0
+        if  written:
+            queue_injection(injections, settings.service_list_path, "JSON", get_json_context_injection())
+    if  len(injections) > 0:
+        write_injections(injections)
+    if  dirty:
+        save_manifest(manifest)
+    save_model_cache()
+    info("sync::info: {} file(s) written.".format(updated))
+
+###############################################
+# Permissions
+###############################################
+# The enums the seeders number roles and actions with, and the class of permission names generated from them.
+PERMISSION_ROLE_ENUM = "RoleEnum"
+PERMISSION_ACTION_ENUM = "RoleActionEnum"
+PERMISSION_CLASS = "Permission"
+
+def get_permission_paths():
+    constants = join(get_settings().domain, "Constant")
+    return join(constants, PERMISSION_ROLE_ENUM + '.cs'), join(constants, PERMISSION_ACTION_ENUM + '.cs'), join(constants, PERMISSION_CLASS + '.cs')
+
+def parse_enum(content:str, enum_name:str):
+    """
+    The (member, value, name) of an enum, the name being what its GetName extension returns for the member
+    (the member itself when it has no case). None when the enum is not found.
+    """
+    match = re.search(r"\benum\s+{}\s*(?::\s*\w+\s*)?\{{([^}}]*)\}}".format(enum_name), content)
+    if  match is None:
+        return None
+    names = dict(re.findall(r"case\s+{}\.(\w+)\s*:\s*return\s+\"([^\"]*)\"".format(enum_name), content))
+    members = []
+    value = -1
+    for entry in re.sub(r"//[^\n]*|/\*.*?\*/", "", match.group(1), flags=re.S).split(','):
+        entry = entry.strip()
+        if  len(entry) == 0:
+            continue
+        member, _, explicit = entry.partition('=')
+        member = member.strip()
+        value = int(explicit.strip(), 0) if explicit.strip() else value + 1
+        members.append((member, value, names.get(member, member)))
+    return members
+
+PERMISSION_TEMPLATE = """\
+namespace {namespace};
+
+/// <summary>
+/// The "Role:Action" permissions of CaslAttribute, one per {role_enum} and {action_enum} pair.
+/// Their bits are numbered at runtime from the Role and RoleAction rows, see PermissionIndex.
+/// </summary>
+public static class {name}
+{{
+{constants}
+}}
+"""
+
+def render_permissions():
+    """
+    The (path, content) of the Permission class, None when RoleEnum or RoleActionEnum is missing.
+    """
+    ROLE_PATH, ACTION_PATH, PERMISSION_PATH = get_permission_paths()
+    files = get_file_index()
+    if  not files.exists(ROLE_PATH) or not files.exists(ACTION_PATH):
+        return None
+    roles = parse_enum(read_output(ROLE_PATH), PERMISSION_ROLE_ENUM)
+    actions = parse_enum(read_output(ACTION_PATH), PERMISSION_ACTION_ENUM)
+    if  roles is None or actions is None:
+        print("make::warning: enum {} or {} not found, permissions skipped.".format(PERMISSION_ROLE_ENUM, PERMISSION_ACTION_ENUM))
+        return None
+
+    constants = []
+    for _, _, role in roles:
+        for _, _, action in actions:
+            constant = re.sub(r"\W", "", capitalize(role) + capitalize(action))
+            constants.append("    public const string {} = \"{}:{}\";".format(constant, role, action))
+    return (PERMISSION_PATH, PERMISSION_TEMPLATE.format(
+        namespace=get_name_space_from_root(dirname(PERMISSION_PATH)),
+        role_enum=PERMISSION_ROLE_ENUM, action_enum=PERMISSION_ACTION_ENUM, name=PERMISSION_CLASS,
+        constants="\n".join(constants)))
+
+def make_permissions():
+    """
+    Brings the Permission class up to date with RoleEnum and RoleActionEnum.
+    """
+    manifest = load_manifest()
+    changed, _ = sync_project_output(manifest, render_permissions())
+    if  changed:
+        save_manifest(manifest)
 
-elif args.patch:
-    models = list(map(lambda cs_file: basename(str(cs_file)).replace('.cs', ''), filter(lambda f: isfile(join(PATH_DOMAIN_MODEL, str(f))) and str(f).endswith('.cs'), listdir(PATH_DOMAIN_MODEL))))
-    CONFIG["MODEL"]["LIST"] = models
+###############################################
+# Watch mode (--watch)
+###############################################
+# inotify(7) event masks.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_CLOEXEC = 0o2000000
+
+# Default quiet period (ms) after the last event before a burst of saves is regenerated.
+WATCH_DEBOUNCE_MS = 200
+# Interval (ms) between directory scans when inotify is not available.
+WATCH_POLL_INTERVAL_MS = 500
+
+class InotifyWatcher:
+    """
+    Watches the direct children of a directory through inotify, loaded with ctypes (Linux only).
+    """
+    def __init__(self, directory:str):
+        import ctypes
+        self.libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_CLOEXEC)
+        if  self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if  self.libc.inotify_add_watch(self.fd, directory.encode(), mask) < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout):
+        """
+        Blocks up to timeout seconds (forever when None). Returns the changed file names, None on queue overflow.
+        """
+        import select
+        import struct
+        from os import read
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if  len(ready) == 0:
+            return set()
+
+        names = set()
+        buffer = read(self.fd, 64 * 1024)
+        offset = 0
+        # struct inotify_event { int wd; uint32_t mask, cookie, len; char name[len]; }
+        while offset < len(buffer):
+            _, mask, _, length = struct.unpack_from("iIII", buffer, offset)
+            offset += 16
+            if  mask & IN_Q_OVERFLOW:
+                return None
+            names.add(buffer[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace"))
+            offset += length
+        return names
+
+    def close(self):
+        from os import close
+        close(self.fd)
+
+class PollingWatcher:
+    """
+    Watches the direct children of a directory by comparing (mtime, size) snapshots taken with scandir.
+    """
+    def __init__(self, directory:str, interval:float):
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        with scandir(self.directory) as iterator:
+            for entry in iterator:
+                if  entry.is_file():
+                    entry_stat = entry.stat()
+                    snapshot[entry.name] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        from time import sleep
+        sleep(self.interval if timeout is None else min(self.interval, timeout))
+        snapshot = self.scan()
+        names = set(name for name in snapshot.keys() | self.snapshot.keys() if snapshot.get(name) != self.snapshot.get(name))
+        self.snapshot = snapshot
+        return names
+
+    def close(self):
+        pass
+
+def open_watcher(directory:str, poll:bool):
+    if  not poll and sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(directory)
+            info("watch::info: watching {} (inotify).".format(directory))
+            return watcher
+        except Exception as e:
+            print("watch::warning: inotify is not available ({}), falling back to polling.".format(e))
+    info("watch::info: watching {} (polling every {} ms).".format(directory, WATCH_POLL_INTERVAL_MS))
+    return PollingWatcher(directory, WATCH_POLL_INTERVAL_MS / 1000)
+
+def watch_models(debounce:float, poll:bool=False):
+    """
+    Keeps the dtos and mappers of MODEL.LIST in sync with DOMAIN/Model until interrupted.
+    Settings, parsed models, the file index and the manifest stay in memory, so a burst of saves
+    costs one re-parse of each changed model.
+    """
+    from time import monotonic
+    settings = get_settings()
+    models = parse_model_list(",".join(settings.model_list))
+    manifest = load_manifest()
+    sync_models(models, manifest)
+
+    watcher = open_watcher(settings.domain_model, poll)
+    pending = set()
+    deadline = None
     try:
-        json.dump(CONFIG, open(PATH_CONFIG, "w"), indent=4)
-        print("make::info: done.")
-    except Exception as e:
-        print("make::error: failed to write config file.")
+        while True:
+            names = watcher.wait(None if deadline is None else max(0, deadline - monotonic()))
+            if  names is None:
+                # Events were dropped, every model has to be checked.
+                names = set(model + '.cs' for model in models)
+            if  len(names) > 0:
+                pending |= names
+                deadline = monotonic() + debounce
+                continue
+            if  deadline is None or monotonic() < deadline:
+                continue
+
+            changed = [model for model in models if (model + '.cs') in pending]
+            pending = set()
+            deadline = None
+            if  len(changed) == 0:
+                continue
+
+            get_file_index().refresh(settings.domain_model)
+            for model in changed:
+                _PARSED_MODELS.pop(model, None)
+            info("watch::info: {} changed.".format(", ".join(changed)))
+            sync_models(changed, manifest)
+    except KeyboardInterrupt:
+        info("watch::info: stopped.")
+    finally:
+        watcher.close()
+
+def build_parser():
+    argparse = ArgumentParser(description="A simple script to generate controller, service, dto, and mapper classes for a given model.")
+    argparse.add_argument("-m", '--model', metavar='\b', type=str, help="Generate controller, service, dto, and mapper (comma separated for multiple models, e.g. A,B,C).")
+    argparse.add_argument("-a", '--all', action='store_true', help="Generate controller, service, dto, and mapper for every model in MODEL.LIST.")
+    argparse.add_argument("-p", '--patch', action='store_true', help="Update model list inside config file.")
+    argparse.add_argument("-s", '--sync', action='store_true', help="Regenerate the dto, mapper and MODEL.OPTIONS repository of every model in MODEL.LIST whose inputs changed, files edited by hand are left untouched.")
+    argparse.add_argument("-w", '--watch', action='store_true', help="Watch the model folder and regenerate the dto and mapper of a model in MODEL.LIST when it changes (Ctrl+C to stop).")
+    argparse.add_argument('--debounce', metavar='\b', type=int, default=WATCH_DEBOUNCE_MS, help="Milliseconds --watch waits after the last change before regenerating (default: {}).".format(WATCH_DEBOUNCE_MS))
+    argparse.add_argument('--poll', action='store_true', help="Make --watch poll the model folder instead of using inotify.")
+    argparse.add_argument("-j", '--jobs', metavar='\b', type=int, default=1, help="Number of workers used to generate model files (default: 1).")
+    argparse.add_argument("-n", '--dry-run', action='store_true', help="Report the files that would be created or updated without writing anything.")
+    argparse.add_argument("-d", '--diff', action='store_true', help="Like --dry-run, but print a unified diff of every would-be change.")
+    argparse.add_argument("-t", '--timings', nargs='?', const='table', choices=['table', 'json'], help="Print wall time, files and bytes read/written and cache hits per phase, as a table (default) or json.")
+    argparse.add_argument('--profile', metavar='\b', nargs='?', const=join(PATH_CACHE, "make.prof"), help="Run under cProfile, dump the stats (default: .make/make.prof) and print the slowest calls.")
+    argparse.add_argument("-q", '--quiet', action='store_true', help="Only print warnings and errors.")
+    return argparse
+
+def prepare():
+    # Config, path validation and the info banner are only needed by commands that touch the project.
+    with Phase("config"):
+        get_settings()
+    with Phase("paths"):
+        check_paths()
+    print_make_info()
+
+def main(argv=None):
+    global QUIET, OUTPUT_MODE
+    argparse = build_parser()
+    args = argparse.parse_args(argv)
+    QUIET = args.quiet
+    OUTPUT_MODE = "diff" if args.diff else "dry-run" if args.dry_run else "write"
+
+    if  args.jobs < 1:
+        print("make::error: --jobs must be at least 1.")
         exit(1)
-else:
-    argparse.print_help()
+
+    if  args.timings:
+        enable_timings()
+
+    if  args.profile:
+        import cProfile
+        import pstats
+        profile = cProfile.Profile()
+        try:
+            with Phase("total"):
+                profile.runcall(run_command, argparse, args)
+        finally:
+            try:
+                if  not isdir(dirname(abspath(args.profile))):
+                    mkdir(dirname(abspath(args.profile)))
+                profile.dump_stats(args.profile)
+                info("make::info: profile written to {}.".format(args.profile))
+            except Exception as e:
+                print("make::warning: failed to write profile {}.".format(args.profile))
+            pstats.Stats(profile).sort_stats("cumulative").print_stats(25)
+    else:
+        with Phase("total"):
+            run_command(argparse, args)
+
+    if  args.timings:
+        print_timings(args.timings)
+
+def run_command(argparse, args):
+    if  args.model:
+        prepare()
+        make_models(parse_model_list(args.model), args.jobs)
+
+    elif args.all:
+        prepare()
+        make_models(parse_model_list(",".join(get_settings().model_list)), args.jobs)
+
+    elif args.sync:
+        prepare()
+        with Phase("sync"):
+            sync_models(parse_model_list(",".join(get_settings().model_list)))
+
+    elif args.watch:
+        prepare()
+        watch_models(max(0, args.debounce) / 1000, args.poll)
+
+    elif args.patch:
+        prepare()
+        with Phase("patch"):
+            files = get_file_index()
+            models = list(map(lambda cs_file: basename(str(cs_file)).replace('.cs', ''), filter(lambda f: files.isfile(join(get_settings().domain_model, str(f))) and str(f).endswith('.cs'), files.listdir(get_settings().domain_model))))
+        get_config()["MODEL"]["LIST"] = models
+        write_config()
+        info("make::info: done.")
+    else:
+        argparse.print_help()
+
+if  __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import sys
+from os.path import dirname, abspath
+
+import pytest
+
+# make.py and bench.py live next to this folder, not in a package.
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+import bench
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """
+    A throwaway copy of the solution tree, as bench.py runs make.py against.
+    """
+    bench.copy_tree(str(tmp_path))
+    return tmp_path
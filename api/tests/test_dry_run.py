@@ -0,0 +1,42 @@
+import sys
+import hashlib
+import subprocess
+from os import walk
+from os.path import join
+
+import pytest
+
+MODEL = """\
+namespace DOMAIN.Model;
+
+public class Thing
+{
+    public long Id { get; set; }
+    public string Name { get; set; }
+}
+"""
+
+
+def digest(root):
+    files = {}
+    for folder, _, names in walk(root):
+        for name in names:
+            if  "__pycache__" not in folder:
+                with open(join(folder, name), "rb") as f:
+                    files[join(folder, name)] = hashlib.sha1(f.read()).hexdigest()
+    return files
+
+
+@pytest.mark.parametrize("args", [["-m", "Thing", "--dry-run"], ["-m", "Thing", "--diff"], ["--all", "--dry-run"], ["--sync", "--diff"]])
+def test_dry_run_leaves_tree_unchanged(tree, args):
+    (tree / "DOMAIN" / "Model" / "Thing.cs").write_text(MODEL)
+    before = digest(tree)
+    subprocess.run([sys.executable, "make.py", *args], cwd=tree, stdout=subprocess.DEVNULL, check=True)
+    assert digest(tree) == before
+
+
+def test_write_records_state(tree):
+    (tree / "DOMAIN" / "Model" / "Thing.cs").write_text(MODEL)
+    subprocess.run([sys.executable, "make.py", "-m", "Thing"], cwd=tree, stdout=subprocess.DEVNULL, check=True)
+    assert (tree / ".make" / "settings.json").exists()
+    assert (tree / ".make" / "manifest.json").exists()
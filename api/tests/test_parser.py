@@ -0,0 +1,69 @@
+from os.path import join
+
+import pytest
+
+import make
+
+
+def parse(model):
+    with open(join(make.__install_path__, "DOMAIN", "Model", model + ".cs"), encoding="utf-8") as f:
+        return make.parse_model_class(f.read(), model)
+
+
+def members(model_class):
+    return [(prop.name, prop.type) for prop in model_class.properties]
+
+
+@pytest.mark.parametrize("model", ["Role", "RoleAction"])
+def test_parses_a_plain_model(model):
+    parsed = parse(model)
+    assert parsed.name == model
+    assert parsed.base_types == []
+    assert (parsed.key_name, parsed.key_type) == ("Id", "long")
+    assert members(parsed) == [("Id", "long"), ("Name", "string")]
+
+
+def test_parses_a_derived_model():
+    # The key of User is inherited from IdentityUser, after a BOM, a comment block and usings.
+    parsed = parse("User")
+    assert parsed.base_types == ["IdentityUser"]
+    assert (parsed.key_name, parsed.key_type) == ("Id", "string")
+    assert members(parsed) == [("FirstName", "string"), ("LastName", "string"), ("Address", "string"), ("BirthDate", "DateTime")]
+
+
+def test_parses_navigations():
+    parsed = parse("UserXAccess")
+    assert members(parsed) == [
+        ("Id", "long"),
+        ("UserId", "string"), ("User", "User"),
+        ("RoleId", "long"), ("Role", "Role"),
+        ("RoleActionId", "long"), ("RoleAction", "RoleAction"),
+    ]
+    assert all(prop.has_setter and not prop.is_collection for prop in parsed.properties)
+
+
+def test_parses_attributes_nullables_and_collections():
+    parsed = make.parse_model_class("""\
+namespace DOMAIN.Model;
+
+[Table("things")]
+public class Thing : BaseEntity
+{
+    [Key, MaxLength(50)]
+    public string Code { get; set; } = "{ not a brace }";
+    // comment with }
+    public int? Count { get; set; }
+    public List<Role> Roles { get; set; }
+    public string Display => Code;
+    public int Total { get; }
+}
+""", "Thing")
+    assert parsed.attributes == ['Table("things")']
+    assert parsed.base_types == ["BaseEntity"]
+    code, count, roles = parsed.properties[:3]
+    assert (code.name, code.attributes, code.is_key) == ("Code", ["Key", "MaxLength(50)"], True)
+    assert (count.type, count.nullable) == ("int", True)
+    assert (roles.is_collection, roles.element_type) == (True, "Role")
+    # Expression bodied members are not properties, get-only ones are read as not settable.
+    assert parsed.get_property("Display") is None
+    assert not parsed.get_property("Total").has_setter
@@ -0,0 +1,57 @@
+import pytest
+
+import make
+
+INJECTOR = """\
+public class Injector
+{
+    public static void Inject(IServiceCollection services)
+    {
+        #region SERVICES
+            services.AddScoped<IUserService, UserService>();
+        #endregion
+
+        #region CACHING
+        #endregion
+    }
+}
+"""
+
+
+def test_adds_lines_with_the_region_indentation():
+    content, added = make.splice_regions(INJECTOR, {"SERVICES": ["services.AddScoped<IRoleService, RoleService>(); /* added by make.py */"]})
+    assert added == 1
+    assert "            services.AddScoped<IUserService, UserService>();\n" \
+           "            services.AddScoped<IRoleService, RoleService>(); /* added by make.py */\n" \
+           "        #endregion" in content
+
+
+def test_skips_lines_already_in_the_region():
+    # Whitespace and the make.py marker do not make a registration new.
+    content, added = make.splice_regions(INJECTOR, {"SERVICES": [
+        "services.AddScoped<IUserService,UserService>(); /* added by make.py */",
+        "services.AddScoped<IRoleService, RoleService>();",
+        "services.AddScoped<IRoleService, RoleService>();",
+    ]})
+    assert added == 1
+    assert content.count("IRoleService") == 1
+    assert content.count("IUserService") == 1
+
+
+def test_fills_several_regions_in_one_pass():
+    content, added = make.splice_regions(INJECTOR, {"SERVICES": ["a();"], "CACHING": ["b();"]})
+    assert added == 2
+    assert content.index("a();") < content.index("b();")
+
+
+def test_keeps_crlf_newlines():
+    content, _ = make.splice_regions(INJECTOR.replace("\n", "\r\n"), {"CACHING": ["b();"]})
+    assert "b();\r\n" in content
+    assert "\n" not in content.replace("\r\n", "")
+
+
+def test_exits_on_a_missing_region(capsys):
+    with pytest.raises(SystemExit) as exited:
+        make.splice_regions(INJECTOR, {"REPOSITORIES": ["a();"]})
+    assert exited.value.code == 1
+    assert "REPOSITORIES region not found" in capsys.readouterr().out
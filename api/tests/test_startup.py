@@ -0,0 +1,32 @@
+import sys
+import subprocess
+from os import walk
+from os.path import join, getmtime
+
+import pytest
+
+import bench
+
+
+def snapshot(root):
+    files = {}
+    for folder, _, names in walk(root):
+        for name in names:
+            path = join(folder, name)
+            files[path] = getmtime(path)
+    return files
+
+
+def test_import_writes_nothing(tree):
+    before = snapshot(tree)
+    subprocess.run([sys.executable, "-c", "import make"], cwd=tree, check=True)
+    after = snapshot(tree)
+    # The interpreter's own bytecode cache is not make.py's doing.
+    assert {path: mtime for path, mtime in after.items() if "__pycache__" not in path} == before
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--all", "--quiet"]])
+def test_startup_within_budget(tree, args):
+    # The fastest of several runs, a shared test machine only ever adds time.
+    fastest = min(bench.time_command(str(tree), args, 1) for _ in range(20))
+    assert fastest <= bench.STARTUP_BUDGET_MS, "{} took {:.2f} ms (budget {} ms)".format(" ".join(args), fastest, bench.STARTUP_BUDGET_MS)
@@ -0,0 +1,74 @@
+import sys
+import subprocess
+from os.path import join
+
+MODEL = """\
+namespace DOMAIN.Model;
+
+public class Thing
+{
+    public long Id { get; set; }
+    public string Name { get; set; }
+}
+"""
+
+
+def make(tree, *args):
+    return subprocess.run([sys.executable, "make.py", *args], cwd=tree, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, check=True).stdout
+
+
+def test_sync_keeps_files_edited_by_hand(tree):
+    model = tree / "DOMAIN" / "Model" / "Thing.cs"
+    model.write_text(MODEL)
+    make(tree, "-m", "Thing", "--quiet")
+
+    edited = tree / "APPLICATION" / "Dto" / "Thing" / "GetThingDto.cs"
+    generated = tree / "APPLICATION" / "Dto" / "Thing" / "ThingDto.cs"
+    edited.write_text(edited.read_text() + "// edited by hand\n")
+    model.write_text(MODEL.replace("    public string Name { get; set; }\n", "    public string Name { get; set; }\n    public int Count { get; set; }\n"))
+
+    printed = make(tree, "--sync")
+
+    assert "{} was edited by hand (skipped)".format(join("APPLICATION", "Dto", "Thing", "GetThingDto.cs")) in printed
+    assert edited.read_text().endswith("// edited by hand\n")
+    assert "Count" not in edited.read_text()
+    assert "updated {}".format(join("APPLICATION", "Dto", "Thing", "ThingDto.cs")) in printed
+    assert "public int Count" in generated.read_text()
+
+
+def test_sync_without_changes_writes_nothing(tree):
+    (tree / "DOMAIN" / "Model" / "Thing.cs").write_text(MODEL)
+    make(tree, "-m", "Thing", "--quiet")
+    make(tree, "--sync")
+
+    assert "0 file(s) written" in make(tree, "--sync")
+
+
+def test_sync_of_the_checked_in_tree_writes_nothing(tree):
+    repositories = tree / "INFRASTRUCTURE" / "Repository"
+    before = {path.name: path.read_text() for path in repositories.iterdir()}
+
+    printed = make(tree, "--sync")
+
+    # The repositories match what make.py renders, so none of them reads as edited by hand.
+    assert "0 file(s) written" in printed
+    assert not [line for line in printed.splitlines() if line.startswith("sync::warning") and join("INFRASTRUCTURE", "Repository") in line]
+    assert {path.name: path.read_text() for path in repositories.iterdir()} == before
+
+
+def test_watch_keeps_every_model_in_the_json_context(tree):
+    # The context is owned by make.py once it created it.
+    context = tree / "APPLICATION" / "Dto" / "AppJsonContext.cs"
+    context.unlink()
+    make(tree, "--sync")
+    before = context.read_text()
+
+    # --watch syncs only the models that changed.
+    role = tree / "DOMAIN" / "Model" / "Role.cs"
+    role.write_text(role.read_text().replace("    public string Name { get; set; }\n", "    public string Name { get; set; }\n    public int Rank { get; set; }\n"))
+    subprocess.run([sys.executable, "-c", "import make; make.sync_models(['Role'])"], cwd=tree, stdout=subprocess.DEVNULL, check=True)
+
+    after = context.read_text()
+    for dto in ("GetUserDto", "GetRoleDto", "GetRoleActionDto", "GetUserXAccessDto"):
+        assert dto in before
+        assert dto in after
@@ -0,0 +1,15 @@
+import sys
+import json
+import subprocess
+
+import pytest
+
+
+@pytest.mark.parametrize("args", [[], ["--profile", ".make/make.prof"]])
+def test_total_is_timed(tree, args):
+    result = subprocess.run([sys.executable, "make.py", "--all", "--quiet", "--timings", "json", *args],
+                            cwd=tree, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+    # The json table is printed last, after the --profile stats.
+    timings = json.loads(result.stdout[result.stdout.rindex("\n{\n") if "\n{\n" in result.stdout else 0:])
+    assert timings["total"]["calls"] == 1
+    assert timings["total"]["time"] >= timings["config"]["time"]
@@ -0,0 +1,68 @@
+import pytest
+
+import make
+
+
+@pytest.fixture
+def output(tmp_path, monkeypatch):
+    # write_output answers existence from the run's file index, here one over the temporary folder.
+    monkeypatch.setattr(make, "_FILE_INDEX", make.FileIndex([str(tmp_path)]))
+    monkeypatch.setattr(make, "OUTPUT_MODE", "write")
+    return tmp_path
+
+
+def existing(path, content:bytes):
+    # A file on disk before the run, the index lists the folder again as a new run would.
+    path.write_bytes(content)
+    make.get_file_index().refresh(str(path.parent))
+    return path
+
+
+def test_writes_a_new_file(output):
+    path = output / "Thing.cs"
+    assert make.write_output(str(path), "class Thing {}\n")
+    assert path.read_text() == "class Thing {}\n"
+
+
+def test_keeps_an_unchanged_file(output):
+    path = existing(output / "Thing.cs", b"class Thing {}\r\n")
+    mtime = path.stat().st_mtime_ns
+    # Content is compared with the newlines of the file on disk.
+    assert not make.write_output(str(path), "class Thing {}\n")
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_updates_with_the_newlines_on_disk(output):
+    path = existing(output / "Thing.cs", b"class Thing {}\r\n")
+    assert make.write_output(str(path), "class Thing\n{\n}\n", backup=True)
+    assert path.read_bytes() == b"class Thing\r\n{\r\n}\r\n"
+    assert (output / "Thing.cs.bak").read_bytes() == b"class Thing {}\r\n"
+    assert [item.name for item in output.iterdir() if item.name.endswith(".tmp")] == []
+
+
+@pytest.mark.parametrize("mode", ["dry-run", "diff"])
+def test_only_reports_outside_write_mode(output, monkeypatch, capsys, mode):
+    monkeypatch.setattr(make, "OUTPUT_MODE", mode)
+    created = output / "New.cs"
+    updated = existing(output / "Thing.cs", b"class Thing {}\n")
+
+    assert make.write_output(str(created), "class New {}\n")
+    assert make.write_output(str(updated), "class Thing { int Id; }\n", backup=True)
+    assert not created.exists()
+    assert updated.read_text() == "class Thing {}\n"
+    assert not (output / "Thing.cs.bak").exists()
+
+    printed = capsys.readouterr().out
+    if  mode == "diff":
+        assert "+class New {}" in printed
+        assert "-class Thing {}" in printed and "+class Thing { int Id; }" in printed
+    else:
+        assert "would create" in printed and "New.cs" in printed
+        assert "would update" in printed and "Thing.cs" in printed
+
+
+def test_reports_nothing_for_an_unchanged_file(output, monkeypatch, capsys):
+    monkeypatch.setattr(make, "OUTPUT_MODE", "diff")
+    path = existing(output / "Thing.cs", b"class Thing {}\n")
+    assert not make.write_output(str(path), "class Thing {}\n")
+    assert capsys.readouterr().out == ""